@@ -16,6 +16,7 @@ import logging
 import os
 import sys
 
+from PyQt6.QtGui import QPixmapCache
 from PyQt6.QtWidgets import QApplication
 
 from ereader.views.main_window import MainWindow
@@ -43,6 +44,9 @@ def main() -> int:
     app.setApplicationName("E-Reader")
     app.setOrganizationName("E-Reader")
 
+    # Scaled library covers live in QPixmapCache; 20 MB holds ~170 of them
+    QPixmapCache.setCacheLimit(20480)
+
     # Initialize library database (Phase 1 library)
     try:
         from ereader.controllers.library_controller import LibraryController
@@ -400,6 +400,8 @@ class LibraryController(QObject):
                 try:
                     file_path = Path(book.file_path)
                     if file_path.exists():
+                        # Drop pooled cover-extraction handles first
+                        CoverExtractor.release(file_path)
                         file_path.unlink()
                         file_deleted = True
                         logger.info("Deleted file: %s", file_path)
@@ -465,7 +467,9 @@ class LibraryController(QObject):
             logger.exception(error_msg)
             self.error_occurred.emit("Update Error", error_msg)
 
-    def _save_cover(self, book_id: int, cover_bytes: bytes, extension: str) -> str | None:
+    def _save_cover(
+        self, book_id: int, cover_bytes: bytes | bytearray, extension: str
+    ) -> str | None:
         """Save cover image to cache directory.
 
         Creates ~/.ereader/covers/ directory if it doesn't exist and saves
@@ -13,7 +13,7 @@ from ereader.exceptions import EReaderError
 from ereader.models.epub import EPUBBook
 from ereader.models.reading_position import NavigationMode, ReadingPosition
 from ereader.utils.async_loader import AsyncChapterLoader
-from ereader.utils.cache_manager import CacheManager
+from ereader.utils.cache_manager import CacheManager, MemoryPressureLevel
 from ereader.utils.pagination_engine import PaginationEngine
 from ereader.utils.settings import ReaderSettings
 
@@ -81,6 +81,7 @@ class ReaderController(QObject):
             raw_maxsize=20,
             image_max_memory_mb=50,
             total_memory_threshold_mb=150,
+            enable_disk_l2=True,
         )
 
         # Track current async loader (for cancellation)
@@ -405,8 +406,14 @@ class ReaderController(QObject):
             # Log cache statistics
             self._cache_manager.log_stats()
 
-            # Check memory usage
+            # Check memory usage and shed cache entries under pressure
             self._cache_manager.check_memory_threshold()
+            pressure = self._cache_manager.get_memory_pressure()
+            if pressure is not MemoryPressureLevel.NORMAL:
+                self._cache_manager.on_memory_pressure(
+                    pressure,
+                    keep_key=f"{self._book.filepath}:{self._current_chapter_index}",
+                )
 
     def _on_loader_error(self, title: str, message: str) -> None:
         """Handle error_occurred signal from AsyncChapterLoader.
@@ -456,7 +463,8 @@ class ReaderController(QObject):
         Args:
             percentage: Scroll position from 0-100.
         """
-        logger.debug("Scroll position changed: %.1f%%", percentage)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Scroll position changed: %.1f%%", percentage)
         self._current_scroll_percentage = percentage
         self._emit_progress_update()
 
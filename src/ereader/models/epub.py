@@ -221,13 +221,18 @@ class EPUBBook:
                 opf_data = zf.read(opf_path)
                 opf_root = ET.fromstring(opf_data)
 
+                # The OPF namespace is fixed per document: resolve it once from
+                # the root tag and match exact tags instead of {*} wildcards
+                root_tag = opf_root.tag
+                ns = root_tag[: root_tag.index("}") + 1] if root_tag[:1] == "{" else ""
+
                 # Parse manifest - maps item ID to file href
-                manifest_elem = opf_root.find(".//{*}manifest")
+                manifest_elem = opf_root.find(f".//{ns}manifest")
                 if manifest_elem is None:
                     logger.error("Missing manifest element in OPF")
                     raise CorruptedEPUBError("Missing required manifest element in OPF")
 
-                for item in manifest_elem.findall(".//{*}item"):
+                for item in manifest_elem.findall(f".//{ns}item"):
                     item_id = item.get("id")
                     href = item.get("href")
                     if item_id and href:
@@ -244,12 +249,12 @@ class EPUBBook:
                 logger.debug("Parsed %d items in manifest", len(self._manifest))
 
                 # Parse spine - ordered list of item IDs for reading order
-                spine_elem = opf_root.find(".//{*}spine")
+                spine_elem = opf_root.find(f".//{ns}spine")
                 if spine_elem is None:
                     logger.error("Missing spine element in OPF")
                     raise CorruptedEPUBError("Missing required spine element in OPF")
 
-                for itemref in spine_elem.findall(".//{*}itemref"):
+                for itemref in spine_elem.findall(f".//{ns}itemref"):
                     idref = itemref.get("idref")
                     if idref:
                         if idref in self._manifest:
@@ -381,34 +386,21 @@ class EPUBBook:
                 f"Chapter file {full_path} not found in EPUB (referenced by item {item_id})"
             ) from None
 
-    def get_resource(self, resource_href: str, relative_to: str | None = None) -> bytes:
-        """Get a resource (image, CSS, font, etc.) from the EPUB by its href.
+    def resolve_resource_path(self, resource_href: str, relative_to: str | None = None) -> str:
+        """Resolve a resource href to its normalized path within the EPUB archive.
 
-        Resources in EPUB HTML content use relative paths (e.g., "images/cover.jpg").
-        This method resolves the path and extracts the resource from the EPUB ZIP archive.
+        Two hrefs that refer to the same file (e.g. "../images/a.jpg" from
+        different chapters) resolve to the same path, so the result can be
+        used as a cache key.
 
         Args:
             resource_href: Relative href of the resource as referenced in HTML/XHTML content.
-                          Examples: "images/cover.jpg", "../images/photo.jpg"
-            relative_to: Optional path to resolve the resource relative to.
-                        This should be the href of the content document (e.g., "text/chapter1.html").
+            relative_to: Optional href of the referencing content document.
                         If None, resolves relative to the OPF file location.
 
         Returns:
-            Raw bytes of the resource file.
-
-        Raises:
-            CorruptedEPUBError: If the resource file is not found in the EPUB.
-
-        Example:
-            >>> book = EPUBBook("book.epub")
-            >>> # Resource from OPF manifest
-            >>> image_data = book.get_resource("images/cover.jpg")
-            >>> # Resource from chapter HTML (relative to chapter)
-            >>> image_data = book.get_resource("../images/photo.jpg", relative_to="text/chapter1.html")
+            Normalized archive path of the resource (e.g. "OEBPS/images/a.jpg").
         """
-        logger.debug("Retrieving resource: %s (relative_to: %s)", resource_href, relative_to)
-
         # Determine the base directory for path resolution
         if relative_to:
             # Resolve relative to the content document directory
@@ -437,7 +429,37 @@ class EPUBBook:
 
         # Normalize path to resolve any ../ references
         # Using posixpath since EPUB paths always use forward slashes
-        full_path = posixpath.normpath(full_path)
+        return posixpath.normpath(full_path)
+
+    def get_resource(self, resource_href: str, relative_to: str | None = None) -> bytes:
+        """Get a resource (image, CSS, font, etc.) from the EPUB by its href.
+
+        Resources in EPUB HTML content use relative paths (e.g., "images/cover.jpg").
+        This method resolves the path and extracts the resource from the EPUB ZIP archive.
+
+        Args:
+            resource_href: Relative href of the resource as referenced in HTML/XHTML content.
+                          Examples: "images/cover.jpg", "../images/photo.jpg"
+            relative_to: Optional path to resolve the resource relative to.
+                        This should be the href of the content document (e.g., "text/chapter1.html").
+                        If None, resolves relative to the OPF file location.
+
+        Returns:
+            Raw bytes of the resource file.
+
+        Raises:
+            CorruptedEPUBError: If the resource file is not found in the EPUB.
+
+        Example:
+            >>> book = EPUBBook("book.epub")
+            >>> # Resource from OPF manifest
+            >>> image_data = book.get_resource("images/cover.jpg")
+            >>> # Resource from chapter HTML (relative to chapter)
+            >>> image_data = book.get_resource("../images/photo.jpg", relative_to="text/chapter1.html")
+        """
+        logger.debug("Retrieving resource: %s (relative_to: %s)", resource_href, relative_to)
+
+        full_path = self.resolve_resource_path(resource_href, relative_to)
 
         logger.debug("Resolved resource path in EPUB: %s", full_path)
 
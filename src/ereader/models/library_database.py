@@ -7,6 +7,7 @@ database concerns from business logic.
 
 import logging
 import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -37,9 +38,27 @@ class LibraryRepository:
 
     Attributes:
         CURRENT_SCHEMA_VERSION: Current database schema version (for migrations).
+        MMAP_SIZE_BYTES: Upper bound for SQLite's memory-mapped I/O region.
     """
 
     CURRENT_SCHEMA_VERSION = 2
+    MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+    # Whitelist of columns update_book may set, to prevent SQL injection
+    _UPDATABLE_COLUMNS = frozenset(
+        {
+            "title",
+            "author",
+            "file_path",
+            "cover_path",
+            "last_opened_date",
+            "reading_progress",
+            "current_chapter_index",
+            "scroll_position",
+            "status",
+            "file_size",
+        }
+    )
 
     def __init__(self, db_path: Path | str) -> None:
         """Initialize repository with database file path.
@@ -56,6 +75,7 @@ class LibraryRepository:
         logger.debug("Initializing LibraryRepository with db_path: %s", db_path)
 
         self._db_path = Path(db_path) if db_path != ":memory:" else ":memory:"
+        self._books_version = 0  # Bumped by every write to the books table
 
         try:
             # Open database connection
@@ -65,6 +85,10 @@ class LibraryRepository:
             # Enable foreign key constraints (required for CASCADE)
             self._conn.execute("PRAGMA foreign_keys = ON")
 
+            # Memory-map the database file so page reads (library loads,
+            # searches, filters) are served without read syscalls
+            self._conn.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE_BYTES}")
+
             logger.debug("Database connection established")
 
             # Ensure schema exists and is up-to-date
@@ -77,6 +101,14 @@ class LibraryRepository:
             logger.error(error_msg)
             raise DatabaseError(error_msg) from e
 
+    @property
+    def books_version(self) -> int:
+        """Counter incremented on every write to the books table.
+
+        Lets callers cache query results and detect when they are stale.
+        """
+        return self._books_version
+
     def close(self) -> None:
         """Close the database connection.
 
@@ -359,6 +391,7 @@ class LibraryRepository:
             )
 
             self._conn.commit()
+            self._books_version += 1
             book_id = cursor.lastrowid
 
             logger.info("Book added successfully with ID %d: %s", book_id, metadata.title)
@@ -458,22 +491,8 @@ class LibraryRepository:
             logger.debug("No fields to update for book %d", book_id)
             return
 
-        # Whitelist of allowed columns to prevent SQL injection
-        allowed_columns = {
-            "title",
-            "author",
-            "file_path",
-            "cover_path",
-            "last_opened_date",
-            "reading_progress",
-            "current_chapter_index",
-            "scroll_position",
-            "status",
-            "file_size",
-        }
-
         # Validate all column names
-        invalid_columns = set(kwargs.keys()) - allowed_columns
+        invalid_columns = kwargs.keys() - self._UPDATABLE_COLUMNS
         if invalid_columns:
             error_msg = f"Invalid column names: {invalid_columns}"
             logger.error(error_msg)
@@ -495,6 +514,7 @@ class LibraryRepository:
             )
 
             self._conn.commit()
+            self._books_version += 1
 
             if cursor.rowcount == 0:
                 error_msg = f"Book not found: {book_id}"
@@ -529,6 +549,7 @@ class LibraryRepository:
             )
 
             self._conn.commit()
+            self._books_version += 1
 
             if cursor.rowcount == 0:
                 error_msg = f"Book not found: {book_id}"
@@ -653,6 +674,47 @@ class LibraryRepository:
             logger.error(error_msg)
             raise DatabaseError(error_msg) from e
 
+    def get_books_with_recency(self, days_since_opened: int) -> list[tuple[BookMetadata, bool]]:
+        """Fetch all books in one query, flagging those opened recently.
+
+        Lets callers that need several smart-collection views bucket a single
+        result set instead of issuing one filtered query per view.
+
+        Args:
+            days_since_opened: Window in days for the "opened recently" flag.
+
+        Returns:
+            (book, opened_recently) pairs sorted by last opened date (newest
+            first, never-opened last), then date added.
+
+        Raises:
+            DatabaseError: If database operation fails.
+        """
+        logger.debug("Fetching books with %d-day recency flag", days_since_opened)
+
+        try:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                """
+                SELECT *,
+                       COALESCE(last_opened_date >= datetime('now', '-' || ? || ' days'), 0)
+                           AS opened_recently
+                FROM books
+                ORDER BY last_opened_date DESC NULLS LAST, added_date DESC
+                """,
+                (days_since_opened,),
+            )
+
+            return [
+                (self._row_to_metadata(row), bool(row["opened_recently"]))
+                for row in cursor.fetchall()
+            ]
+
+        except sqlite3.Error as e:
+            error_msg = f"Failed to fetch books: {e}"
+            logger.error(error_msg)
+            raise DatabaseError(error_msg) from e
+
     def update_reading_position(
         self, book_id: int, chapter_index: int, scroll_position: int, progress: float
     ) -> None:
@@ -688,6 +750,7 @@ class LibraryRepository:
             )
 
             self._conn.commit()
+            self._books_version += 1
 
             if cursor.rowcount == 0:
                 error_msg = f"Book not found: {book_id}"
@@ -725,7 +788,8 @@ class LibraryRepository:
             reading_progress=row["reading_progress"],
             current_chapter_index=row["current_chapter_index"],
             scroll_position=row["scroll_position"],
-            status=row["status"],
+            # Only a few distinct statuses: share one string per value
+            status=sys.intern(row["status"]),
             file_size=row["file_size"],
         )
 
@@ -5,6 +5,7 @@ that moves CPU-intensive chapter loading and image resolution off the UI thread.
 """
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QObject, QThread, pyqtSignal
@@ -57,6 +58,7 @@ class AsyncChapterLoader(QThread):
         cache_manager: "CacheManager",
         chapter_index: int,
         parent: QObject | None = None,
+        direct_callback: Callable[[str], None] | None = None,
     ) -> None:
         """Initialize the async chapter loader.
 
@@ -65,11 +67,16 @@ class AsyncChapterLoader(QThread):
             cache_manager: Cache manager for rendered/raw chapters and images.
             chapter_index: Zero-based index of chapter to load.
             parent: Optional parent QObject for automatic cleanup.
+            direct_callback: Optional callable invoked inline with the HTML on a
+                rendered-cache hit, instead of emitting content_ready. It runs
+                on the loader thread, so it must be thread-safe (e.g. forward
+                to the UI thread itself). Cache misses always use the signal.
         """
         super().__init__(parent)
         self._book = book
         self._cache_manager = cache_manager
         self._chapter_index = chapter_index
+        self._direct_callback = direct_callback
         self._cancelled = False  # Flag for cooperative cancellation
 
     def run(self) -> None:
@@ -103,7 +110,11 @@ class AsyncChapterLoader(QThread):
             cached_html = self._cache_manager.rendered_chapters.get(cache_key)
             if cached_html is not None:
                 logger.debug("Async loader: cache hit for chapter %d", self._chapter_index)
-                self.content_ready.emit(cached_html)
+                if self._direct_callback is not None:
+                    # Skip the queued signal dispatch for the cheap hit path
+                    self._direct_callback(cached_html)
+                else:
+                    self.content_ready.emit(cached_html)
                 return
 
             # Check cancellation again (user might have navigated away)
@@ -140,7 +151,12 @@ class AsyncChapterLoader(QThread):
 
             # Resolve image references (CPU-intensive, but we're in background thread!)
             logger.debug("Async loader: resolving images for chapter %d", self._chapter_index)
-            content = resolve_images_in_html(raw_content, self._book, chapter_href=chapter_href)
+            content = resolve_images_in_html(
+                raw_content,
+                self._book,
+                chapter_href=chapter_href,
+                image_cache=self._cache_manager.images,
+            )
 
             # Store rendered content in cache (thread-safe with locks)
             self._cache_manager.rendered_chapters.set(cache_key, content)
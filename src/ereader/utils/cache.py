@@ -4,16 +4,174 @@ This module provides caching implementations for reducing redundant operations
 and memory usage during book reading.
 """
 
+import hashlib
 import logging
+import os
 import sys
 import threading
 import time
+import zlib
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+class DiskChapterCache:
+    """Disk-backed second-level cache for chapter HTML.
+
+    Holds chapters spilled out of an in-memory ChapterCache so they can be
+    restored with a file read and decompress instead of re-rendering.
+    Entries are zlib-compressed and stored as <sha1(key)>.html.z files.
+
+    set() only queues the write: compression and file I/O run on a single
+    background writer thread, so spilling a chapter (which may embed
+    megabytes of base64 images) never blocks the GUI thread. Until its
+    write finishes, a queued value is served from memory.
+
+    Thread-safe: Files are written atomically via os.replace, and counters
+    and queued values are protected by a lock.
+
+    Args:
+        cache_dir: Directory for cache files (created on first write).
+
+    Example:
+        >>> l2 = DiskChapterCache(get_chapter_cache_dir())
+        >>> cache = ChapterCache(maxsize=10, l2=l2)
+    """
+
+    _SUFFIX = ".html.z"
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the disk cache.
+
+        Args:
+            cache_dir: Directory for cache files.
+        """
+        self._cache_dir = Path(cache_dir)
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        # Values queued for writing, served by get() until they are on disk
+        self._pending: dict[str, str] = {}
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chapter-l2")
+
+        logger.info("DiskChapterCache initialized at %s", self._cache_dir)
+
+    def _path_for(self, key: str) -> Path:
+        """Return the file path storing key."""
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{digest}{self._SUFFIX}"
+
+    def get(self, key: str) -> str | None:
+        """Retrieve cached HTML from disk.
+
+        Args:
+            key: Cache key (typically "book_id:chapter_index")
+
+        Returns:
+            Cached HTML string, or None if not found or unreadable
+        """
+        with self._lock:
+            value = self._pending.get(key)
+            if value is not None:
+                self._hits += 1
+                return value
+
+        try:
+            value = zlib.decompress(self._path_for(key).read_bytes()).decode("utf-8")
+        except FileNotFoundError:
+            value = None
+        except (OSError, zlib.error, UnicodeDecodeError) as e:
+            logger.warning("DiskChapterCache read failed for %s: %s", key, e)
+            value = None
+
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Queue HTML to be written to disk by the background writer.
+
+        Write failures are logged and ignored; the disk cache is best-effort.
+
+        Args:
+            key: Cache key (typically "book_id:chapter_index")
+            value: HTML string
+        """
+        with self._lock:
+            self._pending[key] = value
+        self._writer.submit(self._write, key, value)
+
+    def flush(self) -> None:
+        """Block until every queued write has finished."""
+        self._writer.submit(lambda: None).result()
+
+    def _write(self, key: str, value: str) -> None:
+        """Compress and write one queued value (runs on the writer thread).
+
+        Args:
+            key: Cache key.
+            value: HTML string queued by set().
+        """
+        with self._lock:
+            if self._pending.get(key) is not value:
+                return  # Superseded by a later set() or dropped by clear()
+
+        path = self._path_for(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(zlib.compress(value.encode("utf-8"), 1))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("DiskChapterCache write failed for %s: %s", key, e)
+
+        with self._lock:
+            if self._pending.get(key) is value:
+                del self._pending[key]
+
+    def clear(self) -> None:
+        """Delete all cached files and reset statistics.
+
+        Drops queued writes and waits for one already in progress, so no
+        file lands after the directory has been emptied.
+        """
+        with self._lock:
+            self._pending.clear()
+        self.flush()
+
+        removed = 0
+        if self._cache_dir.is_dir():
+            for path in self._cache_dir.glob(f"*{self._SUFFIX}"):
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError as e:
+                    logger.warning("DiskChapterCache could not remove %s: %s", path, e)
+
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+        logger.info("DiskChapterCache CLEARED: removed %d files", removed)
+
+    def stats(self) -> dict[str, Any]:
+        """Return disk cache statistics.
+
+        Returns:
+            Dictionary with cache metrics:
+            - hits: Number of disk hits
+            - misses: Number of disk misses
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses}
+
+
 class ChapterCache:
     """LRU cache for rendered chapter HTML.
 
@@ -23,8 +181,13 @@ class ChapterCache:
     Thread-safe: All operations are protected by an RLock to allow
     concurrent access from UI thread and background loader threads.
 
+    An optional DiskChapterCache acts as a second level: evicted chapters
+    are spilled to it and in-memory misses are looked up there before
+    reporting a miss. Disk I/O happens outside the lock.
+
     Args:
         maxsize: Maximum number of chapters to cache (default: 10)
+        l2: Optional disk-backed second-level cache (default: None)
 
     Example:
         >>> cache = ChapterCache(maxsize=5)
@@ -34,11 +197,12 @@ class ChapterCache:
         {'size': 1, 'maxsize': 5, 'hits': 1, 'misses': 0, 'hit_rate': 100.0}
     """
 
-    def __init__(self, maxsize: int = 10) -> None:
+    def __init__(self, maxsize: int = 10, l2: DiskChapterCache | None = None) -> None:
         """Initialize the chapter cache.
 
         Args:
             maxsize: Maximum number of chapters to cache (must be at least 1).
+            l2: Optional disk-backed second-level cache.
 
         Raises:
             ValueError: If maxsize is less than 1.
@@ -53,13 +217,16 @@ class ChapterCache:
         self._last_eviction_time: float | None = None
         self._creation_time = time.time()
         self._lock = threading.RLock()  # Reentrant lock for thread safety
+        self._l2 = l2
 
         logger.info("ChapterCache initialized with maxsize=%d", maxsize)
 
     def get(self, key: str) -> str | None:
         """Retrieve cached HTML by key.
 
-        If key exists, marks it as recently used by moving to end.
+        If key exists, marks it as recently used by moving to end. On a
+        miss, the second-level cache (if any) is consulted and a disk hit is
+        promoted back into memory.
 
         Thread-safe: Protected by lock for concurrent access.
 
@@ -82,8 +249,16 @@ class ChapterCache:
             logger.debug(
                 "Cache MISS: %s (hits=%d, misses=%d)", key, self._hits, self._misses
             )
+
+        if self._l2 is None:
             return None
 
+        value = self._l2.get(key)
+        if value is not None:
+            logger.debug("Cache L2 HIT: %s", key)
+            self.set(key, value)
+        return value
+
     def set(self, key: str, value: str) -> None:
         """Store HTML in cache.
 
@@ -95,6 +270,8 @@ class ChapterCache:
             key: Cache key (typically "book_id:chapter_index")
             value: Rendered HTML string
         """
+        evicted: tuple[str, str] | None = None
+
         with self._lock:
             if key in self._cache:
                 # Update existing entry and mark as recently used
@@ -107,8 +284,8 @@ class ChapterCache:
 
                 # Evict oldest if necessary
                 if len(self._cache) > self._maxsize:
-                    evicted_key = next(iter(self._cache))
-                    self._cache.popitem(last=False)  # Remove oldest (first item)
+                    evicted = self._cache.popitem(last=False)  # Remove oldest (first item)
+                    evicted_key = evicted[0]
                     self._last_eviction_time = time.time()
                     logger.info(
                         "Cache EVICTION: %s (cache full: %d/%d)",
@@ -121,8 +298,42 @@ class ChapterCache:
                         "Cache SET: %s (size: %d/%d)", key, len(self._cache), self._maxsize
                     )
 
+        # Spill the victim to disk outside the lock
+        if evicted is not None and self._l2 is not None:
+            self._l2.set(*evicted)
+
+    def evict_all_except(self, keep_key: str | None = None) -> int:
+        """Evict every entry except keep_key, preserving statistics.
+
+        Used to shed memory under pressure while keeping the chapter that is
+        currently on screen. Evicted entries are spilled to the second-level
+        cache, if any.
+
+        Thread-safe: Protected by lock for concurrent access.
+
+        Args:
+            keep_key: Key to retain, if present.
+
+        Returns:
+            Number of entries evicted.
+        """
+        with self._lock:
+            victims = [(k, v) for k, v in self._cache.items() if k != keep_key]
+            for victim_key, _ in victims:
+                del self._cache[victim_key]
+
+            if victims:
+                self._last_eviction_time = time.time()
+                logger.info("Cache SHRINK: evicted %d entries", len(victims))
+
+        # Spill victims to disk outside the lock
+        if self._l2 is not None:
+            for victim in victims:
+                self._l2.set(*victim)
+        return len(victims)
+
     def clear(self) -> None:
-        """Remove all cached entries.
+        """Remove all cached entries, including the second-level cache.
 
         Thread-safe: Protected by lock for concurrent access.
         """
@@ -133,6 +344,9 @@ class ChapterCache:
             self._misses = 0
             logger.info("Cache CLEARED: removed %d entries", size)
 
+        if self._l2 is not None:
+            self._l2.clear()
+
     def stats(self) -> dict[str, Any]:
         """Return cache statistics.
 
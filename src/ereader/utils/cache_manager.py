@@ -5,15 +5,55 @@ caches with a shared memory budget.
 """
 
 import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
 from typing import Any
 
-from ereader.utils.cache import ChapterCache
+from ereader.utils.cache import ChapterCache, DiskChapterCache
+from ereader.utils.cover_extractor import CoverExtractor
+from ereader.utils.database_utils import get_chapter_cache_dir
 from ereader.utils.image_cache import ImageCache
 from ereader.utils.memory_monitor import MemoryMonitor
 
 logger = logging.getLogger(__name__)
 
 
+class MemoryPressureLevel(Enum):
+    """Cache memory pressure relative to the shared memory budget."""
+
+    NORMAL = "normal"
+    WARNING = "warning"
+    CRITICAL = "critical"
+
+
+@dataclass(frozen=True, slots=True)
+class CombinedStats:
+    """Snapshot of statistics across all cache layers.
+
+    Attributes:
+        rendered_stats: Stats from rendered chapters cache.
+        raw_stats: Stats from raw chapters cache.
+        image_stats: Stats from image cache.
+        memory_stats: Stats from memory monitor.
+        total_memory_mb: Combined estimated memory usage of all caches.
+        total_items: Total items across all caches.
+        hit_rate: Percentage of lookups across all caches that hit.
+        covers_cached: Cover extractions served from the persistent cover
+            cache (process-wide, not part of hit_rate).
+    """
+
+    rendered_stats: dict[str, Any]
+    raw_stats: dict[str, Any]
+    image_stats: dict[str, Any]
+    memory_stats: dict[str, Any]
+    total_memory_mb: float
+    total_items: int
+    hit_rate: float
+    covers_cached: int
+
+
 class CacheManager:
     """Coordinate multiple caches with shared memory budget.
 
@@ -23,13 +63,19 @@ class CacheManager:
     3. Images (ImageCache): Processed/decoded images
 
     Each cache operates independently but is monitored as part of a
-    shared memory budget.
+    shared memory budget. The chapter caches can optionally be backed by a
+    disk L2 (DiskChapterCache) that receives evicted chapters, so they are
+    reloaded from disk instead of re-rendered. The L2 is emptied by
+    clear_all(), so it only ever holds chapters of the current book.
 
     Args:
         rendered_maxsize: Max rendered chapters to cache (default: 10)
         raw_maxsize: Max raw chapters to cache (default: 20)
         image_max_memory_mb: Max memory for images in MB (default: 50)
         total_memory_threshold_mb: Total memory threshold in MB (default: 150)
+        enable_disk_l2: Back chapter caches with a disk L2 (default: False)
+        disk_cache_dir: Directory for the disk L2
+            (default: ~/.ereader/cache/chapters)
 
     Example:
         >>> manager = CacheManager()
@@ -37,15 +83,28 @@ class CacheManager:
         >>> manager.raw_chapters.set("book:0", "<body>...")
         >>> manager.images.set("images/photo.jpg", base64_data)
         >>> stats = manager.get_combined_stats()
-        >>> print(f"Total memory: {stats['total_memory_mb']:.1f} MB")
+        >>> print(f"Total memory: {stats.total_memory_mb:.1f} MB")
+
+    Attributes:
+        LOG_STATS_INTERVAL_S: Minimum seconds between log_stats outputs.
+        PRESSURE_WARNING_RATIO: Fraction of the memory budget used by caches
+            at which pressure becomes WARNING.
+        PRESSURE_CRITICAL_RATIO: Fraction of the memory budget used by caches
+            at which pressure becomes CRITICAL.
     """
 
+    LOG_STATS_INTERVAL_S = 1.0
+    PRESSURE_WARNING_RATIO = 0.7
+    PRESSURE_CRITICAL_RATIO = 0.9
+
     def __init__(
         self,
         rendered_maxsize: int = 10,
         raw_maxsize: int = 20,
         image_max_memory_mb: int = 50,
         total_memory_threshold_mb: int = 150,
+        enable_disk_l2: bool = False,
+        disk_cache_dir: Path | None = None,
     ) -> None:
         """Initialize the cache manager.
 
@@ -54,6 +113,9 @@ class CacheManager:
             raw_maxsize: Maximum raw chapters to cache.
             image_max_memory_mb: Maximum memory for images in MB.
             total_memory_threshold_mb: Total memory threshold for monitoring.
+            enable_disk_l2: Whether to spill evicted chapters to disk.
+            disk_cache_dir: Directory for the disk L2 cache (defaults to
+                get_chapter_cache_dir()).
 
         Raises:
             ValueError: If any size parameter is not positive.
@@ -68,19 +130,32 @@ class CacheManager:
             raise ValueError("total_memory_threshold_mb must be positive")
 
         # Initialize cache layers
-        self.rendered_chapters = ChapterCache(maxsize=rendered_maxsize)
-        self.raw_chapters = ChapterCache(maxsize=raw_maxsize)
+        rendered_l2 = raw_l2 = None
+        if enable_disk_l2:
+            if disk_cache_dir is None:
+                disk_cache_dir = get_chapter_cache_dir()
+            rendered_l2 = DiskChapterCache(disk_cache_dir / "rendered")
+            raw_l2 = DiskChapterCache(disk_cache_dir / "raw")
+
+        self.rendered_chapters = ChapterCache(maxsize=rendered_maxsize, l2=rendered_l2)
+        self.raw_chapters = ChapterCache(maxsize=raw_maxsize, l2=raw_l2)
         self.images = ImageCache(max_memory_mb=image_max_memory_mb)
 
         # Initialize memory monitor
+        self._total_memory_threshold_mb = total_memory_threshold_mb
         self.memory_monitor = MemoryMonitor(threshold_mb=total_memory_threshold_mb)
 
+        # Throttle state for log_stats
+        self._last_log_time: float | None = None
+
         logger.info(
-            "CacheManager initialized: rendered=%d, raw=%d, images=%dMB, threshold=%dMB",
+            "CacheManager initialized: rendered=%d, raw=%d, images=%dMB, threshold=%dMB, "
+            "disk_l2=%s",
             rendered_maxsize,
             raw_maxsize,
             image_max_memory_mb,
             total_memory_threshold_mb,
+            enable_disk_l2,
         )
 
     def clear_all(self) -> None:
@@ -93,43 +168,40 @@ class CacheManager:
         self.raw_chapters.clear()
         self.images.clear()
 
-    def get_combined_stats(self) -> dict[str, Any]:
+    def get_combined_stats(self) -> CombinedStats:
         """Get combined statistics from all caches.
 
         Returns:
-            Dictionary with combined metrics:
-            - rendered_stats: Stats from rendered chapters cache
-            - raw_stats: Stats from raw chapters cache
-            - image_stats: Stats from image cache
-            - memory_stats: Stats from memory monitor
-            - total_memory_mb: Combined estimated memory usage
-            - total_items: Total items across all caches
+            CombinedStats aggregating the per-cache stats dictionaries, the
+            memory monitor stats, total estimated memory, total items and the
+            overall hit rate.
         """
         rendered_stats = self.rendered_chapters.stats()
         raw_stats = self.raw_chapters.stats()
         image_stats = self.images.stats()
-        memory_stats = self.memory_monitor.get_stats()
 
-        # Calculate totals
-        total_memory_mb = (
-            rendered_stats.get("estimated_memory_mb", 0)
-            + raw_stats.get("estimated_memory_mb", 0)
-            + image_stats.get("memory_mb", 0)
+        # Aggregate raw integer counters; the ratio is only derived here
+        hits = rendered_stats["hits"] + raw_stats["hits"] + image_stats["hits"]
+        lookups = (
+            hits + rendered_stats["misses"] + raw_stats["misses"] + image_stats["misses"]
         )
 
-        total_items = (
-            rendered_stats["size"] + raw_stats["size"] + image_stats["size"]
+        # Every stats() call always provides these keys; index directly
+        return CombinedStats(
+            rendered_stats=rendered_stats,
+            raw_stats=raw_stats,
+            image_stats=image_stats,
+            memory_stats=self.memory_monitor.get_stats(),
+            total_memory_mb=(
+                rendered_stats["estimated_memory_mb"]
+                + raw_stats["estimated_memory_mb"]
+                + image_stats["memory_mb"]
+            ),
+            total_items=rendered_stats["size"] + raw_stats["size"] + image_stats["size"],
+            hit_rate=(hits / lookups * 100) if lookups else 0.0,
+            covers_cached=CoverExtractor.cache_stats()["hits"],
         )
 
-        return {
-            "rendered_stats": rendered_stats,
-            "raw_stats": raw_stats,
-            "image_stats": image_stats,
-            "memory_stats": memory_stats,
-            "total_memory_mb": total_memory_mb,
-            "total_items": total_items,
-        }
-
     def check_memory_threshold(self) -> bool:
         """Check if total memory exceeds threshold.
 
@@ -138,34 +210,100 @@ class CacheManager:
         """
         return self.memory_monitor.check_threshold()
 
+    def get_memory_pressure(self) -> MemoryPressureLevel:
+        """Classify combined cache memory against the shared memory budget.
+
+        Returns:
+            CRITICAL at PRESSURE_CRITICAL_RATIO of total_memory_threshold_mb,
+            WARNING at PRESSURE_WARNING_RATIO, otherwise NORMAL.
+        """
+        ratio = (
+            self.rendered_chapters.stats()["estimated_memory_mb"]
+            + self.raw_chapters.stats()["estimated_memory_mb"]
+            + self.images.stats()["memory_mb"]
+        ) / self._total_memory_threshold_mb
+
+        if ratio >= self.PRESSURE_CRITICAL_RATIO:
+            return MemoryPressureLevel.CRITICAL
+        if ratio >= self.PRESSURE_WARNING_RATIO:
+            return MemoryPressureLevel.WARNING
+        return MemoryPressureLevel.NORMAL
+
+    def on_memory_pressure(
+        self, level: MemoryPressureLevel, keep_key: str | None = None
+    ) -> None:
+        """Evict cached data to relieve memory pressure.
+
+        Images are the cheapest to rebuild and go first. WARNING halves the
+        image cache; CRITICAL empties the image and raw chapter caches and
+        every rendered chapter except keep_key.
+
+        Args:
+            level: Pressure level, typically from get_memory_pressure().
+            keep_key: Rendered chapter key to keep (the chapter on screen).
+        """
+        if level is MemoryPressureLevel.NORMAL:
+            return
+
+        logger.warning("Cache memory pressure %s, evicting", level.value)
+
+        if level is MemoryPressureLevel.WARNING:
+            image_bytes = int(self.images.stats()["memory_mb"] * 1024 * 1024)
+            self.images.evict_to(image_bytes // 2)
+            return
+
+        self.images.evict_to(0)
+        self.raw_chapters.evict_all_except(None)
+        self.rendered_chapters.evict_all_except(keep_key)
+
     def log_stats(self) -> None:
         """Log combined cache statistics at DEBUG level.
 
-        Useful for debugging and monitoring cache behavior.
+        Useful for debugging and monitoring cache behavior. Stats are only
+        collected when DEBUG logging is enabled, and at most once per
+        LOG_STATS_INTERVAL_S so rapid navigation does not pay for them.
         """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        now = time.monotonic()
+        if (
+            self._last_log_time is not None
+            and now - self._last_log_time < self.LOG_STATS_INTERVAL_S
+        ):
+            return
+        self._last_log_time = now
+
         stats = self.get_combined_stats()
+        rendered = stats.rendered_stats
+        raw = stats.raw_stats
+        images = stats.image_stats
+        memory = stats.memory_stats
 
         logger.debug(
             "Cache stats: rendered=%d/%d, raw=%d/%d, images=%d (%.1f/%.1f MB)",
-            stats["rendered_stats"]["size"],
-            stats["rendered_stats"]["maxsize"],
-            stats["raw_stats"]["size"],
-            stats["raw_stats"]["maxsize"],
-            stats["image_stats"]["size"],
-            stats["image_stats"]["memory_mb"],
-            stats["image_stats"]["max_memory_mb"],
+            rendered["size"],
+            rendered["maxsize"],
+            raw["size"],
+            raw["maxsize"],
+            images["size"],
+            images["memory_mb"],
+            images["max_memory_mb"],
         )
 
         logger.debug(
-            "Cache performance: rendered hit_rate=%.1f%%, raw hit_rate=%.1f%%, images hit_rate=%.1f%%",
-            stats["rendered_stats"]["hit_rate"],
-            stats["raw_stats"]["hit_rate"],
-            stats["image_stats"]["hit_rate"],
+            "Cache performance: rendered hit_rate=%.1f%%, raw hit_rate=%.1f%%, "
+            "images hit_rate=%.1f%%, overall hit_rate=%.1f%%, covers_cached=%d",
+            rendered["hit_rate"],
+            raw["hit_rate"],
+            images["hit_rate"],
+            stats.hit_rate,
+            stats.covers_cached,
         )
 
         logger.debug(
             "Memory: total_cache=%.1f MB, process=%.1f MB, threshold=%d MB",
-            stats["total_memory_mb"],
-            stats["memory_stats"]["current_usage_mb"],
-            stats["memory_stats"]["threshold_mb"],
+            stats.total_memory_mb,
+            memory["current_usage_mb"],
+            memory["threshold_mb"],
         )
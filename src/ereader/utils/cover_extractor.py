@@ -4,16 +4,252 @@ This module provides the CoverExtractor utility for extracting cover images
 from EPUB files using multiple detection strategies (EPUB 3, EPUB 2, heuristics).
 """
 
+import functools
+import io
+import itertools
 import logging
+import os
+import posixpath
+import threading
 import xml.etree.ElementTree as ET
 import zipfile
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from ereader.exceptions import InvalidEPUBError
 from ereader.models.epub import EPUBBook
+from ereader.utils.database_utils import get_cover_cache_path
 
 logger = logging.getLogger(__name__)
 
+_MEDIA_TYPE_TO_EXT = {
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/webp": "webp",
+    "image/svg+xml": "svg",
+}
+_JPEG_EXTENSIONS = frozenset({"jpeg", "jpg"})
+
+# Conventional cover filenames, preferred over other "cover" substring matches
+_EXACT_COVER_FILENAMES = frozenset(
+    {"cover.jpg", "cover.jpeg", "cover.png", "cover.webp", "cover.gif"}
+)
+
+# Covers above this size are streamed into a preallocated buffer
+_STREAM_THRESHOLD_BYTES = 512 * 1024
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+class _ZipPool:
+    """Bounded LRU pool of open ZipFile handles keyed by file version.
+
+    Re-extracting covers for the same EPUB (e.g. thumbnail regeneration)
+    reuses the already-parsed central directory. Handles are reference
+    counted so eviction never closes a ZipFile another thread is reading;
+    it is closed when its last user releases it.
+
+    Thread-safe: Pool bookkeeping is protected by a lock. Archives are
+    opened outside the lock so concurrent extractions do not serialize.
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        """Initialize the pool.
+
+        Args:
+            maxsize: Maximum number of archives kept open.
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, int], _PooledZip] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def open(self, path: str, mtime_ns: int) -> Iterator[zipfile.ZipFile]:
+        """Borrow an open ZipFile for path.
+
+        Args:
+            path: Path to the archive.
+            mtime_ns: Modification time of the file, so rewrites reopen it.
+
+        Yields:
+            Open ZipFile, valid until the context exits.
+        """
+        key = (path, mtime_ns)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.users += 1
+
+        if entry is None:
+            opened = _PooledZip(zipfile.ZipFile(path))
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = opened
+                    self._entries[key] = entry
+                    self._evict_locked()
+                entry.users += 1
+            if entry is not opened:
+                # Another thread pooled this archive first
+                opened.zf.close()
+
+        try:
+            yield entry.zf
+        finally:
+            with self._lock:
+                entry.users -= 1
+                if entry.evicted and entry.users == 0:
+                    entry.zf.close()
+
+    def discard(self, path: str) -> None:
+        """Close and forget every pooled handle for path.
+
+        Call before deleting or replacing a file so no handle keeps it open.
+
+        Args:
+            path: Path to the archive.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == path]:
+                self._retire_locked(self._entries.pop(key))
+
+    def clear(self) -> None:
+        """Close and forget every pooled handle."""
+        with self._lock:
+            while self._entries:
+                self._retire_locked(self._entries.popitem(last=False)[1])
+
+    def _evict_locked(self) -> None:
+        """Evict least recently used handles beyond maxsize (lock held)."""
+        while len(self._entries) > self._maxsize:
+            self._retire_locked(self._entries.popitem(last=False)[1])
+
+    @staticmethod
+    def _retire_locked(entry: "_PooledZip") -> None:
+        """Close entry now, or once its last user releases it (lock held)."""
+        entry.evicted = True
+        if entry.users == 0:
+            entry.zf.close()
+
+
+@dataclass
+class _PooledZip:
+    """Open ZipFile with its borrow count."""
+
+    zf: zipfile.ZipFile
+    users: int = 0
+    evicted: bool = False
+
+
+_ZIP_POOL = _ZipPool()
+
+# Persistent cover cache counters, shared by every extraction thread
+_cover_cache_lock = threading.Lock()
+_cover_cache_hits = 0
+_cover_cache_misses = 0
+
+
+def _cover_cache_path(epub_file: Path, mtime_ns: int) -> Path | None:
+    """Resolve the persistent cache file, or None if the data dir is unusable."""
+    try:
+        return get_cover_cache_path(epub_file, mtime_ns)
+    except OSError as e:
+        logger.warning("Cover cache unavailable: %s", e)
+        return None
+
+
+def _read_cached_cover(
+    cache_path: Path | None,
+) -> tuple[bool, tuple[bytes | bytearray, str] | None]:
+    """Read a persisted extraction result.
+
+    The file holds the image extension on the first line followed by the
+    image bytes; an empty file records that the EPUB has no cover.
+
+    Args:
+        cache_path: Cache file from _cover_cache_path().
+
+    Returns:
+        (found, cover): found is False on a cache miss.
+    """
+    global _cover_cache_hits, _cover_cache_misses
+
+    data = None
+    if cache_path is not None:
+        try:
+            data = cache_path.read_bytes()
+        except OSError:
+            pass
+
+    with _cover_cache_lock:
+        if data is None:
+            _cover_cache_misses += 1
+            return False, None
+        _cover_cache_hits += 1
+
+    if not data:
+        return True, None
+    extension, _, image_bytes = data.partition(b"\n")
+    return True, (image_bytes, extension.decode("ascii"))
+
+
+def _store_cached_cover(
+    cache_path: Path | None, cover: tuple[bytes | bytearray, str] | None
+) -> None:
+    """Persist an extraction result, replacing older versions of the same EPUB.
+
+    Failures are logged and ignored; the cache is only an accelerator.
+
+    Args:
+        cache_path: Cache file from _cover_cache_path().
+        cover: Extraction result to store.
+    """
+    if cache_path is None:
+        return
+
+    try:
+        data = b"" if cover is None else cover[1].encode("ascii") + b"\n" + cover[0]
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Entries for previous mtimes of this EPUB can never hit again
+        prefix = cache_path.name.rpartition("-")[0]
+        for stale in cache_path.parent.glob(f"{prefix}-*.cover"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        tmp_path = cache_path.with_suffix(f".tmp{threading.get_ident()}")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, cache_path)
+    except (OSError, UnicodeEncodeError) as e:
+        # Non-ASCII extensions (taken from the href) are simply not cached
+        logger.warning("Failed to write cover cache %s: %s", cache_path, e)
+
+
+@dataclass
+class ManifestScan:
+    """Cover-relevant data gathered from a single pass over an OPF document.
+
+    Attributes:
+        epub3_cover: (href, media_type) of the first item with the
+            "cover-image" property, if any.
+        id_to_item: Manifest item id -> (href, media_type).
+        exact_cover_candidates: (href, media_type) of image items with a
+            conventional cover filename (e.g. "cover.jpg"), in manifest order.
+        filename_cover_candidates: (href, media_type) of other image items
+            whose filename contains "cover", in manifest order.
+        meta_cover_id: Content of the first <meta name="cover">, if set.
+    """
+
+    epub3_cover: tuple[str, str] | None = None
+    id_to_item: dict[str, tuple[str, str]] = field(default_factory=dict)
+    exact_cover_candidates: list[tuple[str, str]] = field(default_factory=list)
+    filename_cover_candidates: list[tuple[str, str]] = field(default_factory=list)
+    meta_cover_id: str | None = None
+
 
 class CoverExtractor:
     """Extract cover images from EPUB files.
@@ -23,15 +259,23 @@ class CoverExtractor:
     2. EPUB 2: <meta name="cover"> referencing manifest item
     3. Filename heuristic: image with "cover" in filename
 
-    All methods are static as this is a stateless utility class.
+    All methods are static; OPF scans are memoized per file version by the
+    module-level _load_scan helper and open archives are reused from a
+    bounded pool (see release()). Extraction results are also persisted
+    per file version (see get_cover_cache_path()), so covers of unchanged
+    books are read back without opening the EPUB at all.
     """
 
     @staticmethod
-    def extract_cover(epub_path: str | Path) -> tuple[bytes, str] | None:
+    def extract_cover(epub_path: str | Path) -> tuple[bytes | bytearray, str] | None:
         """Extract cover image from EPUB.
 
         Tries multiple extraction strategies in order of specificity.
-        Returns the first successfully extracted cover.
+        Returns the first successfully extracted cover. The OPF is located and
+        scanned once, then shared by all strategies; the scan is memoized per
+        file version so repeat extractions skip EPUB validation and OPF parsing.
+        Results (including "no cover") are stored in the persistent cover
+        cache and returned from there while the file is unchanged.
 
         Args:
             epub_path: Path to EPUB file.
@@ -47,110 +291,293 @@ class CoverExtractor:
         logger.debug("Extracting cover from: %s", epub_path)
 
         try:
-            # Create EPUBBook instance to access structure
-            epub = EPUBBook(epub_path)
+            epub_file = Path(epub_path)
+            # Stat first: raises FileNotFoundError and keys the scan cache
+            mtime_ns = epub_file.stat().st_mtime_ns
+
+            cache_path = _cover_cache_path(epub_file, mtime_ns)
+            found, cover = _read_cached_cover(cache_path)
+            if found:
+                logger.debug("Cover cache hit: %s", epub_path)
+                return cover
 
+            cover = CoverExtractor._extract_from_archive(epub_file, mtime_ns)
+            _store_cached_cover(cache_path, cover)
+            return cover
+
+        except FileNotFoundError:
+            logger.error("EPUB file not found: %s", epub_path)
+            raise
+        except InvalidEPUBError as e:
+            logger.error("Invalid EPUB file %s: %s", epub_path, e)
+            raise
+
+    @staticmethod
+    def _extract_from_archive(
+        epub_file: Path, mtime_ns: int
+    ) -> tuple[bytes | bytearray, str] | None:
+        """Run the extraction strategies against the EPUB archive.
+
+        Args:
+            epub_file: Path to EPUB file.
+            mtime_ns: Modification time of the file, keying scan and pool.
+
+        Returns:
+            Tuple of (image_bytes, file_extension) or None if no cover found.
+        """
+        try:
+            opf_path, scan = _load_scan(str(epub_file), mtime_ns)
+        except ET.ParseError as e:
+            logger.warning("Failed to parse OPF for cover extraction: %s", e)
+            return None
+
+        # ZIP member names are POSIX paths; resolve them with string ops
+        opf_dir = posixpath.dirname(opf_path)
+
+        with _ZIP_POOL.open(str(epub_file), mtime_ns) as zf:
             # Try EPUB 3 method first (most specific)
-            cover = CoverExtractor._try_epub3_cover(epub)
+            cover = CoverExtractor._try_epub3_cover(zf, scan, opf_dir)
             if cover:
                 logger.info("Extracted cover using EPUB 3 method")
                 return cover
 
             # Try EPUB 2 method
-            cover = CoverExtractor._try_epub2_cover(epub)
+            cover = CoverExtractor._try_epub2_cover(zf, scan, opf_dir)
             if cover:
                 logger.info("Extracted cover using EPUB 2 method")
                 return cover
 
             # Try filename heuristic
-            cover = CoverExtractor._try_filename_heuristic(epub)
+            cover = CoverExtractor._try_filename_heuristic(zf, scan, opf_dir)
             if cover:
                 logger.info("Extracted cover using filename heuristic")
                 return cover
 
-            logger.warning("No cover found in EPUB: %s", epub_path)
+        logger.warning("No cover found in EPUB: %s", epub_file)
+        return None
+
+    @staticmethod
+    def release(epub_path: str | Path) -> None:
+        """Close any pooled archive handle for an EPUB.
+
+        Call before deleting or replacing the file, since an open handle
+        keeps it locked on some platforms.
+
+        Args:
+            epub_path: Path to EPUB file.
+        """
+        _ZIP_POOL.discard(str(Path(epub_path)))
+
+    @staticmethod
+    def cache_stats() -> dict[str, int]:
+        """Get persistent cover cache counters.
+
+        Returns:
+            Dictionary with hits (covers served from the cache) and misses
+            (covers extracted from the EPUB).
+        """
+        with _cover_cache_lock:
+            return {"hits": _cover_cache_hits, "misses": _cover_cache_misses}
+
+    @staticmethod
+    def extract_covers(
+        epub_paths: Iterable[str | Path],
+    ) -> Iterator[tuple[Path, tuple[bytes | bytearray, str] | None]]:
+        """Extract covers for many EPUBs concurrently.
+
+        Cover extraction is dominated by ZIP and file I/O, which releases the
+        GIL, so a thread pool overlaps reads across books. Results are yielded
+        as they complete, not in input order.
+
+        A book whose extraction fails is logged and yielded with None, so one
+        bad file does not abort a library scan.
+
+        Args:
+            epub_paths: Paths to EPUB files.
+
+        Yields:
+            Tuples of (epub_path, cover) where cover is (image_bytes,
+            file_extension) or None.
+        """
+        paths = [Path(p) for p in epub_paths]
+        if not paths:
+            return
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+        logger.debug("Extracting %d covers with %d workers", len(paths), max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(CoverExtractor.extract_cover, path): path for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    yield path, future.result()
+                except Exception as e:
+                    logger.warning("Failed to extract cover for %s: %s", path, e)
+                    yield path, None
+
+    @staticmethod
+    def _scan_manifest(opf_data: bytes) -> ManifestScan:
+        """Collect everything the cover strategies need in one pass over the OPF.
+
+        The OPF is streamed with iterparse rather than built into a full
+        tree: processed elements are cleared as we go and parsing stops as
+        soon as both the manifest and metadata sections have been read, so
+        the spine and guide are never parsed.
+
+        Args:
+            opf_data: Raw OPF document bytes.
+
+        Returns:
+            ManifestScan with cover candidates for every strategy.
+
+        Raises:
+            ET.ParseError: If the OPF is malformed before scanning completes.
+        """
+        scan = ManifestScan()
+        in_manifest = in_metadata = False
+        manifest_done = metadata_done = cover_meta_seen = False
+
+        # Local names are compared so namespaced and bare OPFs both work
+        for event, element in ET.iterparse(io.BytesIO(opf_data), events=("start", "end")):
+            tag = element.tag.rpartition("}")[2]
+
+            if event == "start":
+                if tag == "manifest":
+                    in_manifest = True
+                elif tag == "metadata":
+                    in_metadata = True
+                continue
+
+            if tag == "item" and in_manifest:
+                CoverExtractor._scan_item(element, scan)
+            elif tag == "meta" and in_metadata:
+                # EPUB 2 meta may be nested (e.g. OEB 1.2 x-metadata)
+                if not cover_meta_seen and element.get("name") == "cover":
+                    cover_meta_seen = True
+                    scan.meta_cover_id = element.get("content") or None
+            elif tag == "manifest":
+                in_manifest = False
+                manifest_done = True
+            elif tag == "metadata":
+                in_metadata = False
+                metadata_done = True
+
+            element.clear()
+            if manifest_done and metadata_done:
+                break
+
+        return scan
+
+    @staticmethod
+    def _scan_item(item: ET.Element, scan: ManifestScan) -> None:
+        """Record a single manifest item in the scan.
+
+        Args:
+            item: Manifest <item> element.
+            scan: Scan being populated.
+        """
+        href = item.get("href", "")
+        media_type = item.get("media-type", "").lower()
+        item_id = item.get("id")
+        if item_id is not None:
+            scan.id_to_item.setdefault(item_id, (href, media_type))
+
+        if not href:
+            return
+        if scan.epub3_cover is None and "cover-image" in item.get("properties", ""):
+            scan.epub3_cover = (href, media_type)
+        if media_type.startswith("image/"):
+            filename = posixpath.basename(href).lower()
+            if filename in _EXACT_COVER_FILENAMES:
+                scan.exact_cover_candidates.append((href, media_type))
+            elif "cover" in filename:
+                scan.filename_cover_candidates.append((href, media_type))
+
+    @staticmethod
+    def _read_cover(
+        zf: zipfile.ZipFile, opf_dir: str, href: str, media_type: str
+    ) -> tuple[bytes | bytearray, str] | None:
+        """Read a manifest image from the archive.
+
+        Args:
+            zf: Open EPUB archive.
+            opf_dir: Directory of the OPF file within the archive.
+            href: Manifest href of the image, relative to the OPF.
+            media_type: Manifest media-type of the image.
+
+        Images larger than _STREAM_THRESHOLD_BYTES are decompressed chunk by
+        chunk into a bytearray sized from the ZIP header, instead of building
+        the whole image as one bytes object, which lowers peak memory for
+        multi-megabyte covers.
+
+        Returns:
+            Tuple of (image_bytes, extension) or None if the file is missing.
+            Large images are returned as a bytearray.
+        """
+        # Resolve href relative to OPF location
+        cover_path = posixpath.join(opf_dir, href) if opf_dir else href
+
+        try:
+            info = zf.getinfo(cover_path)
+        except KeyError:
+            logger.warning("Cover file not found in ZIP: %s", cover_path)
             return None
 
-        except FileNotFoundError:
-            logger.error("EPUB file not found: %s", epub_path)
-            raise
-        except InvalidEPUBError as e:
-            logger.error("Invalid EPUB file %s: %s", epub_path, e)
-            raise
+        with zf.open(info) as src:
+            if info.file_size <= _STREAM_THRESHOLD_BYTES:
+                cover_bytes: bytes | bytearray = src.read()
+            else:
+                cover_bytes = bytearray(info.file_size)
+                view = memoryview(cover_bytes)
+                filled = 0
+                while filled < info.file_size:
+                    n = src.readinto(view[filled : filled + _STREAM_CHUNK_BYTES])
+                    if not n:
+                        break
+                    filled += n
+                view.release()
+                # ZipExtFile verifies the CRC at EOF; a short member is corrupt
+                if filled != info.file_size:
+                    logger.warning("Truncated cover image in ZIP: %s", cover_path)
+                    return None
+
+        logger.debug("Read cover image: %s (%d bytes)", cover_path, len(cover_bytes))
+        return (cover_bytes, CoverExtractor._get_image_extension(media_type, href))
 
     @staticmethod
-    def _try_epub3_cover(epub: EPUBBook) -> tuple[bytes, str] | None:
+    def _try_epub3_cover(
+        zf: zipfile.ZipFile, scan: ManifestScan, opf_dir: str
+    ) -> tuple[bytes | bytearray, str] | None:
         """Try EPUB 3 properties='cover-image' method.
 
         EPUB 3 specifies covers via properties attribute in manifest:
         <item id="cover" href="images/cover.jpg" properties="cover-image"/>
 
         Args:
-            epub: EPUBBook instance.
+            zf: Open EPUB archive.
+            scan: Manifest scan of the OPF.
+            opf_dir: Directory of the OPF file within the archive.
 
         Returns:
             Tuple of (image_bytes, extension) or None.
         """
         logger.debug("Trying EPUB 3 cover detection")
 
-        try:
-            with zipfile.ZipFile(epub.filepath) as zf:
-                # Parse OPF to access manifest
-                opf_path = epub._get_opf_path()
-                opf_data = zf.read(opf_path)
-                opf_root = ET.fromstring(opf_data)
-
-                # Find manifest
-                manifest = opf_root.find(".//{*}manifest")
-                if manifest is None:
-                    logger.debug("No manifest found in OPF")
-                    return None
-
-                # Find item with properties="cover-image"
-                for item in manifest.findall(".//{*}item"):
-                    properties = item.get("properties", "")
-                    if "cover-image" in properties:
-                        href = item.get("href")
-                        media_type = item.get("media-type", "")
-
-                        if href:
-                            logger.debug("Found EPUB 3 cover: %s", href)
-
-                            # Resolve href relative to OPF location
-                            opf_dir = str(Path(opf_path).parent)
-                            if opf_dir and opf_dir != ".":
-                                cover_path = f"{opf_dir}/{href}"
-                            else:
-                                cover_path = href
-
-                            # Read cover image
-                            try:
-                                cover_bytes = zf.read(cover_path)
-                                extension = CoverExtractor._get_image_extension(
-                                    media_type, href
-                                )
-                                logger.debug(
-                                    "Successfully extracted EPUB 3 cover: %s (%d bytes)",
-                                    cover_path,
-                                    len(cover_bytes),
-                                )
-                                return (cover_bytes, extension)
-                            except KeyError:
-                                logger.warning("Cover file not found in ZIP: %s", cover_path)
-                                return None
-
-                logger.debug("No EPUB 3 cover-image property found")
-                return None
-
-        except ET.ParseError as e:
-            logger.warning("Failed to parse OPF for EPUB 3 cover: %s", e)
-            return None
-        except Exception as e:
-            logger.warning("Unexpected error extracting EPUB 3 cover: %s", e)
+        if scan.epub3_cover is None:
+            logger.debug("No EPUB 3 cover-image property found")
             return None
 
+        href, media_type = scan.epub3_cover
+        logger.debug("Found EPUB 3 cover: %s", href)
+        return CoverExtractor._read_cover(zf, opf_dir, href, media_type)
+
     @staticmethod
-    def _try_epub2_cover(epub: EPUBBook) -> tuple[bytes, str] | None:
+    def _try_epub2_cover(
+        zf: zipfile.ZipFile, scan: ManifestScan, opf_dir: str
+    ) -> tuple[bytes | bytearray, str] | None:
         """Try EPUB 2 <meta name='cover'> method.
 
         EPUB 2 uses two-step reference:
@@ -158,193 +585,92 @@ class CoverExtractor:
         2. Manifest item with id="cover-id" has the cover href
 
         Args:
-            epub: EPUBBook instance.
+            zf: Open EPUB archive.
+            scan: Manifest scan of the OPF.
+            opf_dir: Directory of the OPF file within the archive.
 
         Returns:
             Tuple of (image_bytes, extension) or None.
         """
         logger.debug("Trying EPUB 2 cover detection")
 
-        try:
-            with zipfile.ZipFile(epub.filepath) as zf:
-                # Parse OPF
-                opf_path = epub._get_opf_path()
-                opf_data = zf.read(opf_path)
-                opf_root = ET.fromstring(opf_data)
-
-                # Find <meta name="cover"> in metadata
-                cover_meta = None
-                for meta in opf_root.findall(".//{*}meta"):
-                    if meta.get("name") == "cover":
-                        cover_meta = meta
-                        break
-
-                if cover_meta is None:
-                    logger.debug("No <meta name='cover'> found")
-                    return None
-
-                # Get cover item ID from content attribute
-                cover_id = cover_meta.get("content")
-                if not cover_id:
-                    logger.debug("<meta name='cover'> has no content attribute")
-                    return None
-
-                logger.debug("Found EPUB 2 cover meta, id: %s", cover_id)
-
-                # Find manifest item with this ID
-                manifest = opf_root.find(".//{*}manifest")
-                if manifest is None:
-                    logger.debug("No manifest found in OPF")
-                    return None
-
-                for item in manifest.findall(".//{*}item"):
-                    if item.get("id") == cover_id:
-                        href = item.get("href")
-                        media_type = item.get("media-type", "")
-
-                        if href:
-                            logger.debug("Found EPUB 2 cover item: %s", href)
-
-                            # Resolve href relative to OPF location
-                            opf_dir = str(Path(opf_path).parent)
-                            if opf_dir and opf_dir != ".":
-                                cover_path = f"{opf_dir}/{href}"
-                            else:
-                                cover_path = href
-
-                            # Read cover image
-                            try:
-                                cover_bytes = zf.read(cover_path)
-                                extension = CoverExtractor._get_image_extension(
-                                    media_type, href
-                                )
-                                logger.debug(
-                                    "Successfully extracted EPUB 2 cover: %s (%d bytes)",
-                                    cover_path,
-                                    len(cover_bytes),
-                                )
-                                return (cover_bytes, extension)
-                            except KeyError:
-                                logger.warning("Cover file not found in ZIP: %s", cover_path)
-                                return None
-
-                logger.debug("Manifest item with id=%s not found", cover_id)
-                return None
-
-        except ET.ParseError as e:
-            logger.warning("Failed to parse OPF for EPUB 2 cover: %s", e)
+        if scan.meta_cover_id is None:
+            logger.debug("No usable <meta name='cover'> found")
             return None
-        except Exception as e:
-            logger.warning("Unexpected error extracting EPUB 2 cover: %s", e)
+
+        item = scan.id_to_item.get(scan.meta_cover_id)
+        if item is None or not item[0]:
+            logger.debug("Manifest item with id=%s not found", scan.meta_cover_id)
             return None
 
+        href, media_type = item
+        logger.debug("Found EPUB 2 cover item: %s", href)
+        return CoverExtractor._read_cover(zf, opf_dir, href, media_type)
+
     @staticmethod
-    def _try_filename_heuristic(epub: EPUBBook) -> tuple[bytes, str] | None:
+    def _try_filename_heuristic(
+        zf: zipfile.ZipFile, scan: ManifestScan, opf_dir: str
+    ) -> tuple[bytes | bytearray, str] | None:
         """Try finding image with 'cover' in filename.
 
-        Searches for images in the manifest with filenames containing "cover"
+        Uses images in the manifest with filenames containing "cover"
         (case-insensitive). Examples: "cover.jpg", "Cover.png", "images/cover-front.jpeg"
+        Conventional names such as "cover.jpg" are tried before other matches.
 
         Args:
-            epub: EPUBBook instance.
+            zf: Open EPUB archive.
+            scan: Manifest scan of the OPF.
+            opf_dir: Directory of the OPF file within the archive.
 
         Returns:
             Tuple of (image_bytes, extension) or None.
         """
         logger.debug("Trying filename heuristic for cover")
 
-        try:
-            with zipfile.ZipFile(epub.filepath) as zf:
-                # Parse OPF
-                opf_path = epub._get_opf_path()
-                opf_data = zf.read(opf_path)
-                opf_root = ET.fromstring(opf_data)
-
-                # Find manifest
-                manifest = opf_root.find(".//{*}manifest")
-                if manifest is None:
-                    logger.debug("No manifest found in OPF")
-                    return None
-
-                # Search for image items with "cover" in filename
-                for item in manifest.findall(".//{*}item"):
-                    media_type = item.get("media-type", "")
-                    href = item.get("href", "")
-
-                    # Check if it's an image
-                    if media_type.startswith("image/"):
-                        # Check if filename contains "cover" (case-insensitive)
-                        filename = Path(href).name.lower()
-                        if "cover" in filename:
-                            logger.debug("Found cover candidate by filename: %s", href)
-
-                            # Resolve href relative to OPF location
-                            opf_dir = str(Path(opf_path).parent)
-                            if opf_dir and opf_dir != ".":
-                                cover_path = f"{opf_dir}/{href}"
-                            else:
-                                cover_path = href
-
-                            # Read cover image
-                            try:
-                                cover_bytes = zf.read(cover_path)
-                                extension = CoverExtractor._get_image_extension(
-                                    media_type, href
-                                )
-                                logger.debug(
-                                    "Successfully extracted cover via filename heuristic: %s (%d bytes)",
-                                    cover_path,
-                                    len(cover_bytes),
-                                )
-                                return (cover_bytes, extension)
-                            except KeyError:
-                                logger.warning("Cover file not found in ZIP: %s", cover_path)
-                                continue  # Try next candidate
-
-                logger.debug("No image with 'cover' in filename found")
-                return None
+        candidates = itertools.chain(
+            scan.exact_cover_candidates, scan.filename_cover_candidates
+        )
+        for href, media_type in candidates:
+            logger.debug("Found cover candidate by filename: %s", href)
+            cover = CoverExtractor._read_cover(zf, opf_dir, href, media_type)
+            if cover:
+                return cover
 
-        except ET.ParseError as e:
-            logger.warning("Failed to parse OPF for filename heuristic: %s", e)
-            return None
-        except Exception as e:
-            logger.warning("Unexpected error in filename heuristic: %s", e)
-            return None
+        logger.debug("No image with 'cover' in filename found")
+        return None
 
     @staticmethod
     def _get_image_extension(media_type: str, href: str) -> str:
         """Get file extension from media-type or href.
 
         Args:
-            media_type: MIME type (e.g., "image/jpeg").
+            media_type: Lowercase MIME type (e.g., "image/jpeg"). Callers
+                canonicalize the case when reading the manifest.
             href: File path (e.g., "images/cover.jpg").
 
         Returns:
             File extension without dot (e.g., "jpg", "png").
             Defaults to "jpg" if cannot be determined.
         """
+        # Fast path: nearly all covers are JPEG or PNG
+        if media_type == "image/jpeg":
+            return "jpg"
+        if media_type == "image/png":
+            return "png"
+
         # Try to get extension from media-type first
-        if media_type:
-            type_to_ext = {
-                "image/jpeg": "jpg",
-                "image/jpg": "jpg",
-                "image/png": "png",
-                "image/gif": "gif",
-                "image/webp": "webp",
-                "image/svg+xml": "svg",
-            }
-            ext = type_to_ext.get(media_type.lower())
-            if ext:
-                return ext
-
-        # Fall back to extension from href
-        if href:
-            path_ext = Path(href).suffix.lstrip(".")
-            if path_ext:
-                # Normalize common variants
-                if path_ext.lower() in ["jpeg", "jpg"]:
-                    return "jpg"
-                return path_ext.lower()
+        ext = _MEDIA_TYPE_TO_EXT.get(media_type)
+        if ext:
+            return ext
+
+        # Fall back to extension from href's filename
+        stem, dot, path_ext = href.rpartition("/")[2].rpartition(".")
+        if dot and stem and path_ext:
+            path_ext = path_ext.lower()
+            # Normalize common variants
+            if path_ext in _JPEG_EXTENSIONS:
+                return "jpg"
+            return path_ext
 
         # Default to jpg if cannot determine
         logger.debug(
@@ -353,3 +679,33 @@ class CoverExtractor:
             href,
         )
         return "jpg"
+
+
+@functools.lru_cache(maxsize=128)
+def _load_scan(epub_path: str, mtime_ns: int) -> tuple[str, ManifestScan]:
+    """Validate an EPUB and scan its OPF, memoized per file version.
+
+    The modification time is part of the cache key so a rewritten file is
+    rescanned. Failures are not cached.
+
+    Args:
+        epub_path: Path to EPUB file.
+        mtime_ns: Modification time of the file in nanoseconds.
+
+    Returns:
+        Tuple of (opf_path, manifest_scan).
+
+    Raises:
+        FileNotFoundError: If EPUB doesn't exist.
+        InvalidEPUBError: If file is not a valid EPUB.
+        CorruptedEPUBError: If the EPUB structure is malformed.
+        ET.ParseError: If the OPF cannot be parsed.
+    """
+    # Create EPUBBook instance to validate and locate the OPF
+    epub = EPUBBook(epub_path)
+    opf_path = epub._get_opf_path()
+
+    with _ZIP_POOL.open(epub_path, mtime_ns) as zf:
+        scan = CoverExtractor._scan_manifest(zf.read(opf_path))
+
+    return opf_path, scan
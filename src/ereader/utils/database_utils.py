@@ -4,13 +4,43 @@ This module provides helper functions for database path resolution and
 initialization, following platform-specific conventions for user data storage.
 """
 
+import functools
+import hashlib
 import logging
+import os
 import sys
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+def _platform_data_dir() -> Path:
+    """Resolve the platform-specific user data directory.
+
+    Built with os.path string joins and converted to a Path once at the end.
+
+    Returns:
+        Directory holding the library database and other user data.
+    """
+    home = os.path.expanduser("~")
+
+    if sys.platform == "darwin":  # macOS
+        data_dir = os.path.join(home, "Library", "Application Support", "EReader")
+    elif sys.platform == "win32":  # Windows
+        # Fallback to the home directory if APPDATA not set (rare)
+        data_dir = os.path.join(os.getenv("APPDATA") or home, "EReader")
+    else:  # Linux and other Unix-like systems
+        data_dir = os.path.join(home, ".local", "share", "ereader")
+
+    return Path(data_dir)
+
+
+# The platform and home directory cannot change while the app runs, so the
+# platform branch is evaluated once at import
+_PLATFORM_DATA_DIR = _platform_data_dir()
+
+
+@functools.lru_cache(maxsize=1)
 def get_library_db_path() -> Path:
     """Get platform-appropriate path for library database.
 
@@ -19,7 +49,8 @@ def get_library_db_path() -> Path:
     - Windows: %APPDATA%/EReader/library.db
     - Linux: ~/.local/share/ereader/library.db
 
-    The directory is created if it doesn't exist.
+    The directory is created on the first call; the result is cached, so
+    later calls return without touching the filesystem.
 
     Returns:
         Absolute path to the library database file.
@@ -27,33 +58,51 @@ def get_library_db_path() -> Path:
     Raises:
         OSError: If the directory cannot be created.
     """
-    logger.debug("Determining library database path for platform: %s", sys.platform)
-
-    if sys.platform == "darwin":  # macOS
-        data_dir = Path.home() / "Library" / "Application Support" / "EReader"
-    elif sys.platform == "win32":  # Windows
-        import os
-
-        appdata = os.getenv("APPDATA")
-        if appdata:
-            data_dir = Path(appdata) / "EReader"
-        else:
-            # Fallback if APPDATA not set (rare)
-            data_dir = Path.home() / "EReader"
-    else:  # Linux and other Unix-like systems
-        data_dir = Path.home() / ".local" / "share" / "ereader"
-
-    logger.debug("Library data directory: %s", data_dir)
-
     # Create directory if it doesn't exist
     try:
-        data_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug("Ensured data directory exists: %s", data_dir)
+        _PLATFORM_DATA_DIR.mkdir(parents=True, exist_ok=True)
     except OSError as e:
-        logger.error("Failed to create data directory %s: %s", data_dir, e)
+        logger.error("Failed to create data directory %s: %s", _PLATFORM_DATA_DIR, e)
         raise
 
-    db_path = data_dir / "library.db"
+    db_path = _PLATFORM_DATA_DIR / "library.db"
     logger.debug("Library database path: %s", db_path)
-
     return db_path
+
+
+def get_cover_cache_path(epub_path: str | Path, mtime_ns: int) -> Path:
+    """Get the persistent cover cache file for one version of an EPUB.
+
+    Cached covers live in a covers/ directory next to the library database,
+    named after a hash of the EPUB path and its modification time so a
+    rewritten file never hits a stale entry. The covers directory is not
+    created here; writers create it on first store.
+
+    Args:
+        epub_path: Path to the EPUB file.
+        mtime_ns: Modification time of the EPUB in nanoseconds.
+
+    Returns:
+        Absolute path of the cache file (which may not exist).
+
+    Raises:
+        OSError: If the data directory cannot be created.
+    """
+    digest = hashlib.sha1(str(epub_path).encode("utf-8")).hexdigest()
+    return get_library_db_path().parent / "covers" / f"{digest}-{mtime_ns}.cover"
+
+
+def get_chapter_cache_dir() -> Path:
+    """Get the directory for the on-disk chapter cache.
+
+    Spilled chapters live in cache/chapters/ next to the library database,
+    so they follow the same per-platform data directory. The directory is
+    not created here; the disk cache creates it on first write.
+
+    Returns:
+        Absolute path of the chapter cache directory.
+
+    Raises:
+        OSError: If the data directory cannot be created.
+    """
+    return get_library_db_path().parent / "cache" / "chapters"
@@ -4,6 +4,7 @@ This module provides the ImageCache class for caching processed images
 with memory-based LRU eviction.
 """
 
+import itertools
 import logging
 import sys
 import threading
@@ -13,6 +14,28 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# A cached image: either a ready string (e.g. a base64 data URL) or the raw
+# encoded image bytes with their MIME type, base64-encoded by the caller on use
+CachedImage = str | tuple[bytes | memoryview, str]
+
+# Header size of a compact ASCII str on CPython (sys.getsizeof("")). String
+# values are base64 data URLs, so len(value) + this is their exact footprint.
+_STR_OVERHEAD_BYTES = sys.getsizeof("")
+
+def _entry_size(value: CachedImage) -> int:
+    """Estimate the memory held by a cached value without sys.getsizeof.
+
+    Args:
+        value: ASCII string, or (image_bytes, mime_type) tuple.
+
+    Returns:
+        Approximate size in bytes.
+    """
+    if isinstance(value, str):
+        return len(value) + _STR_OVERHEAD_BYTES
+    image_data, mime_type = value
+    return len(image_data) + len(mime_type)
+
 
 class ImageCache:
     """LRU cache for processed images with memory-based eviction.
@@ -21,16 +44,20 @@ class ImageCache:
     evicts based on total memory usage. This is more appropriate for
     images which can vary significantly in size.
 
-    Thread-safe: All operations are protected by an RLock to allow
-    concurrent access from UI thread and background loader threads.
+    Values are either strings or (image_bytes, mime_type) tuples. Storing raw
+    bytes and base64-encoding on use takes about 25% less memory than
+    storing the encoded data URL, so the same budget holds a third more images.
+
+    Thread-safe: Mutations are protected by an RLock to allow concurrent
+    access from UI thread and background loader threads; get runs without it.
 
     Args:
         max_memory_mb: Maximum memory budget in MB (default: 50)
 
     Example:
         >>> cache = ImageCache(max_memory_mb=50)
-        >>> cache.set("images/photo.jpg", base64_data)
-        >>> data = cache.get("images/photo.jpg")
+        >>> cache.set("images/photo.jpg", (jpeg_bytes, "image/jpeg"))
+        >>> image_data, mime_type = cache.get("images/photo.jpg")
         >>> print(cache.stats())
         {'size': 1, 'memory_mb': 2.5, 'max_memory_mb': 50, ...}
     """
@@ -47,12 +74,18 @@ class ImageCache:
         if max_memory_mb <= 0:
             raise ValueError("max_memory_mb must be positive")
 
-        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache: OrderedDict[str, CachedImage] = OrderedDict()
         self._max_memory_bytes = max_memory_mb * 1024 * 1024
         self._max_memory_mb = max_memory_mb
         self._current_memory_bytes = 0
-        self._hits = 0
-        self._misses = 0
+        # Lookup counters: next() on an itertools.count is atomic under the
+        # GIL, so get() counts without the lock. They live as long as the
+        # cache; clear() records baselines instead of replacing them.
+        self._hit_counter = itertools.count()
+        self._miss_counter = itertools.count()
+        self._counter_reads = {self._hit_counter: 0, self._miss_counter: 0}
+        self._hits_baseline = 0
+        self._misses_baseline = 0
         self._evictions = 0
         self._last_eviction_time: float | None = None
         self._creation_time = time.time()
@@ -60,35 +93,38 @@ class ImageCache:
 
         logger.info("ImageCache initialized with max_memory=%d MB", max_memory_mb)
 
-    def get(self, key: str) -> str | None:
+    def get(self, key: str) -> CachedImage | None:
         """Retrieve cached image data by key.
 
         If key exists, marks it as recently used by moving to end.
 
-        Thread-safe: Protected by lock for concurrent access.
+        Thread-safe: Runs without the lock. A single OrderedDict.get or
+        move_to_end is atomic under the GIL, and so is counting the hit or
+        miss on an itertools.count.
 
         Args:
             key: Cache key (typically the resource path like "images/photo.jpg")
 
         Returns:
-            Cached base64-encoded image string, or None if not found
+            Cached string or (image_bytes, mime_type) tuple, or None if not found
         """
-        with self._lock:
-            if key in self._cache:
-                self._cache.move_to_end(key)  # Mark as recently used
-                self._hits += 1
-                logger.debug(
-                    "ImageCache HIT: %s (hits=%d, misses=%d)", key, self._hits, self._misses
-                )
-                return self._cache[key]
-
-            self._misses += 1
-            logger.debug(
-                "ImageCache MISS: %s (hits=%d, misses=%d)", key, self._hits, self._misses
-            )
-            return None
+        value = self._cache.get(key)
 
-    def set(self, key: str, value: str) -> None:
+        if value is not None:
+            try:
+                self._cache.move_to_end(key)  # Mark as recently used
+            except KeyError:
+                pass  # Evicted since the lookup; the value is still valid
+            next(self._hit_counter)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("ImageCache HIT: %s", key)
+        else:
+            next(self._miss_counter)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("ImageCache MISS: %s", key)
+        return value
+
+    def set(self, key: str, value: CachedImage) -> None:
         """Store image data in cache.
 
         Evicts least recently used items if necessary to stay within memory budget.
@@ -97,16 +133,16 @@ class ImageCache:
 
         Args:
             key: Cache key (typically the resource path)
-            value: Base64-encoded image data string
+            value: String (e.g. base64 data URL) or (image_bytes, mime_type) tuple
         """
         with self._lock:
             # Calculate size of the new value
-            value_size = sys.getsizeof(value)
+            value_size = _entry_size(value)
 
             if key in self._cache:
                 # Update existing entry - first remove old size, then add new
                 old_value = self._cache[key]
-                old_size = sys.getsizeof(old_value)
+                old_size = _entry_size(old_value)
                 self._current_memory_bytes -= old_size
                 self._cache.move_to_end(key)
                 self._cache[key] = value
@@ -115,30 +151,89 @@ class ImageCache:
             else:
                 # Add new entry - evict old entries if needed
                 # Evict until we have space for the new value
+                evicted = 0
+                evicted_bytes = 0
                 while self._current_memory_bytes + value_size > self._max_memory_bytes and self._cache:
                     evicted_key, evicted_value = self._cache.popitem(last=False)
-                    evicted_size = sys.getsizeof(evicted_value)
+                    evicted_size = _entry_size(evicted_value)
                     self._current_memory_bytes -= evicted_size
-                    self._evictions += 1
+                    evicted += 1
+                    evicted_bytes += evicted_size
+                    logger.debug("ImageCache EVICTION: %s (size: %d bytes)", evicted_key, evicted_size)
+
+                if evicted:
+                    self._evictions += evicted
                     self._last_eviction_time = time.time()
-                    logger.info(
-                        "ImageCache EVICTION: %s (size: %d bytes, memory: %.2f/%.2f MB)",
-                        evicted_key,
-                        evicted_size,
-                        self._current_memory_bytes / (1024 * 1024),
-                        self._max_memory_mb,
-                    )
+                    # One summary line per set() rather than per entry, so
+                    # cache thrash does not flood the INFO log
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "ImageCache EVICTION: %d entries, %d bytes (memory: %.2f/%.2f MB)",
+                            evicted,
+                            evicted_bytes,
+                            self._current_memory_bytes / (1024 * 1024),
+                            self._max_memory_mb,
+                        )
 
                 # Add new entry
                 self._cache[key] = value
                 self._current_memory_bytes += value_size
-                logger.debug(
-                    "ImageCache SET: %s (size: %d bytes, memory: %.2f/%.2f MB)",
-                    key,
-                    value_size,
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "ImageCache SET: %s (size: %d bytes, memory: %.2f/%.2f MB)",
+                        key,
+                        value_size,
+                        self._current_memory_bytes / (1024 * 1024),
+                        self._max_memory_mb,
+                    )
+
+    def evict_to(self, target_bytes: int) -> int:
+        """Evict least recently used images until memory is within target.
+
+        Used to shed memory under pressure without resetting statistics.
+
+        Thread-safe: Protected by lock for concurrent access.
+
+        Args:
+            target_bytes: Memory usage in bytes to shrink down to.
+
+        Returns:
+            Number of images evicted.
+        """
+        with self._lock:
+            evicted = 0
+            while self._current_memory_bytes > target_bytes and self._cache:
+                _, evicted_value = self._cache.popitem(last=False)
+                self._current_memory_bytes -= _entry_size(evicted_value)
+                evicted += 1
+
+            if evicted:
+                self._evictions += evicted
+                self._last_eviction_time = time.time()
+                logger.info(
+                    "ImageCache SHRINK: evicted %d entries (memory: %.2f/%.2f MB)",
+                    evicted,
                     self._current_memory_bytes / (1024 * 1024),
                     self._max_memory_mb,
                 )
+            return evicted
+
+    def _read_counter(self, counter: itertools.count) -> int:
+        """Return the number of lookups recorded by a lookup counter.
+
+        itertools.count cannot be read without advancing it, so this calls
+        next() (an increment) and subtracts the increments made by earlier
+        reads. All reads must go through here. Caller must hold the lock.
+
+        Args:
+            counter: _hit_counter or _miss_counter.
+
+        Returns:
+            Lookups counted since the cache was created.
+        """
+        value = next(counter) - self._counter_reads[counter]
+        self._counter_reads[counter] += 1
+        return value
 
     def clear(self) -> None:
         """Remove all cached entries.
@@ -150,8 +245,8 @@ class ImageCache:
             memory_mb = self._current_memory_bytes / (1024 * 1024)
             self._cache.clear()
             self._current_memory_bytes = 0
-            self._hits = 0
-            self._misses = 0
+            self._hits_baseline = self._read_counter(self._hit_counter)
+            self._misses_baseline = self._read_counter(self._miss_counter)
             self._evictions = 0
             logger.info(
                 "ImageCache CLEARED: removed %d entries (%.2f MB freed)", size, memory_mb
@@ -177,8 +272,10 @@ class ImageCache:
             - cache_age_seconds: Seconds since cache creation
         """
         with self._lock:
-            total = self._hits + self._misses
-            hit_rate = (self._hits / total * 100) if total > 0 else 0.0
+            hits = self._read_counter(self._hit_counter) - self._hits_baseline
+            misses = self._read_counter(self._miss_counter) - self._misses_baseline
+            total = hits + misses
+            hit_rate = (hits / total * 100) if total > 0 else 0.0
 
             memory_mb = self._current_memory_bytes / (1024 * 1024)
             memory_utilization = (
@@ -204,8 +301,8 @@ class ImageCache:
                 "size": len(self._cache),
                 "memory_mb": memory_mb,
                 "max_memory_mb": self._max_memory_mb,
-                "hits": self._hits,
-                "misses": self._misses,
+                "hits": hits,
+                "misses": misses,
                 "evictions": self._evictions,
                 "hit_rate": hit_rate,
                 "memory_utilization": memory_utilization,
@@ -4,7 +4,11 @@ This module provides the MemoryMonitor class for tracking process memory usage
 and alerting when configurable thresholds are exceeded.
 """
 
+import bisect
 import logging
+import os
+import sys
+import threading
 import time
 from typing import Any
 
@@ -13,15 +17,37 @@ import psutil
 logger = logging.getLogger(__name__)
 
 
+def _open_statm() -> int | None:
+    """Open /proc/self/statm for repeated reads.
+
+    Returns:
+        File descriptor on Linux, or None where /proc is unavailable.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return os.open("/proc/self/statm", os.O_RDONLY)
+    except OSError:
+        return None
+
+
 class MemoryMonitor:
     """Monitor memory usage and alert when thresholds exceeded.
 
-    Tracks the current process's memory usage using psutil and logs warnings
+    Tracks the current process's memory usage and logs warnings
     when memory exceeds configured thresholds. Also logs informational milestones
     at regular intervals (100MB, 125MB, 150MB, etc.).
 
+    On Linux RSS is read with os.pread from a /proc/self/statm descriptor kept
+    open for the monitor's lifetime; other platforms use psutil. Readings are
+    cached for a short TTL so frequent polling does not read on every call;
+    refresh() forces a read. start_background() instead samples on a daemon
+    thread, leaving get_current_usage() a plain read of the last sample.
+
     Args:
         threshold_mb: Memory threshold in MB. Warnings logged when exceeded (default: 150).
+        cache_ttl_s: Seconds a reading is reused before RSS is read again
+                     (default: 0.25). 0 reads on every call.
 
     Example:
         >>> monitor = MemoryMonitor(threshold_mb=150)
@@ -31,23 +57,34 @@ class MemoryMonitor:
         ...     print("Memory threshold exceeded!")
     """
 
-    # Memory milestones for INFO logging (in MB)
-    _MILESTONES = [100, 125, 150, 175, 200, 250, 300]
+    # Memory milestones for INFO logging (in MB), sorted for bisect
+    _MILESTONES = (100, 125, 150, 175, 200, 250, 300)
 
-    def __init__(self, threshold_mb: int = 150) -> None:
+    def __init__(self, threshold_mb: int = 150, cache_ttl_s: float = 0.25) -> None:
         """Initialize the memory monitor.
 
         Args:
             threshold_mb: Memory threshold in MB (must be positive).
+            cache_ttl_s: Reading cache lifetime in seconds (must not be negative).
 
         Raises:
-            ValueError: If threshold_mb is not positive.
+            ValueError: If threshold_mb is not positive or cache_ttl_s is negative.
         """
         if threshold_mb <= 0:
             raise ValueError("threshold_mb must be positive")
+        if cache_ttl_s < 0:
+            raise ValueError("cache_ttl_s must not be negative")
 
         self._threshold_mb = threshold_mb
         self._process = psutil.Process()
+        self._cache_ttl_s = cache_ttl_s
+        self._cached_usage_mb = 0.0
+        self._cached_at = float("-inf")  # Monotonic time of the cached reading
+        self._statm_fd = _open_statm()
+        self._lock = threading.Lock()  # Guards the cached reading
+        self._sampler: threading.Thread | None = None
+        self._stop_sampling = threading.Event()
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if self._statm_fd is not None else 0
         self._last_milestone_logged: int | None = None
         self._threshold_exceeded = False
         self._creation_time = time.time()
@@ -57,16 +94,90 @@ class MemoryMonitor:
     def get_current_usage(self) -> float:
         """Get current process memory usage in MB.
 
+        Returns the cached reading if it is younger than the cache TTL, or
+        the latest background sample while start_background() is active.
+
         Returns:
             Current memory usage in megabytes (RSS - Resident Set Size).
         """
-        # Get memory info and convert bytes to MB
-        mem_info = self._process.memory_info()
-        usage_mb = mem_info.rss / (1024 * 1024)
+        with self._lock:
+            if (
+                self._sampler is not None
+                or time.monotonic() - self._cached_at < self._cache_ttl_s
+            ):
+                return self._cached_usage_mb
+        return self.refresh()
+
+    def refresh(self) -> float:
+        """Read process memory usage now, bypassing and updating the cache.
+
+        Returns:
+            Current memory usage in megabytes (RSS - Resident Set Size).
+        """
+        if self._statm_fd is not None:
+            # statm fields are in pages: size resident shared text lib data dt
+            rss_bytes = int(os.pread(self._statm_fd, 128, 0).split()[1]) * self._page_size
+        else:
+            rss_bytes = self._process.memory_info().rss
+        usage_mb = rss_bytes / (1024 * 1024)
 
-        logger.debug("Current memory usage: %.2f MB", usage_mb)
+        with self._lock:
+            self._cached_usage_mb = usage_mb
+            self._cached_at = time.monotonic()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current memory usage: %.2f MB", usage_mb)
         return usage_mb
 
+    def start_background(self, interval: float = 1.0) -> None:
+        """Sample memory usage on a daemon thread every interval seconds.
+
+        Takes one sample immediately so get_current_usage() never returns a
+        stale value from before the sampler started. Does nothing if the
+        sampler is already running.
+
+        Args:
+            interval: Seconds between samples (must be positive).
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if self._sampler is not None:
+            return
+
+        self.refresh()
+        self._stop_sampling.clear()
+        sampler = threading.Thread(
+            target=self._sample_loop, args=(interval,), name="MemoryMonitor", daemon=True
+        )
+        with self._lock:
+            self._sampler = sampler
+        sampler.start()
+        logger.debug("MemoryMonitor background sampling every %.2f s", interval)
+
+    def stop_background(self) -> None:
+        """Stop the background sampler and wait for its thread to exit."""
+        with self._lock:
+            sampler, self._sampler = self._sampler, None
+        if sampler is None:
+            return
+        self._stop_sampling.set()
+        sampler.join()
+        logger.debug("MemoryMonitor background sampling stopped")
+
+    def _sample_loop(self, interval: float) -> None:
+        """Refresh the cached reading until stop_background() is called."""
+        while not self._stop_sampling.wait(interval):
+            self.refresh()
+
+    def __del__(self) -> None:
+        """Close the /proc/self/statm descriptor, if one was opened."""
+        statm_fd = getattr(self, "_statm_fd", None)
+        if statm_fd is not None:
+            os.close(statm_fd)
+
     def check_threshold(self) -> bool:
         """Check if memory exceeds threshold.
 
@@ -114,15 +225,13 @@ class MemoryMonitor:
             current_usage: Current memory usage in MB.
         """
         # Find the highest milestone we've passed
-        current_milestone = None
-        for milestone in self._MILESTONES:
-            if current_usage >= milestone:
-                current_milestone = milestone
-            else:
-                break  # Milestones are sorted, no need to check further
+        index = bisect.bisect_right(self._MILESTONES, current_usage) - 1
+        if index < 0:
+            return
+        current_milestone = self._MILESTONES[index]
 
         # Log if we've reached a new milestone
-        if current_milestone is not None and current_milestone != self._last_milestone_logged:
+        if current_milestone != self._last_milestone_logged:
             logger.info("Memory milestone reached: %d MB (current: %.1f MB)", current_milestone, current_usage)
             self._last_milestone_logged = current_milestone
 
@@ -145,8 +254,11 @@ class MemoryMonitor:
             - age_seconds: Time since monitor creation
             - last_milestone: Last milestone logged (or None)
         """
+        # Let psutil serve every process field read here from one /proc scan
+        with self._process.oneshot():
+            current_usage_mb = self.get_current_usage()
         return {
-            "current_usage_mb": self.get_current_usage(),
+            "current_usage_mb": current_usage_mb,
             "threshold_mb": self._threshold_mb,
             "threshold_exceeded": self._threshold_exceeded,
             "age_seconds": self.get_age_seconds(),
@@ -5,16 +5,19 @@ of page boundaries based on viewport height and content height. It converts
 between scroll positions and page numbers for discrete page navigation.
 """
 
+import bisect
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PageBreaks:
     """Page break information for a chapter.
 
+    Immutable once calculated; the page count is computed once on creation.
+
     Attributes:
         viewport_height: Height of the visible viewport in pixels.
         content_height: Total height of the chapter content in pixels.
@@ -24,6 +27,11 @@ class PageBreaks:
     viewport_height: int
     content_height: int
     page_breaks: list[int]
+    _num_pages: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the number of pages (last break is the end marker)."""
+        object.__setattr__(self, "_num_pages", len(self.page_breaks) - 1)
 
     @property
     def page_count(self) -> int:
@@ -50,6 +58,11 @@ class PaginationEngine:
     def __init__(self) -> None:
         """Initialize the pagination engine."""
         self._page_breaks: PageBreaks | None = None
+        # Flattened copies of the current PageBreaks for the per-scroll-tick
+        # accessors; None/empty until the first calculation
+        self._viewport_height: int | None = None
+        self._breaks_list: list[int] = []
+        self._max_page = -1
 
     def calculate_page_breaks(
         self, content_height: int, viewport_height: int
@@ -67,13 +80,9 @@ class PaginationEngine:
         Returns:
             PageBreaks object with calculated break positions.
         """
-        page_breaks = [0]  # First page always starts at 0
-        current_pos = 0
-
-        # Calculate page breaks at viewport_height intervals
-        while current_pos + viewport_height < content_height:
-            current_pos += viewport_height
-            page_breaks.append(current_pos)
+        # Calculate page breaks at viewport_height intervals (range builds the
+        # list in C); the first page always starts at 0, even for empty content
+        page_breaks = list(range(0, content_height, viewport_height)) or [0]
 
         # Last page break at content height (end marker)
         if page_breaks[-1] != content_height:
@@ -84,6 +93,9 @@ class PaginationEngine:
             content_height=content_height,
             page_breaks=page_breaks,
         )
+        self._viewport_height = viewport_height
+        self._breaks_list = page_breaks
+        self._max_page = len(page_breaks) - 2
 
         logger.debug(
             "Calculated %d pages (viewport: %dpx, content: %dpx)",
@@ -124,13 +136,11 @@ class PaginationEngine:
         if scroll_position >= max_scroll:
             return len(self._page_breaks.page_breaks) - 2
 
-        # Find the page this scroll position belongs to
-        for i in range(len(self._page_breaks.page_breaks) - 1):
-            if scroll_position < self._page_breaks.page_breaks[i + 1]:
-                return i
-
-        # Fallback: last page (scroll position at or beyond last break)
-        return len(self._page_breaks.page_breaks) - 2
+        # Find the page this scroll position belongs to: the last break at or
+        # before it (page_breaks is sorted), clamped to the valid page range
+        page_breaks = self._page_breaks.page_breaks
+        page = bisect.bisect_right(page_breaks, scroll_position) - 1
+        return max(0, min(page, len(page_breaks) - 2))
 
     def get_scroll_position_for_page(self, page_number: int) -> int:
         """Get scroll position for a specific page number.
@@ -145,19 +155,15 @@ class PaginationEngine:
             Scroll position in pixels. Returns 0 if no calculation done
             or if page number is invalid.
         """
-        if self._page_breaks is None:
-            return 0
-
-        # Validate page number
         # Valid pages: 0 to (page_count - 2) because last break is end marker
-        max_page = len(self._page_breaks.page_breaks) - 2
-        if page_number < 0 or page_number > max_page:
+        if 0 <= page_number <= self._max_page:
+            return self._breaks_list[page_number]
+
+        if self._breaks_list:
             logger.warning(
-                "Invalid page number: %d (valid range: 0-%d)", page_number, max_page
+                "Invalid page number: %d (valid range: 0-%d)", page_number, self._max_page
             )
-            return 0
-
-        return self._page_breaks.page_breaks[page_number]
+        return 0
 
     def get_page_count(self) -> int:
         """Get total number of pages.
@@ -169,7 +175,7 @@ class PaginationEngine:
             return 0
 
         # Page count = number of breaks - 1 (last break is end marker)
-        return self._page_breaks.page_count - 1
+        return self._page_breaks._num_pages
 
     def needs_recalculation(self, viewport_height: int) -> bool:
         """Check if page breaks need recalculation due to resize.
@@ -183,7 +189,5 @@ class PaginationEngine:
         Returns:
             True if recalculation needed (no calculation done or height changed).
         """
-        if self._page_breaks is None:
-            return True
-
-        return self._page_breaks.viewport_height != viewport_height
+        # Never equal to a height before the first calculation
+        return self._viewport_height != viewport_height
@@ -5,8 +5,9 @@ reading positions, navigation mode preferences, and other user settings.
 """
 
 import logging
+import time
 
-from PyQt6.QtCore import QSettings
+from PyQt6.QtCore import QCoreApplication, QSettings, QTimer
 
 from ereader.models.reading_position import NavigationMode, ReadingPosition
 
@@ -21,11 +22,46 @@ class ReaderSettings:
     Uses QSettings for cross-platform persistence.
     """
 
+    # Minimum seconds between syncs of the backing store
+    _SYNC_INTERVAL_S = 2.0
+
     def __init__(self) -> None:
         """Initialize ReaderSettings with QSettings instance."""
         self._settings = QSettings("EReader", "EReader")
+        self._last_sync = float("-inf")  # Monotonic time of the last sync()
+
+        # Flushes writes that arrived too soon after the last sync. Timers
+        # need an application; without one, QSettings syncs on destruction.
+        self._sync_timer: QTimer | None = None
+        app = QCoreApplication.instance()
+        if app is not None:
+            self._sync_timer = QTimer()
+            self._sync_timer.setSingleShot(True)
+            self._sync_timer.timeout.connect(self.flush)
+            app.aboutToQuit.connect(self.flush)
+
         logger.debug("Initialized ReaderSettings")
 
+    def flush(self) -> None:
+        """Write all pending changes to the backing store now."""
+        if self._sync_timer is not None:
+            self._sync_timer.stop()
+        self._settings.sync()
+        self._last_sync = time.monotonic()
+
+    def _schedule_sync(self) -> None:
+        """Sync now, or once _SYNC_INTERVAL_S has passed since the last sync.
+
+        Syncing rewrites the whole backing store, so bursts of writes (a
+        position save per chapter or page turn) are coalesced into at most
+        one sync per interval, with the last write always flushed.
+        """
+        wait_s = self._last_sync + self._SYNC_INTERVAL_S - time.monotonic()
+        if wait_s <= 0:
+            self.flush()
+        elif self._sync_timer is not None and not self._sync_timer.isActive():
+            self._sync_timer.start(int(wait_s * 1000) + 1)
+
     def save_reading_position(
         self, book_path: str, position: ReadingPosition
     ) -> None:
@@ -35,20 +71,11 @@ class ReaderSettings:
             book_path: Absolute path to the book file.
             position: ReadingPosition to save.
         """
-        # Use book path as unique key
-        key_prefix = f"books/{book_path}"
-
-        self._settings.setValue(f"{key_prefix}/chapter_index", position.chapter_index)
-        self._settings.setValue(f"{key_prefix}/page_number", position.page_number)
-        self._settings.setValue(f"{key_prefix}/scroll_offset", position.scroll_offset)
-        self._settings.setValue(f"{key_prefix}/mode", position.mode.value)
-
-        # Sync to disk immediately
-        self._settings.sync()
+        # One packed value per book: a single map entry to write and sync
+        self._settings.setValue(f"books/{book_path}", self._pack_position(position))
+        self._schedule_sync()
 
-        logger.debug(
-            f"Saved reading position for {book_path}: {position}"
-        )
+        logger.debug("Saved reading position for %s: %s", book_path, position)
 
     def load_reading_position(self, book_path: str) -> ReadingPosition | None:
         """Load reading position for a specific book.
@@ -59,30 +86,83 @@ class ReaderSettings:
         Returns:
             ReadingPosition if found, None if no saved position exists.
         """
-        key_prefix = f"books/{book_path}"
-
-        # Check if position exists
-        if not self._settings.contains(f"{key_prefix}/chapter_index"):
-            logger.debug(f"No saved position found for {book_path}")
+        key = f"books/{book_path}"
+
+        packed = self._settings.value(key)
+        if packed is not None:
+            position = self._unpack_position(packed)
+        elif self._settings.contains(f"{key}/chapter_index"):
+            position = self._migrate_legacy_position(book_path)
+        else:
+            logger.debug("No saved position found for %s", book_path)
             return None
 
-        # Load position data
-        chapter_index = self._settings.value(f"{key_prefix}/chapter_index", type=int)
-        page_number = self._settings.value(f"{key_prefix}/page_number", type=int)
-        scroll_offset = self._settings.value(f"{key_prefix}/scroll_offset", type=int)
-        mode_value = self._settings.value(f"{key_prefix}/mode", type=str)
+        logger.debug("Loaded reading position for %s: %s", book_path, position)
+        return position
 
-        # Convert mode string back to enum
-        mode = NavigationMode(mode_value)
+    @staticmethod
+    def _pack_position(position: ReadingPosition) -> list[int | str]:
+        """Pack a reading position into one QSettings value.
 
+        Args:
+            position: ReadingPosition to pack.
+
+        Returns:
+            [chapter_index, page_number, scroll_offset, mode value].
+        """
+        return [
+            position.chapter_index,
+            position.page_number,
+            position.scroll_offset,
+            position.mode.value,
+        ]
+
+    @staticmethod
+    def _unpack_position(packed: list[int | str]) -> ReadingPosition:
+        """Rebuild a reading position from a packed QSettings value.
+
+        INI-backed settings return every list item as a string, so the
+        numbers are converted explicitly.
+
+        Args:
+            packed: Value stored by _pack_position.
+
+        Returns:
+            The unpacked ReadingPosition.
+        """
+        chapter_index, page_number, scroll_offset, mode_value = packed
+        return ReadingPosition(
+            chapter_index=int(chapter_index),
+            page_number=int(page_number),
+            scroll_offset=int(scroll_offset),
+            mode=NavigationMode(str(mode_value)),
+        )
+
+    def _migrate_legacy_position(self, book_path: str) -> ReadingPosition:
+        """Convert a position saved as four separate keys to the packed form.
+
+        Earlier versions stored books/<path>/chapter_index, page_number,
+        scroll_offset and mode individually.
+
+        Args:
+            book_path: Absolute path to the book file.
+
+        Returns:
+            The migrated ReadingPosition.
+        """
+        self._settings.beginGroup(f"books/{book_path}")
         position = ReadingPosition(
-            chapter_index=chapter_index,
-            page_number=page_number,
-            scroll_offset=scroll_offset,
-            mode=mode,
+            chapter_index=self._settings.value("chapter_index", type=int),
+            page_number=self._settings.value("page_number", type=int),
+            scroll_offset=self._settings.value("scroll_offset", type=int),
+            mode=NavigationMode(self._settings.value("mode", type=str)),
         )
+        for name in ("chapter_index", "page_number", "scroll_offset", "mode"):
+            self._settings.remove(name)
+        self._settings.endGroup()
 
-        logger.debug(f"Loaded reading position for {book_path}: {position}")
+        self._settings.setValue(f"books/{book_path}", self._pack_position(position))
+        logger.debug("Migrated legacy reading position for %s", book_path)
         return position
 
     def get_default_navigation_mode(self) -> NavigationMode:
@@ -95,7 +175,7 @@ class ReaderSettings:
             "preferences/default_navigation_mode", NavigationMode.SCROLL.value, type=str
         )
         mode = NavigationMode(mode_value)
-        logger.debug(f"Default navigation mode: {mode.value}")
+        logger.debug("Default navigation mode: %s", mode.value)
         return mode
 
     def set_default_navigation_mode(self, mode: NavigationMode) -> None:
@@ -105,8 +185,8 @@ class ReaderSettings:
             mode: NavigationMode to set as default.
         """
         self._settings.setValue("preferences/default_navigation_mode", mode.value)
-        self._settings.sync()
-        logger.debug(f"Set default navigation mode to: {mode.value}")
+        self._schedule_sync()
+        logger.debug("Set default navigation mode to: %s", mode.value)
 
     def clear_all_settings(self) -> None:
         """Clear all saved settings (for testing purposes).
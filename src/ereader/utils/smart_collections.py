@@ -7,6 +7,10 @@ Collection objects.
 """
 
 import logging
+import time
+import weakref
+from collections.abc import Callable
+from typing import TypeVar
 
 from ereader.models.book_metadata import BookMetadata
 from ereader.models.library_database import LibraryRepository
@@ -14,6 +18,47 @@ from ereader.models.library_filter import LibraryFilter
 
 logger = logging.getLogger(__name__)
 
+# Window for the Recent Reads smart collection
+RECENT_READS_DAYS = 30
+
+# How long a computed collection may be reused if the library has not changed
+_CACHE_TTL_S = 2.0
+
+_T = TypeVar("_T")
+
+# Per-repository results: key -> (computed at, books_version, result).
+# Weak keys so a closed repository's entries go away with it.
+_cache: weakref.WeakKeyDictionary[
+    LibraryRepository, dict[str, tuple[float, int, object]]
+] = weakref.WeakKeyDictionary()
+
+
+def _cached(repository: LibraryRepository, key: str, compute: Callable[[], _T]) -> _T:
+    """Return a memoized smart collection result, recomputing when stale.
+
+    A result is reused while it is younger than _CACHE_TTL_S and no book has
+    been written through the repository since it was computed.
+
+    Args:
+        repository: Library repository the result was computed from.
+        key: Name of the collection.
+        compute: Callable producing a fresh result.
+
+    Returns:
+        The cached or freshly computed result.
+    """
+    now = time.monotonic()
+    version = repository.books_version
+    entries = _cache.setdefault(repository, {})
+    hit = entries.get(key)
+    if hit is not None and hit[1] == version and now - hit[0] < _CACHE_TTL_S:
+        logger.debug("Smart collection cache hit: %s", key)
+        return hit[2]  # type: ignore[return-value]
+
+    result = compute()
+    entries[key] = (now, version, result)
+    return result
+
 
 class SmartCollections:
     """Definitions for built-in smart collections.
@@ -40,11 +85,13 @@ class SmartCollections:
         logger.debug("Fetching Recent Reads smart collection")
 
         filter_obj = LibraryFilter(
-            days_since_opened=30,
+            days_since_opened=RECENT_READS_DAYS,
             sort_by="recent"
         )
 
-        books = repository.filter_books(filter_obj)
+        books = list(
+            _cached(repository, "recent_reads", lambda: repository.filter_books(filter_obj))
+        )
         logger.debug("Recent Reads found %d books", len(books))
         return books
 
@@ -65,7 +112,9 @@ class SmartCollections:
             sort_by="recent"
         )
 
-        books = repository.filter_books(filter_obj)
+        books = list(
+            _cached(repository, "currently_reading", lambda: repository.filter_books(filter_obj))
+        )
         logger.debug("Currently Reading found %d books", len(books))
         return books
 
@@ -86,7 +135,9 @@ class SmartCollections:
             sort_by="added_date_desc"
         )
 
-        books = repository.filter_books(filter_obj)
+        books = list(
+            _cached(repository, "to_read", lambda: repository.filter_books(filter_obj))
+        )
         logger.debug("To Read found %d books", len(books))
         return books
 
@@ -123,6 +174,79 @@ class SmartCollections:
         logger.debug("Fetching All Books")
 
         filter_obj = LibraryFilter(sort_by="recent")
-        books = repository.filter_books(filter_obj)
+        books = list(
+            _cached(repository, "all_books", lambda: repository.filter_books(filter_obj))
+        )
         logger.debug("All Books found %d books", len(books))
         return books
+
+    @staticmethod
+    def all_smart_collections(repository: LibraryRepository) -> dict[str, list[BookMetadata]]:
+        """Get every smart collection from a single database query.
+
+        Equivalent to calling recent_reads, currently_reading, to_read,
+        favorites and all_books individually, but the sidebar refreshes them
+        together, so the books are fetched once and bucketed in one pass.
+
+        Args:
+            repository: Library repository instance.
+
+        Returns:
+            Dict with keys "recent_reads", "currently_reading", "to_read",
+            "favorites" and "all_books", each sorted like its method.
+        """
+        logger.debug("Fetching all smart collections")
+
+        collections = _cached(
+            repository,
+            "all_smart_collections",
+            lambda: SmartCollections._bucket_books(repository),
+        )
+        return {name: list(books) for name, books in collections.items()}
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop every memoized smart collection result.
+
+        Writes made through a LibraryRepository invalidate its results
+        automatically; call this after changing the database by other means.
+        """
+        _cache.clear()
+
+    @staticmethod
+    def _bucket_books(repository: LibraryRepository) -> dict[str, list[BookMetadata]]:
+        """Query the books once and sort them into every smart collection.
+
+        Args:
+            repository: Library repository instance.
+
+        Returns:
+            Dict of collection name to books, as all_smart_collections.
+        """
+        collections: dict[str, list[BookMetadata]] = {
+            "recent_reads": [],
+            "currently_reading": [],
+            "to_read": [],
+            "favorites": [],  # Placeholder, see favorites()
+            "all_books": [],
+        }
+        # Rows arrive in "recent" order, which every bucket but To Read uses
+        for book, opened_recently in repository.get_books_with_recency(RECENT_READS_DAYS):
+            collections["all_books"].append(book)
+            if opened_recently:
+                collections["recent_reads"].append(book)
+            if book.status == "reading":
+                collections["currently_reading"].append(book)
+            elif book.status == "not_started":
+                collections["to_read"].append(book)
+
+        collections["to_read"].sort(key=lambda book: book.added_date, reverse=True)
+
+        logger.debug(
+            "Smart collections: %d recent, %d reading, %d to read, %d total",
+            len(collections["recent_reads"]),
+            len(collections["currently_reading"]),
+            len(collections["to_read"]),
+            len(collections["all_books"]),
+        )
+        return collections
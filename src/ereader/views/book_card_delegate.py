@@ -4,11 +4,24 @@ This module provides the BookCardDelegate class that paints book cards
 with cover placeholders, titles, authors, and progress indicators.
 """
 
+import functools
 import logging
-from pathlib import Path
+import os
+import time
 
 from PyQt6.QtCore import QRect, QSize, Qt
-from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap
+from PyQt6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+    QStaticText,
+    QTextOption,
+    QTransform,
+)
 from PyQt6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
 
 from ereader.models.book_metadata import BookMetadata
@@ -43,6 +56,50 @@ class BookCardDelegate(QStyledItemDelegate):
     PROGRESS_BAR_MARGIN_TOP = 5
     PADDING = 10
 
+    # Offsets from the card's top-left corner, derived from the layout above
+    # so paint only adds the card position
+    COVER_OFFSET_X = (CARD_WIDTH - COVER_WIDTH) // 2
+    TITLE_Y_REL = COVER_MARGIN_TOP + COVER_HEIGHT + TITLE_MARGIN_TOP
+    AUTHOR_Y_REL = TITLE_Y_REL + 32  # Title box holds approx 2 lines
+    PROGRESS_Y_REL = AUTHOR_Y_REL + 18
+    PROGRESS_TEXT_Y_REL = PROGRESS_Y_REL + PROGRESS_BAR_HEIGHT + 3
+    INNER_WIDTH = CARD_WIDTH - 2 * PADDING
+
+    # Colors, parsed once rather than on every paint
+    _SELECTED_BACKGROUND = QColor("#E3F2FD")
+    _SELECTED_BORDER = QColor("#2196F3")
+    _HOVER_BACKGROUND = QColor("#F5F5F5")
+    _TITLE_COLOR = QColor("#212121")
+    _SECONDARY_TEXT_COLOR = QColor("#757575")
+    _TRACK_COLOR = QColor("#E0E0E0")
+    _PROGRESS_COLOR = QColor("#4CAF50")
+    _BORDER_COLOR = QColor("#BDBDBD")
+    _SELECTED_BORDER_PEN = QPen(_SELECTED_BORDER, 2)
+    _BORDER_PEN = QPen(_BORDER_COLOR, 1)
+
+    # Fonts and metrics, created on first paint (they need a QGuiApplication)
+    _title_font: QFont | None = None
+    _title_metrics: QFontMetrics | None = None
+    _small_font: QFont | None = None
+    _small_metrics: QFontMetrics | None = None
+    _icon_font: QFont | None = None
+
+    # Cover path -> (monotonic time checked, mtime_ns or None if missing)
+    _stat_cache: dict[str, tuple[float, int | None]] = {}
+    _STAT_TTL_S = 30.0
+
+    @classmethod
+    def _ensure_fonts(cls) -> None:
+        """Create the shared card fonts and their metrics once."""
+        if cls._title_font is not None:
+            return
+        cls._title_font = QFont("Arial", 10, QFont.Weight.Bold)
+        cls._title_metrics = QFontMetrics(cls._title_font)
+        # Author and progress text share one font
+        cls._small_font = QFont("Arial", 8)
+        cls._small_metrics = QFontMetrics(cls._small_font)
+        cls._icon_font = QFont("Arial", 48)
+
     def paint(
         self, painter: QPainter, option: QStyleOptionViewItem, index
     ) -> None:
@@ -60,136 +117,98 @@ class BookCardDelegate(QStyledItemDelegate):
             super().paint(painter, option, index)
             return
 
+        self._ensure_fonts()
         painter.save()
 
         # Draw selection/hover background
         if option.state & QStyle.StateFlag.State_Selected:
             # Selected state: light blue background
-            painter.fillRect(option.rect, QColor("#E3F2FD"))
+            painter.fillRect(option.rect, self._SELECTED_BACKGROUND)
             # Draw selection border
-            painter.setPen(QPen(QColor("#2196F3"), 2))
+            painter.setPen(self._SELECTED_BORDER_PEN)
             painter.drawRect(option.rect.adjusted(1, 1, -1, -1))
         elif option.state & QStyle.StateFlag.State_MouseOver:
             # Hover state: very light gray background
-            painter.fillRect(option.rect, QColor("#F5F5F5"))
+            painter.fillRect(option.rect, self._HOVER_BACKGROUND)
 
-        # Calculate layout
-        card_rect = option.rect
-        center_x = card_rect.center().x()
+        # Calculate layout (cards are uniformly CARD_WIDTH x CARD_HEIGHT)
+        card_left = option.rect.left()
+        card_top = option.rect.top()
+        inner_left = card_left + self.PADDING
 
         # 1. Draw cover (centered)
-        cover_x = center_x - self.COVER_WIDTH // 2
-        cover_y = card_rect.top() + self.COVER_MARGIN_TOP
-        cover_rect = QRect(cover_x, cover_y, self.COVER_WIDTH, self.COVER_HEIGHT)
+        cover_rect = QRect(
+            card_left + self.COVER_OFFSET_X,
+            card_top + self.COVER_MARGIN_TOP,
+            self.COVER_WIDTH,
+            self.COVER_HEIGHT,
+        )
 
         # Try to load actual cover if available
-        if book.cover_path and Path(book.cover_path).exists():
-            # Load cover image
-            pixmap = QPixmap(book.cover_path)
-            if not pixmap.isNull():
-                # Scale to fit cover_rect while preserving aspect ratio
-                scaled = pixmap.scaled(
-                    cover_rect.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                # Center in cover_rect
-                x = cover_rect.x() + (cover_rect.width() - scaled.width()) // 2
-                y = cover_rect.y() + (cover_rect.height() - scaled.height()) // 2
-                painter.drawPixmap(x, y, scaled)
-            else:
-                # Pixmap failed to load, use placeholder
-                self._draw_placeholder_cover(painter, cover_rect)
+        scaled = None
+        if book.cover_path:
+            scaled = self._load_scaled_cover(book.cover_path, cover_rect.size())
+        if scaled is not None:
+            # Center in cover_rect
+            x = cover_rect.x() + (self.COVER_WIDTH - scaled.width()) // 2
+            y = cover_rect.y() + (self.COVER_HEIGHT - scaled.height()) // 2
+            painter.drawPixmap(x, y, scaled)
         else:
-            # No cover or file missing, use placeholder
+            # No cover, file missing or failed to load: use placeholder
             self._draw_placeholder_cover(painter, cover_rect)
 
         # 2. Draw title (max 2 lines, centered)
-        title_y = cover_y + self.COVER_HEIGHT + self.TITLE_MARGIN_TOP
-        title_rect = QRect(
-            card_rect.left() + self.PADDING,
-            title_y,
-            card_rect.width() - 2 * self.PADDING,
-            30,  # Approx 2 lines
-        )
-
-        title_font = QFont("Arial", 10, QFont.Weight.Bold)
-        painter.setFont(title_font)
-        painter.setPen(QColor("#212121"))
+        painter.setFont(self._title_font)
+        painter.setPen(self._TITLE_COLOR)
 
         # Truncate title if too long (max 2 lines)
-        fm = QFontMetrics(title_font)
-        title = book.title
-        elided_title = fm.elidedText(title, Qt.TextElideMode.ElideRight, title_rect.width() * 2)
-        painter.drawText(
-            title_rect,
-            Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter | Qt.TextFlag.TextWordWrap,
-            elided_title,
+        elided_title = self._elided_text(book.title, self.INNER_WIDTH * 2, title=True)
+        painter.drawStaticText(
+            inner_left,
+            card_top + self.TITLE_Y_REL,
+            self._static_text(elided_title, self.INNER_WIDTH, title=True),
         )
 
         # 3. Draw author (1 line, centered)
-        author_y = title_y + 32
-        author_rect = QRect(
-            card_rect.left() + self.PADDING,
-            author_y,
-            card_rect.width() - 2 * self.PADDING,
-            15,
-        )
-
-        author_font = QFont("Arial", 8)
-        painter.setFont(author_font)
-        painter.setPen(QColor("#757575"))
+        painter.setFont(self._small_font)
+        painter.setPen(self._SECONDARY_TEXT_COLOR)
 
         author = book.author if book.author else "Unknown Author"
-        fm_author = QFontMetrics(author_font)
-        elided_author = fm_author.elidedText(
-            author, Qt.TextElideMode.ElideRight, author_rect.width()
+        elided_author = self._elided_text(author, self.INNER_WIDTH, title=False)
+        painter.drawStaticText(
+            inner_left,
+            card_top + self.AUTHOR_Y_REL,
+            self._static_text(elided_author, self.INNER_WIDTH, title=False),
         )
-        painter.drawText(author_rect, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter, elided_author)
 
         # 4. Draw progress bar
-        progress_y = author_y + 18
-        progress_bar_width = card_rect.width() - 2 * self.PADDING
+        progress_y = card_top + self.PROGRESS_Y_REL
         progress_bar_rect = QRect(
-            card_rect.left() + self.PADDING,
-            progress_y,
-            progress_bar_width,
-            self.PROGRESS_BAR_HEIGHT,
+            inner_left, progress_y, self.INNER_WIDTH, self.PROGRESS_BAR_HEIGHT
         )
 
         # Background (gray)
-        painter.fillRect(progress_bar_rect, QColor("#E0E0E0"))
+        painter.fillRect(progress_bar_rect, self._TRACK_COLOR)
 
         # Progress fill (blue)
-        progress_width = int(progress_bar_width * (book.reading_progress / 100.0))
+        progress_width = int(self.INNER_WIDTH * (book.reading_progress / 100.0))
         if progress_width > 0:
             progress_fill_rect = QRect(
-                progress_bar_rect.left(),
-                progress_bar_rect.top(),
-                progress_width,
-                self.PROGRESS_BAR_HEIGHT,
+                inner_left, progress_y, progress_width, self.PROGRESS_BAR_HEIGHT
             )
-            painter.fillRect(progress_fill_rect, QColor("#4CAF50"))  # Green for progress
+            painter.fillRect(progress_fill_rect, self._PROGRESS_COLOR)  # Green for progress
 
         # Progress border
-        painter.setPen(QPen(QColor("#BDBDBD"), 1))
+        painter.setPen(self._BORDER_PEN)
         painter.drawRect(progress_bar_rect)
 
-        # 5. Draw progress percentage
-        progress_text_y = progress_y + self.PROGRESS_BAR_HEIGHT + 3
-        progress_text_rect = QRect(
-            card_rect.left() + self.PADDING,
-            progress_text_y,
-            card_rect.width() - 2 * self.PADDING,
-            12,
-        )
-
-        progress_font = QFont("Arial", 8)
-        painter.setFont(progress_font)
-        painter.setPen(QColor("#757575"))
+        # 5. Draw progress percentage (same font as the author)
+        painter.setPen(self._SECONDARY_TEXT_COLOR)
         progress_text = f"{book.reading_progress:.0f}%"
-        painter.drawText(
-            progress_text_rect, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter, progress_text
+        painter.drawStaticText(
+            inner_left,
+            card_top + self.PROGRESS_TEXT_Y_REL,
+            self._static_text(progress_text, self.INNER_WIDTH, title=False),
         )
 
         painter.restore()
@@ -208,6 +227,117 @@ class BookCardDelegate(QStyledItemDelegate):
         """
         return QSize(self.CARD_WIDTH, self.CARD_HEIGHT)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _elided_text(text: str, width: int, title: bool) -> str:
+        """Elide text to width with the shared card fonts, memoized.
+
+        The same titles and authors are elided on every repaint while
+        scrolling; keying on the text itself means edited metadata simply
+        misses the cache instead of needing invalidation.
+
+        Args:
+            text: Title or author text.
+            width: Available width in pixels.
+            title: True for the title font, False for the author/progress font.
+
+        Returns:
+            Text elided with a trailing ellipsis if it does not fit.
+        """
+        metrics = BookCardDelegate._title_metrics if title else BookCardDelegate._small_metrics
+        return metrics.elidedText(text, Qt.TextElideMode.ElideRight, width)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _static_text(text: str, width: int, title: bool) -> QStaticText:
+        """Lay out card text once so repaints reuse the glyph positions.
+
+        Text is centered horizontally in width; title text wraps onto
+        further lines, author and progress text stay on one line.
+
+        Args:
+            text: Already elided text to draw.
+            width: Width of the text box in pixels.
+            title: True for the title font, False for the author/progress font.
+
+        Returns:
+            Prepared static text to draw at the box's top-left corner.
+        """
+        option = QTextOption(Qt.AlignmentFlag.AlignHCenter)
+        option.setWrapMode(
+            QTextOption.WrapMode.WordWrap if title else QTextOption.WrapMode.NoWrap
+        )
+
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.setTextWidth(width)
+        static_text.setTextOption(option)
+        static_text.prepare(
+            QTransform(),
+            BookCardDelegate._title_font if title else BookCardDelegate._small_font,
+        )
+        return static_text
+
+    @classmethod
+    def _load_scaled_cover(cls, cover_path: str, size: QSize) -> QPixmap | None:
+        """Load a cover scaled to fit size, reusing it across repaints.
+
+        Scrolling repaints the same visible cards many times a second, so the
+        decoded and smoothly scaled pixmap is kept in Qt's global QPixmapCache.
+        The key includes the file's mtime, so a replaced cover is reloaded.
+
+        Args:
+            cover_path: Path to the cover image file.
+            size: Size to fit the cover into, preserving aspect ratio.
+
+        Returns:
+            Scaled cover pixmap, or None if the file is missing or unreadable.
+        """
+        mtime_ns = cls._cover_mtime_ns(cover_path)
+        if mtime_ns is None:
+            return None
+
+        key = f"book-cover:{cover_path}:{mtime_ns}:{size.width()}x{size.height()}"
+        scaled = QPixmapCache.find(key)
+        if scaled is not None:
+            return scaled
+
+        pixmap = QPixmap(cover_path)
+        if pixmap.isNull():
+            logger.debug("Failed to load cover image: %s", cover_path)
+            return None
+
+        # Scale to fit while preserving aspect ratio
+        scaled = pixmap.scaled(
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        QPixmapCache.insert(key, scaled)
+        return scaled
+
+    @classmethod
+    def _cover_mtime_ns(cls, cover_path: str) -> int | None:
+        """Return a cover file's mtime, stat-ing it at most every _STAT_TTL_S.
+
+        Args:
+            cover_path: Path to the cover image file.
+
+        Returns:
+            Modification time in nanoseconds, or None if the file is missing.
+        """
+        now = time.monotonic()
+        cached = cls._stat_cache.get(cover_path)
+        if cached is not None and now - cached[0] < cls._STAT_TTL_S:
+            return cached[1]
+
+        try:
+            mtime_ns = os.stat(cover_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        cls._stat_cache[cover_path] = (now, mtime_ns)
+        return mtime_ns
+
     def _draw_placeholder_cover(self, painter: QPainter, cover_rect: QRect) -> None:
         """Draw placeholder cover (gray box with book icon).
 
@@ -218,12 +348,11 @@ class BookCardDelegate(QStyledItemDelegate):
             cover_rect: Rectangle to draw placeholder in.
         """
         # Draw cover background (light gray rectangle)
-        painter.fillRect(cover_rect, QColor("#E0E0E0"))
-        painter.setPen(QPen(QColor("#BDBDBD"), 1))
+        painter.fillRect(cover_rect, self._TRACK_COLOR)
+        painter.setPen(self._BORDER_PEN)
         painter.drawRect(cover_rect)
 
         # Draw book icon (📕 emoji or simple representation)
-        painter.setPen(QColor("#757575"))
-        icon_font = QFont("Arial", 48)
-        painter.setFont(icon_font)
+        painter.setPen(self._SECONDARY_TEXT_COLOR)
+        painter.setFont(self._icon_font)
         painter.drawText(cover_rect, Qt.AlignmentFlag.AlignCenter, "📕")
@@ -5,30 +5,66 @@ metadata, file information, reading progress, and library information in a
 structured layout.
 """
 
+import functools
 import logging
+import os
 from datetime import datetime
-from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QGroupBox,
+    QHBoxLayout,
     QLabel,
     QProgressBar,
     QVBoxLayout,
+    QWidget,
 )
 
 from ereader.models.book_metadata import BookMetadata
 
 logger = logging.getLogger(__name__)
 
+# Display text for each reading status code
+_STATUS_DISPLAY = {
+    "not_started": "Not Started",
+    "reading": "Reading",
+    "finished": "Finished",
+}
+
+# Month names for _format_datetime, indexed by month - 1
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+class _FileCheckSignals(QObject):
+    """Carries the result of a background file existence check."""
+
+    finished = pyqtSignal(str, bool)  # file path, exists
+
 
 class BookDetailsDialog(QDialog):
     """Modal dialog displaying comprehensive book information.
 
     Shows read-only book metadata, file information, reading progress,
-    and library information in a structured layout.
+    and library information in a structured layout. The widgets are built
+    once; update_book() refills them, so one dialog can be reused for every
+    book instead of rebuilding the widget tree on each open. Only the header
+    is built in __init__; the info sections follow from the event loop, so
+    the dialog can appear before they are laid out.
     """
 
     def __init__(self, book: BookMetadata, parent=None) -> None:
@@ -44,11 +80,53 @@ class BookDetailsDialog(QDialog):
         self.setWindowTitle("Book Details")
         self.setMinimumSize(500, 600)
 
-        self._book = book
+        self._sections_built = False
         self._init_ui()
+        self.update_book(book)
+        QTimer.singleShot(0, self._finish_ui)
 
         logger.debug("BookDetailsDialog initialized")
 
+    def update_book(self, book: BookMetadata) -> None:
+        """Show a book's details in the existing widgets.
+
+        Args:
+            book: BookMetadata to display.
+        """
+        self._book = book
+
+        # Header
+        author = book.author if book.author else "Unknown Author"
+        self._header_label.setText(
+            f"<h2>{book.title}</h2><p style='font-size: 14px; color: gray;'>by {author}</p>"
+        )
+
+        if self._sections_built:
+            self._fill_sections()
+
+    def _fill_sections(self) -> None:
+        """Show the current book in the info sections."""
+        book = self._book
+
+        # File information
+        self._location_value.setText(book.file_path)
+        self._missing_file_label.hide()
+        self._start_file_check()
+        self._size_value.setText(self._format_file_size(book.file_size))
+
+        # Reading progress
+        self._progress_bar.setValue(int(book.reading_progress))
+        self._progress_bar.setFormat(f"{book.reading_progress:.1f}% complete")
+        self._chapter_value.setText(f"Chapter {book.current_chapter_index + 1}")
+        self._status_value.setText(self._get_status_display(book.status))
+
+        # Library information
+        self._added_value.setText(self._format_datetime(book.added_date))
+        if book.last_opened_date:
+            self._opened_value.setText(self._format_datetime(book.last_opened_date))
+        else:
+            self._opened_value.setText("Never")
+
     def _init_ui(self) -> None:
         """Initialize UI layout."""
         # Main layout
@@ -59,17 +137,7 @@ class BookDetailsDialog(QDialog):
         header_widget = self._create_header()
         layout.addWidget(header_widget)
 
-        # File information section
-        file_info_group = self._create_file_info_section()
-        layout.addWidget(file_info_group)
-
-        # Reading progress section
-        progress_group = self._create_progress_section()
-        layout.addWidget(progress_group)
-
-        # Library information section
-        library_group = self._create_library_info_section()
-        layout.addWidget(library_group)
+        # Info sections are inserted here by _finish_ui
 
         # Add stretch to push buttons to bottom
         layout.addStretch()
@@ -79,6 +147,28 @@ class BookDetailsDialog(QDialog):
         button_box.accepted.connect(self.accept)
         layout.addWidget(button_box)
 
+        self._main_layout = layout
+
+    def _finish_ui(self) -> None:
+        """Build the info sections below the header and fill them."""
+        if self._sections_built:
+            return
+
+        # File information, reading progress and library information,
+        # above the stretch that keeps the buttons at the bottom
+        for position, group in enumerate(
+            (
+                self._create_file_info_section(),
+                self._create_progress_section(),
+                self._create_library_info_section(),
+            ),
+            start=1,
+        ):
+            self._main_layout.insertWidget(position, group)
+
+        self._sections_built = True
+        self._fill_sections()
+
     def _create_header(self) -> QLabel:
         """Create header section with title and author.
 
@@ -87,16 +177,10 @@ class BookDetailsDialog(QDialog):
         """
         # For MVP, we'll use a simple text header
         # Phase 3 will add cover image display
-        header_label = QLabel(self)
-
-        title = self._book.title
-        author = self._book.author if self._book.author else "Unknown Author"
-
-        header_text = f"<h2>{title}</h2><p style='font-size: 14px; color: gray;'>by {author}</p>"
-        header_label.setText(header_text)
-        header_label.setWordWrap(True)
+        self._header_label = QLabel(self)
+        self._header_label.setWordWrap(True)
 
-        return header_label
+        return self._header_label
 
     def _create_file_info_section(self) -> QGroupBox:
         """Create file information section.
@@ -108,28 +192,22 @@ class BookDetailsDialog(QDialog):
         layout = QVBoxLayout()
 
         # Location
-        file_path = Path(self._book.file_path)
-        location_label = QLabel(f"<b>Location:</b> {self._book.file_path}")
-        location_label.setWordWrap(True)
-        location_label.setTextInteractionFlags(
-            Qt.TextInteractionFlag.TextSelectableByMouse
-        )
-        layout.addWidget(location_label)
+        row, self._location_value = self._kv_label("Location:", selectable=True)
+        layout.addWidget(row)
 
-        # Check if file exists
-        if not file_path.exists():
-            warning_label = QLabel("⚠️ <i>File not found at location</i>")
-            warning_label.setStyleSheet("color: #d32f2f;")
-            layout.addWidget(warning_label)
+        # Shown once the background existence check finds the file missing
+        self._missing_file_label = QLabel("⚠️ <i>File not found at location</i>")
+        self._missing_file_label.setStyleSheet("color: #d32f2f;")
+        self._missing_file_label.hide()
+        layout.addWidget(self._missing_file_label)
 
         # Size
-        size_str = self._format_file_size(self._book.file_size)
-        size_label = QLabel(f"<b>Size:</b> {size_str}")
-        layout.addWidget(size_label)
+        row, self._size_value = self._kv_label("Size:")
+        layout.addWidget(row)
 
         # Format
-        format_label = QLabel("<b>Format:</b> EPUB")
-        layout.addWidget(format_label)
+        row, _ = self._kv_label("Format:", "EPUB")
+        layout.addWidget(row)
 
         group.setLayout(layout)
         return group
@@ -144,21 +222,16 @@ class BookDetailsDialog(QDialog):
         layout = QVBoxLayout()
 
         # Progress bar
-        progress_bar = QProgressBar()
-        progress_bar.setValue(int(self._book.reading_progress))
-        progress_bar.setFormat(f"{self._book.reading_progress:.1f}% complete")
-        layout.addWidget(progress_bar)
+        self._progress_bar = QProgressBar()
+        layout.addWidget(self._progress_bar)
 
         # Current chapter
-        chapter_label = QLabel(
-            f"<b>Current Chapter:</b> Chapter {self._book.current_chapter_index + 1}"
-        )
-        layout.addWidget(chapter_label)
+        row, self._chapter_value = self._kv_label("Current Chapter:")
+        layout.addWidget(row)
 
         # Status
-        status_display = self._get_status_display(self._book.status)
-        status_label = QLabel(f"<b>Status:</b> {status_display}")
-        layout.addWidget(status_label)
+        row, self._status_value = self._kv_label("Status:")
+        layout.addWidget(row)
 
         group.setLayout(layout)
         return group
@@ -173,27 +246,94 @@ class BookDetailsDialog(QDialog):
         layout = QVBoxLayout()
 
         # Added date
-        added_str = self._format_datetime(self._book.added_date)
-        added_label = QLabel(f"<b>Added:</b> {added_str}")
-        layout.addWidget(added_label)
+        row, self._added_value = self._kv_label("Added:")
+        layout.addWidget(row)
 
         # Last opened
-        if self._book.last_opened_date:
-            opened_str = self._format_datetime(self._book.last_opened_date)
-        else:
-            opened_str = "Never"
-        opened_label = QLabel(f"<b>Last Opened:</b> {opened_str}")
-        layout.addWidget(opened_label)
+        row, self._opened_value = self._kv_label("Last Opened:")
+        layout.addWidget(row)
 
         # Collections (placeholder for Phase 2 collections integration)
-        collections_label = QLabel("<b>Collections:</b> None")
-        layout.addWidget(collections_label)
+        row, _ = self._kv_label("Collections:", "None")
+        layout.addWidget(row)
 
         group.setLayout(layout)
         return group
 
-    def _format_file_size(self, size_bytes: int | None) -> str:
-        """Format file size in human-readable format.
+    @staticmethod
+    def _kv_label(
+        key: str, value: str = "", selectable: bool = False
+    ) -> tuple[QWidget, QLabel]:
+        """Create a bold key and plain value pair.
+
+        Both labels are plain text, so Qt does not build a rich-text
+        document per label just to bold the key (and book metadata is never
+        interpreted as markup).
+
+        Args:
+            key: Field name, shown in bold.
+            value: Initial field value.
+            selectable: Wrap the value and let the user select it with the mouse.
+
+        Returns:
+            Widget holding the key and value labels side by side, and the
+            value label so it can be updated.
+        """
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+
+        key_label = QLabel(key)
+        key_label.setTextFormat(Qt.TextFormat.PlainText)
+        font = key_label.font()
+        font.setBold(True)
+        key_label.setFont(font)
+        row_layout.addWidget(key_label, alignment=Qt.AlignmentFlag.AlignTop)
+
+        value_label = QLabel(value)
+        value_label.setTextFormat(Qt.TextFormat.PlainText)
+        if selectable:
+            value_label.setWordWrap(True)
+            value_label.setTextInteractionFlags(
+                Qt.TextInteractionFlag.TextSelectableByMouse
+            )
+        row_layout.addWidget(value_label, stretch=1)
+
+        return row, value_label
+
+    def _start_file_check(self) -> None:
+        """Check that the book file exists without blocking the GUI thread.
+
+        Books on network mounts or sleeping drives can take hundreds of ms
+        to stat, so the check runs on the global thread pool and the result
+        arrives through a queued signal. The worker's closure owns the signal
+        carrier, so it outlives the dialog if the dialog closes first.
+        """
+        signals = _FileCheckSignals()
+        signals.finished.connect(self._on_file_checked)
+        file_path = self._book.file_path
+        QThreadPool.globalInstance().start(
+            lambda: signals.finished.emit(file_path, os.path.isfile(file_path))
+        )
+
+    def _on_file_checked(self, file_path: str, exists: bool) -> None:
+        """Show the missing-file warning if the check failed.
+
+        Args:
+            file_path: Path that was checked.
+            exists: Whether the file was found.
+        """
+        # Ignore a late result for a book the dialog no longer shows
+        if file_path != self._book.file_path:
+            return
+        if not exists:
+            logger.debug("Book file not found: %s", file_path)
+            self._missing_file_label.show()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_file_size(size_bytes: int | None) -> str:
+        """Format file size in human-readable format, memoized.
 
         Args:
             size_bytes: File size in bytes.
@@ -213,8 +353,15 @@ class BookDetailsDialog(QDialog):
             mb = size_bytes / (1024 * 1024)
             return f"{mb:.1f} MB"
 
-    def _format_datetime(self, dt: datetime) -> str:
-        """Format datetime in user-friendly format.
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_datetime(dt: datetime) -> str:
+        """Format datetime in user-friendly format, memoized.
+
+        Reopening the dialog for a book formats the same dates again;
+        datetimes are hashable, so equal values share one cache entry.
+        Built from the fields directly rather than with strftime, which
+        also avoids the glibc-only "%-I" directive.
 
         Args:
             dt: Datetime to format.
@@ -222,10 +369,16 @@ class BookDetailsDialog(QDialog):
         Returns:
             Formatted datetime string (e.g., "December 14, 2025 at 3:42 PM").
         """
-        return dt.strftime("%B %d, %Y at %-I:%M %p")
+        hour = dt.hour % 12 or 12
+        am_pm = "AM" if dt.hour < 12 else "PM"
+        return (
+            f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year} at {hour}:{dt.minute:02d} {am_pm}"
+        )
 
-    def _get_status_display(self, status: str) -> str:
-        """Get display-friendly status text.
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _get_status_display(status: str) -> str:
+        """Get display-friendly status text, memoized.
 
         Args:
             status: Status code ("not_started", "reading", "finished").
@@ -233,9 +386,4 @@ class BookDetailsDialog(QDialog):
         Returns:
             Display-friendly status string.
         """
-        status_map = {
-            "not_started": "Not Started",
-            "reading": "Reading",
-            "finished": "Finished"
-        }
-        return status_map.get(status, status.title())
+        return _STATUS_DISPLAY.get(status) or status.title()
@@ -5,9 +5,11 @@ responsive grid layout using Qt's model/view architecture.
 """
 
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 from PyQt6.QtCore import pyqtSignal
-from PyQt6.QtGui import QContextMenuEvent
+from PyQt6.QtGui import QAction, QContextMenuEvent
 from PyQt6.QtWidgets import QListView, QMenu
 
 from ereader.models.book_metadata import BookMetadata
@@ -75,10 +77,16 @@ class BookGridWidget(QListView):
         self._model = BookListModel([], self)
         self.setModel(self._model)
 
+        # Books held back by bulk_update(), applied when the outermost one exits
+        self._bulk_depth = 0
+        self._pending_books: list[BookMetadata] | None = None
+
         # Connect signals
         self.clicked.connect(self._on_clicked)
         self.activated.connect(self._on_activated)  # Double-click or Enter
 
+        self._build_context_menu()
+
         logger.debug("BookGridWidget initialized")
 
     def set_books(self, books: list[BookMetadata]) -> None:
@@ -87,9 +95,52 @@ class BookGridWidget(QListView):
         Args:
             books: List of books to display in the grid.
         """
+        if self._bulk_depth:
+            logger.debug("Deferring %d books until bulk update ends", len(books))
+            self._pending_books = list(books)
+            return
+
         logger.debug("Setting %d books in grid", len(books))
         self._model.set_books(books)
 
+    def update_book(self, book: BookMetadata) -> bool:
+        """Refresh a single book that is already in the grid.
+
+        Args:
+            book: Updated metadata for the book.
+
+        Returns:
+            True if the book was shown in the grid, False otherwise.
+        """
+        if self._pending_books is not None:
+            for row, pending in enumerate(self._pending_books):
+                if pending.id == book.id:
+                    self._pending_books[row] = book
+                    return True
+            return False
+        return self._model.update_book(book)
+
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """Collapse repeated set_books() calls into one grid update.
+
+        Inside the block set_books() only remembers the latest list, so a
+        caller that refreshes the grid after every import batch pays for one
+        relayout and repaint when the block exits. Blocks may nest; the list
+        is applied when the outermost one exits, even if it raises.
+
+        Yields:
+            None.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0 and self._pending_books is not None:
+                books, self._pending_books = self._pending_books, None
+                self.set_books(books)
+
     def _on_clicked(self, index) -> None:
         """Handle book click (single click).
 
@@ -98,7 +149,8 @@ class BookGridWidget(QListView):
         """
         book = self._model.get_book(index)
         if book:
-            logger.debug("Book clicked: %s (ID: %d)", book.title, book.id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Book clicked: %s (ID: %d)", book.title, book.id)
             self.book_selected.emit(book.id)
 
     def _on_activated(self, index) -> None:
@@ -109,9 +161,30 @@ class BookGridWidget(QListView):
         """
         book = self._model.get_book(index)
         if book:
-            logger.debug("Book activated: %s (ID: %d)", book.title, book.id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Book activated: %s (ID: %d)", book.title, book.id)
             self.book_activated.emit(book.id)
 
+    def _build_context_menu(self) -> None:
+        """Build the book context menu once; each right-click only updates it."""
+        self._menu = QMenu(self)
+
+        self._open_action = self._menu.addAction("Open")
+        self._menu.addSeparator()
+        self._details_action = self._menu.addAction("Book Details...")
+        self._menu.addSeparator()
+
+        # Status actions, hidden per book for its current status
+        status_menu = self._menu.addMenu("Mark as")
+        self._status_actions = {
+            "reading": status_menu.addAction("Reading"),
+            "finished": status_menu.addAction("Finished"),
+            "not_started": status_menu.addAction("Not Started"),
+        }
+
+        self._menu.addSeparator()
+        self._remove_action = self._menu.addAction("Remove from Library...")
+
     def contextMenuEvent(self, event: QContextMenuEvent) -> None:
         """Show context menu on right-click.
 
@@ -129,46 +202,39 @@ class BookGridWidget(QListView):
             logger.debug("Context menu requested but book not found in model")
             return
 
-        logger.debug("Showing context menu for book: %s (ID: %d)", book.title, book.id)
-
-        # Create menu
-        menu = QMenu(self)
-
-        # Add actions
-        open_action = menu.addAction("Open")
-        menu.addSeparator()
-        details_action = menu.addAction("Book Details...")
-        menu.addSeparator()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Showing context menu for book: %s (ID: %d)", book.title, book.id)
 
-        # Dynamic status actions (show only statuses != current)
-        status_menu = menu.addMenu("Mark as")
-        status_actions = {}
+        # Show only the statuses the book is not already in
+        for status, status_action in self._status_actions.items():
+            status_action.setVisible(status != book.status)
 
-        if book.status != "reading":
-            status_actions["reading"] = status_menu.addAction("Reading")
-        if book.status != "finished":
-            status_actions["finished"] = status_menu.addAction("Finished")
-        if book.status != "not_started":
-            status_actions["not_started"] = status_menu.addAction("Not Started")
+        # Show menu and handle selection
+        action = self._menu.exec(event.globalPos())
+        self._dispatch_menu_action(action, book)
 
-        menu.addSeparator()
-        remove_action = menu.addAction("Remove from Library...")
+    def _dispatch_menu_action(self, action: QAction | None, book: BookMetadata) -> None:
+        """Emit the signal for the context menu action chosen for a book.
 
-        # Show menu and handle selection
-        action = menu.exec(event.globalPos())
+        Args:
+            action: Action the user triggered, or None if the menu was dismissed.
+            book: Book the menu was shown for.
+        """
+        if action is None:
+            return
 
-        if action == open_action:
+        if action == self._open_action:
             logger.debug("User selected 'Open' from context menu")
             self.book_activated.emit(book.id)
-        elif action == details_action:
+        elif action == self._details_action:
             logger.debug("User selected 'Book Details' from context menu")
             self.book_details_requested.emit(book.id)
-        elif action == remove_action:
+        elif action == self._remove_action:
             logger.debug("User selected 'Remove from Library' from context menu")
             self.book_remove_requested.emit(book.id)
-        elif action in status_actions.values():
+        else:
             # Find which status was selected
-            for status, status_action in status_actions.items():
+            for status, status_action in self._status_actions.items():
                 if action == status_action:
                     logger.debug("User selected 'Mark as %s' from context menu", status)
                     self.book_status_update_requested.emit(book.id, status)
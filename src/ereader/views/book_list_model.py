@@ -4,24 +4,36 @@ This module provides the BookListModel class that implements Qt's model/view
 architecture for displaying books in the library grid.
 """
 
+import bisect
 import logging
 
-from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt6.QtCore import QModelIndex, Qt
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
 
 from ereader.models.book_metadata import BookMetadata
 
 logger = logging.getLogger(__name__)
 
+# Read-only list rows, matching QAbstractListModel's default flags
+_ITEM_FLAGS = (
+    Qt.ItemFlag.ItemIsSelectable
+    | Qt.ItemFlag.ItemIsEnabled
+    | Qt.ItemFlag.ItemNeverHasChildren
+)
 
-class BookListModel(QAbstractListModel):
+
+class BookListModel(QStandardItemModel):
     """Qt model for list of books.
 
-    This model implements QAbstractListModel to provide book data to
-    QListView for grid display. It follows Qt's model/view architecture
-    for efficient rendering and updates.
+    Each book is stored once in a QStandardItem: the full BookMetadata
+    under UserRole for the delegate, the title under DisplayRole and
+    "Title by Author" under ToolTipRole. data() and rowCount() are not
+    reimplemented, so the view's many per-paint role lookups are answered
+    in C++ without calling back into Python.
 
-    The model stores BookMetadata objects and provides them to the view
-    via the data() method using the UserRole.
+    The model also keeps the books in a plain list, mirroring its rows, so
+    set_books() can diff against it and get_book() avoids a QVariant round
+    trip.
     """
 
     def __init__(self, books: list[BookMetadata] | None = None, parent=None) -> None:
@@ -31,77 +43,190 @@ class BookListModel(QAbstractListModel):
             books: Initial list of books (defaults to empty list).
             parent: Parent QObject (optional).
         """
-        super().__init__(parent)
-        self._books = books if books is not None else []
+        super().__init__(0, 1, parent)  # One column, rows added below
+        self._books: list[BookMetadata] = list(books or [])
+        self._rows: dict[int, int] = {}  # Book id -> row, for update_book()
+        self.invisibleRootItem().appendRows([self._make_item(book) for book in self._books])
+        self._index_rows()
         logger.debug("BookListModel initialized with %d books", len(self._books))
 
-    def rowCount(self, parent: QModelIndex | None = None) -> int:
-        """Return number of rows in the model.
+    def set_books(self, books: list[BookMetadata]) -> None:
+        """Update the book list.
 
-        Args:
-            parent: Parent index (unused for list models).
+        The new list is diffed against the current one by book id so the view
+        only relayouts and repaints what changed: rows that disappeared or
+        moved are removed, new and moved rows are inserted, and rows whose
+        metadata changed in place emit dataChanged. Wholesale changes (a
+        re-sort, or ids that are not unique) fall back to a model reset.
 
-        Returns:
-            Number of books in the model.
+        Args:
+            books: New list of books to display.
         """
-        if parent is None:
-            parent = QModelIndex()
-        # List models should return 0 when parent is valid
-        if parent.isValid():
-            return 0
-        return len(self._books)
+        logger.debug("Updating book list: %d books", len(books))
+        books = list(books)
+
+        new_rows = {book.id: row for row, book in enumerate(books)}
+        old_ids = [book.id for book in self._books]
+        if len(new_rows) != len(books) or len(set(old_ids)) != len(old_ids):
+            self._reset_books(books)
+            return
+
+        # Rows to keep: the longest run of surviving books that is already
+        # in the new order. Everything else is removed and (re)inserted.
+        kept_ids = self._longest_ordered_subset(
+            [new_rows[book_id] for book_id in old_ids if book_id in new_rows],
+            books,
+        )
+        if len(kept_ids) < len(books) // 2:
+            self._reset_books(books)
+            return
+
+        # Remove from the bottom up so earlier row numbers stay valid
+        row = len(self._books) - 1
+        while row >= 0:
+            if self._books[row].id in kept_ids:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._books[row].id not in kept_ids:
+                row -= 1
+            self.removeRows(row + 1, last - row)
+            del self._books[row + 1 : last + 1]
+
+        # Insert the missing rows in contiguous runs
+        row = 0
+        while row < len(books):
+            if books[row].id in kept_ids:
+                row += 1
+                continue
+            first = row
+            while row < len(books) and books[row].id not in kept_ids:
+                row += 1
+            self._books[first:first] = books[first:row]
+            self.invisibleRootItem().insertRows(
+                first, [self._make_item(book) for book in books[first:row]]
+            )
+
+        # Refresh kept rows whose metadata changed in place
+        for row, book in enumerate(books):
+            current = self._books[row]
+            if current is book:
+                continue
+            self._books[row] = book
+            if current != book:
+                self.setItemData(self.index(row, 0), self._item_data(book))
+
+        self._index_rows()
+        logger.debug("Book list updated successfully")
 
-    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
-        """Return data for the given index and role.
+    def update_book(self, book: BookMetadata) -> bool:
+        """Replace a single book's metadata in place.
+
+        Only that book's row is refreshed, so a change such as a new reading
+        status repaints one card instead of diffing the whole list.
 
         Args:
-            index: Model index.
-            role: Data role.
+            book: Updated metadata; matched to a row by book id.
 
         Returns:
-            BookMetadata for UserRole, title for DisplayRole, None otherwise.
+            True if the book was in the model, False otherwise.
         """
-        if not index.isValid():
-            return None
+        row = self._rows.get(book.id)
+        if row is None:
+            return False
 
-        if index.row() >= len(self._books):
-            return None
+        self._books[row] = book
+        self.setItemData(self.index(row, 0), self._item_data(book))
+        logger.debug("Book %d updated in place at row %d", book.id, row)
+        return True
 
-        book = self._books[index.row()]
+    def _reset_books(self, books: list[BookMetadata]) -> None:
+        """Replace the book list with a full model reset.
 
-        if role == Qt.ItemDataRole.UserRole:
-            # Return full BookMetadata for delegate to render
-            return book
-        elif role == Qt.ItemDataRole.DisplayRole:
-            # Return title for accessibility/search
-            return book.title
-        elif role == Qt.ItemDataRole.ToolTipRole:
-            # Return tooltip with full title and author
-            return str(book)  # Uses BookMetadata.__str__()
+        Args:
+            books: New list of books to display.
+        """
+        self.clear()
+        # clear() drops the column too; restore it before the rows go in
+        self.setColumnCount(1)
+        self._books = books
+        self.invisibleRootItem().appendRows([self._make_item(book) for book in books])
+        self._index_rows()
+        logger.debug("Book list reset")
 
-        return None
+    def _index_rows(self) -> None:
+        """Rebuild the book id -> row lookup after the rows change."""
+        self._rows = {book.id: row for row, book in enumerate(self._books)}
 
-    def set_books(self, books: list[BookMetadata]) -> None:
-        """Update the book list.
+    @staticmethod
+    def _item_data(book: BookMetadata) -> dict[int, object]:
+        """Build the role data stored for a book.
+
+        Args:
+            book: Book to display.
 
-        This method triggers a model reset, causing the view to refresh.
-        Use this when the book list changes (e.g., after import, filter).
+        Returns:
+            Role -> value for the book's item. The tooltip is
+            BookMetadata.__str__().
+        """
+        return {
+            Qt.ItemDataRole.UserRole: book,  # Full BookMetadata for the delegate
+            Qt.ItemDataRole.DisplayRole: book.title,  # Title for accessibility/search
+            Qt.ItemDataRole.ToolTipRole: str(book),  # "Title by Author"
+        }
+
+    @classmethod
+    def _make_item(cls, book: BookMetadata) -> QStandardItem:
+        """Create the read-only item for a book.
 
         Args:
-            books: New list of books to display.
+            book: Book to display.
+
+        Returns:
+            Item holding the book's role data.
         """
-        logger.debug("Updating book list: %d books", len(books))
+        item = QStandardItem()
+        item.setFlags(_ITEM_FLAGS)
+        for role, value in cls._item_data(book).items():
+            item.setData(value, role)
+        return item
 
-        # Notify view that model is about to be reset
-        self.beginResetModel()
+    @staticmethod
+    def _longest_ordered_subset(
+        new_positions: list[int], books: list[BookMetadata]
+    ) -> set[int]:
+        """Find the largest set of current books already in the new order.
 
-        # Update internal data
-        self._books = books
+        Longest increasing subsequence (patience sorting, O(n log n)) over
+        the new positions of the surviving books, in their current order.
 
-        # Notify view that model has been reset
-        self.endResetModel()
+        Args:
+            new_positions: Position in the new list of each surviving book,
+                in current row order.
+            books: The new book list.
 
-        logger.debug("Book list updated successfully")
+        Returns:
+            Ids of the books that can stay where they are.
+        """
+        tails: list[int] = []  # Smallest tail position of each run length
+        tail_indices: list[int] = []  # Index into new_positions of each tail
+        previous = [-1] * len(new_positions)
+        for i, position in enumerate(new_positions):
+            length = bisect.bisect_left(tails, position)
+            if length == len(tails):
+                tails.append(position)
+                tail_indices.append(i)
+            else:
+                tails[length] = position
+                tail_indices[length] = i
+            previous[i] = tail_indices[length - 1] if length > 0 else -1
+
+        kept: set[int] = set()
+        i = tail_indices[-1] if tail_indices else -1
+        while i >= 0:
+            kept.add(books[new_positions[i]].id)
+            i = previous[i]
+        return kept
 
     def get_book(self, index: QModelIndex) -> BookMetadata | None:
         """Get book at the given index.
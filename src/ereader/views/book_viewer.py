@@ -7,8 +7,9 @@ the BookRenderer protocol to allow swapping implementations in the future.
 
 import logging
 import os
+from functools import lru_cache
 
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
     QGraphicsDropShadowEffect,
@@ -24,6 +25,46 @@ logger = logging.getLogger(__name__)
 # Detect if running in test environment
 _IS_TESTING = "PYTEST_CURRENT_TEST" in os.environ
 
+# Minimum time between scroll_position_changed emissions (about one frame)
+_SCROLL_EMIT_INTERVAL_MS = 16
+
+
+@lru_cache(maxsize=8)
+def _welcome_html(text_color: str, secondary_color: str) -> str:
+    """Build the welcome page for a theme's text colors.
+
+    Args:
+        text_color: Color of the heading.
+        secondary_color: Color of the hint lines.
+
+    Returns:
+        Welcome page HTML, built once per color pair.
+    """
+    return f"""
+        <html>
+        <body style="text-align: center; padding-top: 100px;
+                     font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display',
+                                 'Segoe UI', system-ui, sans-serif;">
+            <h1 style="color: {text_color};
+                       font-weight: 300;
+                       font-size: 2.5em;
+                       margin-bottom: 0.5em;">
+                Welcome to E-Reader
+            </h1>
+            <p style="color: {secondary_color};
+                      font-size: 1.1em;
+                      margin: 0.5em 0;">
+                Open an EPUB file to start reading
+            </p>
+            <p style="color: {secondary_color};
+                      font-size: 0.95em;
+                      margin-top: 1.5em;">
+                File → Open (Ctrl+O)
+            </p>
+        </body>
+        </html>
+        """
+
 
 class BookViewer(QWidget):
     """Widget for displaying book chapter content.
@@ -37,7 +78,8 @@ class BookViewer(QWidget):
     most EPUB books. It's lightweight and has a simple API.
 
     Signals:
-        scroll_position_changed: Emitted when scroll position changes.
+        scroll_position_changed: Emitted when scroll position changes, at
+            most about once per frame while scrolling.
             Args: percentage (float) from 0.0 to 100.0
     """
 
@@ -61,8 +103,15 @@ class BookViewer(QWidget):
         self._renderer.setOpenExternalLinks(False)  # Don't open external links
         self._renderer.setOpenLinks(False)  # Don't follow internal links (for now)
 
+        # Last size passed to set_base_font_size() (None until first call)
+        self._base_font_size: int | None = None
+
+        # Whether the welcome page is shown, so theme changes can refresh it
+        # without serializing the document to look for it
+        self._showing_welcome = False
+
         # Apply default theme (includes font settings via stylesheet)
-        self._current_theme = DEFAULT_THEME
+        self._current_theme: Theme | None = None
         self.apply_theme(DEFAULT_THEME)
 
         # Setup layout
@@ -78,6 +127,15 @@ class BookViewer(QWidget):
         # Show welcome message
         self._show_welcome_message()
 
+        # Throttle scroll_position_changed: the first scrollbar tick emits at
+        # once, later ticks within the interval collapse into one emission
+        self._scroll_emit_timer = QTimer(self)
+        self._scroll_emit_timer.setSingleShot(True)
+        self._scroll_emit_timer.setInterval(_SCROLL_EMIT_INTERVAL_MS)
+        self._scroll_emit_timer.timeout.connect(self._on_scroll_emit_timeout)
+        self._scroll_pending = False
+        self._last_emitted_percentage: float | None = None
+
         # Connect scrollbar changes to emit our signal
         # Note: Connected after initial content load to avoid spurious 0% emission
         # during initialization before any controllers are connected
@@ -92,9 +150,16 @@ class BookViewer(QWidget):
         comprehensive styling defined in the provided theme, including
         typography, colors, scrollbar styling, and shadow effect.
 
+        Re-applying the current theme is a no-op, since restyling makes the
+        text browser relayout the whole document.
+
         Args:
             theme: The theme to apply.
         """
+        if theme == self._current_theme:
+            logger.debug("Theme %s already applied", theme.name)
+            return
+
         logger.debug("Applying theme: %s", theme.name)
 
         # Store current theme and apply comprehensive stylesheet
@@ -106,7 +171,7 @@ class BookViewer(QWidget):
         self._apply_shadow_effect(theme)
 
         # Refresh welcome message to use new theme colors
-        if self._renderer.toPlainText().strip().startswith("Welcome to E-Reader"):
+        if self._showing_welcome:
             self._show_welcome_message()
 
         logger.debug("Theme applied: %s", theme.name)
@@ -152,31 +217,9 @@ class BookViewer(QWidget):
 
     def _show_welcome_message(self) -> None:
         """Display a welcome message when no book is loaded."""
-        welcome_html = f"""
-        <html>
-        <body style="text-align: center; padding-top: 100px;
-                     font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display',
-                                 'Segoe UI', system-ui, sans-serif;">
-            <h1 style="color: {self._current_theme.text};
-                       font-weight: 300;
-                       font-size: 2.5em;
-                       margin-bottom: 0.5em;">
-                Welcome to E-Reader
-            </h1>
-            <p style="color: {self._current_theme.text_secondary};
-                      font-size: 1.1em;
-                      margin: 0.5em 0;">
-                Open an EPUB file to start reading
-            </p>
-            <p style="color: {self._current_theme.text_secondary};
-                      font-size: 0.95em;
-                      margin-top: 1.5em;">
-                File → Open (Ctrl+O)
-            </p>
-        </body>
-        </html>
-        """
-        self._renderer.setHtml(welcome_html)
+        theme = self._current_theme or DEFAULT_THEME
+        self._renderer.setHtml(_welcome_html(theme.text, theme.text_secondary))
+        self._showing_welcome = True
 
     def set_content(self, html: str) -> None:
         """Display HTML content in the viewer.
@@ -189,6 +232,8 @@ class BookViewer(QWidget):
             html: HTML content to display (XHTML from EPUB chapter).
         """
         logger.debug("Setting content, length: %d bytes", len(html))
+        self._showing_welcome = False
+        self._last_emitted_percentage = None  # Always report the new position
         self._renderer.setHtml(html)
         logger.debug("Content set successfully")
 
@@ -199,6 +244,8 @@ class BookViewer(QWidget):
         content from the viewer.
         """
         logger.debug("Clearing viewer content")
+        self._showing_welcome = False
+        self._last_emitted_percentage = None
         self._renderer.clear()
         logger.debug("Content cleared")
 
@@ -210,7 +257,13 @@ class BookViewer(QWidget):
         Args:
             size: Font size in points.
         """
+        # The stylesheet's pixel size overrides font(), so compare against the
+        # last requested size rather than reading it back
+        if size == self._base_font_size:
+            return
+
         logger.debug("Setting base font size to %d", size)
+        self._base_font_size = size
         font = self._renderer.font()
         font.setPointSize(size)
         self._renderer.setFont(font)
@@ -237,15 +290,16 @@ class BookViewer(QWidget):
         maximum = scrollbar.maximum()
         clamped_value = max(minimum, min(maximum, new_value))
 
-        logger.debug(
-            "Scroll calculation: current=%d, amount=%d, new=%d, clamped=%d (range: %d-%d)",
-            current_value,
-            scroll_amount,
-            new_value,
-            clamped_value,
-            minimum,
-            maximum,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Scroll calculation: current=%d, amount=%d, new=%d, clamped=%d (range: %d-%d)",
+                current_value,
+                scroll_amount,
+                new_value,
+                clamped_value,
+                minimum,
+                maximum,
+            )
 
         # Set new value (signal emitted automatically via valueChanged connection)
         scrollbar.setValue(clamped_value)
@@ -277,23 +331,45 @@ class BookViewer(QWidget):
 
         # Check if scrollable
         if maximum == minimum:
-            logger.debug("Content not scrollable, returning 0.0%%")
             return 0.0
 
         # Calculate percentage
-        percentage = ((value - minimum) / (maximum - minimum)) * 100.0
-        logger.debug("Scroll percentage: %.1f%%", percentage)
-        return percentage
+        return ((value - minimum) / (maximum - minimum)) * 100.0
 
     def _on_scroll_changed(self) -> None:
         """Handle scroll position changes and emit signal.
 
         Called when the scrollbar value changes, either from user interaction
-        or programmatic scrolling. Emits scroll_position_changed signal with
-        the current scroll percentage.
+        or programmatic scrolling. The first change emits
+        scroll_position_changed right away; changes during the following
+        interval are coalesced into a single emission when it ends.
         """
+        if self._scroll_emit_timer.isActive():
+            self._scroll_pending = True
+            return
+
+        self._emit_scroll_position()
+        self._scroll_emit_timer.start()
+
+    def _on_scroll_emit_timeout(self) -> None:
+        """Emit the position reached during the throttle interval, if any."""
+        if not self._scroll_pending:
+            return
+
+        self._scroll_pending = False
+        self._emit_scroll_position()
+        self._scroll_emit_timer.start()
+
+    def _emit_scroll_position(self) -> None:
+        """Emit scroll_position_changed unless the position is unchanged."""
         percentage = self.get_scroll_percentage()
-        logger.debug("Scroll changed, emitting signal: %.1f%%", percentage)
+        if percentage == self._last_emitted_percentage:
+            return
+
+        self._last_emitted_percentage = percentage
+        # Runs on every emitted scroll update; skip building the log record unless needed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Scroll changed, emitting signal: %.1f%%", percentage)
         self.scroll_position_changed.emit(percentage)
 
     # Pagination support methods (Phase 2A)
@@ -322,9 +398,9 @@ class BookViewer(QWidget):
         Args:
             position: Scroll position in pixels.
         """
-        logger.debug("Setting scroll position to %dpx", position)
-        scrollbar = self._renderer.verticalScrollBar()
-        scrollbar.setValue(position)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Setting scroll position to %dpx", position)
+        self._renderer.verticalScrollBar().setValue(position)
 
     def get_scroll_position(self) -> int:
         """Get current scroll position in pixels.
@@ -30,6 +30,14 @@ from ereader.views.empty_library_widget import EmptyLibraryWidget
 
 logger = logging.getLogger(__name__)
 
+# Sort combo box index -> LibraryFilter.sort_by
+_SORT_KEYS = {
+    0: "recent",
+    1: "title",
+    2: "author",
+    3: "progress",
+}
+
 
 class DragDropOverlay(QWidget):
     """Semi-transparent overlay for drag-and-drop visual feedback.
@@ -260,6 +268,24 @@ class LibraryView(QWidget):
             self._refresh_grid()
             logger.debug("Showing library with %d books", len(books))
 
+    def update_book(self, book: BookMetadata) -> None:
+        """Update a single book after its metadata changed.
+
+        While no status filter is active the book stays where it is, so only
+        its card is repainted. Otherwise the grid is re-filtered, since the
+        book may have entered or left the current view.
+
+        Args:
+            book: Updated metadata for the book.
+        """
+        logger.debug("Updating book %d in library view", book.id)
+
+        self._all_books = [book if b.id == book.id else b for b in self._all_books]
+
+        if self._current_filter.status is None and self._grid_widget.update_book(book):
+            return
+        self._refresh_grid()
+
     def show_empty_state(self) -> None:
         """Explicitly show the empty state.
 
@@ -293,13 +319,7 @@ class LibraryView(QWidget):
         Args:
             index: Selected combo box index.
         """
-        sort_map = {
-            0: "recent",
-            1: "title",
-            2: "author",
-            3: "progress"
-        }
-        sort_by = sort_map.get(index, "recent")
+        sort_by = _SORT_KEYS.get(index, "recent")
         logger.debug("Sort changed to: %s", sort_by)
         self._current_filter.sort_by = sort_by
         self._refresh_grid()
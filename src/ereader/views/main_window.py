@@ -5,6 +5,7 @@ as the container for all UI components.
 """
 
 import logging
+from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QEasingCurve, QEvent, QPropertyAnimation, QSettings, Qt, QTimer
 from PyQt6.QtGui import (
@@ -33,8 +34,18 @@ from ereader.views.navigation_bar import NavigationBar
 from ereader.views.shortcuts_dialog import ShortcutsDialog
 from ereader.views.toast_widget import ToastWidget
 
+if TYPE_CHECKING:
+    from ereader.views.book_details_dialog import BookDetailsDialog
+
 logger = logging.getLogger(__name__)
 
+# Toast text for each reading status code
+_STATUS_LABELS = {
+    "not_started": "Not Started",
+    "reading": "Reading",
+    "finished": "Finished",
+}
+
 
 class MainWindow(QMainWindow):
     """Main application window for the e-reader.
@@ -64,6 +75,7 @@ class MainWindow(QMainWindow):
 
         # Phase 2 UI components (lazy-loaded)
         self._shortcuts_dialog: ShortcutsDialog | None = None
+        self._book_details_dialog: BookDetailsDialog | None = None
 
         # Toast notification system
         self._toast_widget: ToastWidget | None = None
@@ -911,9 +923,13 @@ class MainWindow(QMainWindow):
             self._show_toast("⚠️ Book not found", "error")
             return
 
-        from ereader.views.book_details_dialog import BookDetailsDialog
-        dialog = BookDetailsDialog(book, self)
-        dialog.exec()
+        # Built on first use, then refilled for each book
+        if self._book_details_dialog is None:
+            from ereader.views.book_details_dialog import BookDetailsDialog
+            self._book_details_dialog = BookDetailsDialog(book, self)
+        else:
+            self._book_details_dialog.update_book(book)
+        self._book_details_dialog.exec()
 
     def _on_book_status_update_requested(self, book_id: int, new_status: str) -> None:
         """Update book reading status (Phase 3).
@@ -995,16 +1011,14 @@ class MainWindow(QMainWindow):
         """
         logger.debug("Book status updated: book_id=%d, status=%s", book_id, new_status)
 
-        status_labels = {
-            "not_started": "Not Started",
-            "reading": "Reading",
-            "finished": "Finished"
-        }
-        label = status_labels.get(new_status, new_status.title())
+        label = _STATUS_LABELS.get(new_status) or new_status.title()
         self._show_toast(f"✓ Marked as {label}", "success")
 
-        # Reload library to refresh grid
-        if self._library_controller:
+        # Refresh just this book's card; fall back to a full reload
+        book = self._repository.get_book(book_id) if self._repository else None
+        if book is not None and self._library_view is not None:
+            self._library_view.update_book(book)
+        elif self._library_controller:
             self._library_controller.load_library()
 
     def closeEvent(self, event: QCloseEvent) -> None:
@@ -23,3 +23,21 @@ def sample_epub(test_data_dir: Path) -> Path:
 def temp_dir(tmp_path: Path) -> Path:
     """Temporary directory for test outputs."""
     return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Redirect the user data directory (library DB, cover cache) into tmp_path."""
+    data_dir = tmp_path / "user-data"
+    data_dir.mkdir()
+    monkeypatch.setattr(
+        "ereader.utils.database_utils.get_library_db_path",
+        lambda: data_dir / "library.db",
+    )
+    return data_dir
+
+
+@pytest.fixture(autouse=True)
+def psutil_memory_readings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make MemoryMonitor read RSS through psutil, which tests mock, not /proc."""
+    monkeypatch.setattr("ereader.utils.memory_monitor._open_statm", lambda: None)
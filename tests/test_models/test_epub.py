@@ -728,6 +728,34 @@ class TestEPUBManifestAndSpineParsing:
         assert "img1" in book._manifest
         assert "img1" not in book._spine
 
+    def test_parse_opf_without_namespace(self, tmp_path: Path) -> None:
+        """Test that a bare (non-namespaced) OPF is parsed with the same tags."""
+        epub_file = tmp_path / "test.epub"
+
+        container_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>"""
+
+        opf_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<package version="2.0">
+<metadata><title>Bare Book</title></metadata>
+<manifest><item id="ch1" href="chapter1.xhtml" media-type="application/xhtml+xml"/></manifest>
+<spine><itemref idref="ch1"/></spine>
+</package>"""
+
+        with zipfile.ZipFile(epub_file, "w") as zf:
+            zf.writestr("mimetype", "application/epub+zip")
+            zf.writestr("META-INF/container.xml", container_xml)
+            zf.writestr("content.opf", opf_xml)
+
+        book = EPUBBook(epub_file)
+
+        assert book._manifest == {"ch1": "chapter1.xhtml"}
+        assert book._spine == ["ch1"]
+
     def test_missing_manifest_raises_error(self, tmp_path: Path) -> None:
         """Test that missing manifest element raises CorruptedEPUBError."""
         epub_file = tmp_path / "test.epub"
@@ -1295,6 +1323,13 @@ class TestGetResource:
 
         assert retrieved_data == image_data
 
+        # Same file reached from a chapter resolves to the same archive path
+        assert book.resolve_resource_path("../images/photo.jpg") == "OEBPS/images/photo.jpg"
+        assert (
+            book.resolve_resource_path("../../images/photo.jpg", relative_to="text/chapter1.xhtml")
+            == "OEBPS/images/photo.jpg"
+        )
+
     def test_get_resource_not_found_raises_error(self, tmp_path: Path) -> None:
         """Test that missing resource raises CorruptedEPUBError."""
         epub_file = tmp_path / "test.epub"
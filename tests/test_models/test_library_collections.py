@@ -3,6 +3,7 @@
 Tests the collection CRUD operations and enhanced filtering added in Phase 2.
 """
 
+import sys
 from datetime import datetime
 
 import pytest
@@ -50,6 +51,17 @@ class TestDatabaseMigration:
 
         assert result is not None, "book_collections table should exist"
 
+    def test_file_database_enables_mmap(self, tmp_path):
+        """File-backed database should memory-map reads."""
+        repo = LibraryRepository(tmp_path / "library.db")
+
+        cursor = repo._conn.cursor()
+        cursor.execute("PRAGMA mmap_size")
+        mmap_size = cursor.fetchone()[0]
+        repo.close()
+
+        assert mmap_size > 0, "mmap_size should be enabled on file databases"
+
 
 class TestCollectionCRUD:
     """Test collection create, read, update, delete operations."""
@@ -327,6 +339,12 @@ class TestEnhancedFiltering:
         assert len(books) == 1
         assert books[0].title == "Not Started"
 
+    def test_loaded_statuses_are_interned(self, repo_with_data):
+        """Loaded books should share one string object per status."""
+        books = repo_with_data.get_all_books()
+
+        assert all(book.status is sys.intern(book.status) for book in books)
+
     def test_filter_by_days_since_opened(self, repo_with_data):
         """Should filter books opened in last N days."""
         # Filter for books opened in last 30 days
@@ -108,11 +108,53 @@ class TestAsyncChapterLoaderCacheHit:
             mock_book.get_chapter_content.assert_not_called()
 
             # Verify image resolution was called
-            mock_resolve.assert_called_once_with(raw_html, mock_book, chapter_href="chapter1.xhtml")
+            mock_resolve.assert_called_once_with(
+                raw_html,
+                mock_book,
+                chapter_href="chapter1.xhtml",
+                image_cache=cache_manager.images,
+            )
 
             # Wait for thread to finish before cleanup
             loader.wait(1000)
 
+    def test_rendered_cache_hit_uses_direct_callback(self, mock_book, cache_manager, qtbot):
+        """Test that a direct callback bypasses the signal on cache hit."""
+        cache_key = f"{mock_book.filepath}:0"
+        cache_manager.rendered_chapters.set(cache_key, "<html>cached</html>")
+
+        received = []
+        loader = AsyncChapterLoader(
+            mock_book, cache_manager, chapter_index=0, direct_callback=received.append
+        )
+        emitted = []
+        loader.content_ready.connect(emitted.append)
+
+        loader.start()
+        loader.wait(1000)
+        qtbot.wait(10)
+
+        assert received == ["<html>cached</html>"]
+        assert emitted == []
+
+    def test_cache_miss_ignores_direct_callback(self, mock_book, cache_manager, qtbot):
+        """Test that cache misses still go through content_ready."""
+        callback = Mock()
+        with patch("ereader.utils.async_loader.resolve_images_in_html") as mock_resolve:
+            mock_resolve.return_value = "<html><body>Resolved content</body></html>"
+
+            loader = AsyncChapterLoader(
+                mock_book, cache_manager, chapter_index=0, direct_callback=callback
+            )
+
+            with qtbot.waitSignal(loader.content_ready, timeout=1000) as blocker:
+                loader.start()
+
+            assert blocker.args[0] == "<html><body>Resolved content</body></html>"
+            callback.assert_not_called()
+
+            loader.wait(1000)
+
 
 class TestAsyncChapterLoaderCacheMiss:
     """Tests for AsyncChapterLoader with no cached content."""
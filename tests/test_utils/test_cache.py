@@ -1,10 +1,11 @@
 """Tests for caching utilities."""
 
+import threading
 import time
 
 import pytest
 
-from ereader.utils.cache import ChapterCache
+from ereader.utils.cache import ChapterCache, DiskChapterCache
 
 
 class TestChapterCache:
@@ -137,6 +138,21 @@ class TestChapterCache:
         assert cache.get("key3") == "value3"
         assert cache.get("key4") == "value4"
 
+    def test_evict_all_except(self) -> None:
+        """evict_all_except should keep only the given key and its stats."""
+        cache = ChapterCache(maxsize=5)
+        cache.set("book:0", "a")
+        cache.set("book:1", "b")
+        cache.set("book:2", "c")
+        cache.get("book:1")
+
+        evicted = cache.evict_all_except("book:1")
+
+        assert evicted == 2
+        assert len(cache) == 1
+        assert cache.get("book:1") == "b"
+        assert cache.stats()["hits"] == 2
+
     def test_clear_cache(self) -> None:
         """Clear should remove all entries and reset stats."""
         cache = ChapterCache()
@@ -407,3 +423,88 @@ class TestChapterCacheEnhancedStats:
         # sys.getsizeof includes string overhead, so it will be > 1KB
         assert stats["avg_item_size_kb"] > 1.0
         assert stats["avg_item_size_kb"] < 10.0  # Reasonable upper bound
+
+
+class TestDiskChapterCache:
+    """Tests for the disk-backed second-level chapter cache."""
+
+    def test_set_and_get_roundtrip(self, tmp_path) -> None:
+        """Values written to disk should be read back unchanged."""
+        l2 = DiskChapterCache(tmp_path / "l2")
+        html = "<html><body>Caf\u00e9 " + "x" * 10000 + "</body></html>"
+
+        l2.set("book.epub:3", html)
+
+        assert l2.get("book.epub:3") == html
+        assert l2.get("book.epub:4") is None
+        assert l2.stats() == {"hits": 1, "misses": 1}
+
+    def test_clear_removes_files(self, tmp_path) -> None:
+        """clear() should delete stored entries."""
+        l2 = DiskChapterCache(tmp_path / "l2")
+        l2.set("book.epub:0", "<html></html>")
+
+        l2.clear()
+
+        assert l2.get("book.epub:0") is None
+        assert list((tmp_path / "l2").iterdir()) == []
+
+    def test_corrupt_file_is_a_miss(self, tmp_path) -> None:
+        """Unreadable entries should be treated as misses."""
+        l2 = DiskChapterCache(tmp_path / "l2")
+        l2.set("book.epub:0", "<html></html>")
+        l2.flush()
+        next((tmp_path / "l2").iterdir()).write_bytes(b"not zlib")
+
+        assert l2.get("book.epub:0") is None
+
+    def test_write_happens_off_the_calling_thread(self, tmp_path) -> None:
+        """set() should return before the file is written, serving it from memory."""
+        l2 = DiskChapterCache(tmp_path / "l2")
+        release = threading.Event()
+        l2._writer.submit(release.wait)  # Hold the writer busy
+
+        l2.set("book.epub:0", "chapter 0")
+
+        assert not (tmp_path / "l2").exists()
+        assert l2.get("book.epub:0") == "chapter 0"
+
+        release.set()
+        l2.flush()
+        assert len(list((tmp_path / "l2").iterdir())) == 1
+        assert l2.get("book.epub:0") == "chapter 0"
+
+    def test_clear_drops_queued_writes(self, tmp_path) -> None:
+        """Writes still queued when clear() runs should never reach disk."""
+        l2 = DiskChapterCache(tmp_path / "l2")
+        release = threading.Event()
+        l2._writer.submit(release.wait)
+        l2.set("book.epub:0", "chapter 0")
+
+        release.set()
+        l2.clear()
+        l2.flush()
+
+        assert l2.get("book.epub:0") is None
+        assert not (tmp_path / "l2").exists() or list((tmp_path / "l2").iterdir()) == []
+
+    def test_chapter_cache_spills_and_restores(self, tmp_path) -> None:
+        """Evicted chapters should come back from L2 on an L1 miss."""
+        cache = ChapterCache(maxsize=1, l2=DiskChapterCache(tmp_path / "l2"))
+        cache.set("book.epub:0", "chapter 0")
+        cache.set("book.epub:1", "chapter 1")  # Evicts chapter 0 to disk
+
+        assert cache.get("book.epub:0") == "chapter 0"
+        # Promoted back into memory, spilling chapter 1
+        assert len(cache) == 1
+        assert cache.get("book.epub:1") == "chapter 1"
+
+    def test_chapter_cache_clear_clears_l2(self, tmp_path) -> None:
+        """Clearing the chapter cache should also clear its L2."""
+        cache = ChapterCache(maxsize=1, l2=DiskChapterCache(tmp_path / "l2"))
+        cache.set("book.epub:0", "chapter 0")
+        cache.set("book.epub:1", "chapter 1")
+
+        cache.clear()
+
+        assert cache.get("book.epub:0") is None
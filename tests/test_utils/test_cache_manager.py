@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from ereader.utils.cache_manager import CacheManager
+from ereader.utils.cache_manager import CacheManager, MemoryPressureLevel
 
 
 class TestCacheManagerInitialization:
@@ -154,12 +154,12 @@ class TestCacheManagerStatistics:
         manager = CacheManager()
         stats = manager.get_combined_stats()
 
-        assert stats["total_memory_mb"] == 0.0
-        assert stats["total_items"] == 0
+        assert stats.total_memory_mb == 0.0
+        assert stats.total_items == 0
 
-        assert stats["rendered_stats"]["size"] == 0
-        assert stats["raw_stats"]["size"] == 0
-        assert stats["image_stats"]["size"] == 0
+        assert stats.rendered_stats["size"] == 0
+        assert stats.raw_stats["size"] == 0
+        assert stats.image_stats["size"] == 0
 
     def test_combined_stats_with_data(self) -> None:
         """Should aggregate stats from all caches."""
@@ -174,15 +174,15 @@ class TestCacheManagerStatistics:
         stats = manager.get_combined_stats()
 
         # Check total items
-        assert stats["total_items"] == 4  # 1 rendered + 2 raw + 1 image
+        assert stats.total_items == 4  # 1 rendered + 2 raw + 1 image
 
         # Check individual cache sizes
-        assert stats["rendered_stats"]["size"] == 1
-        assert stats["raw_stats"]["size"] == 2
-        assert stats["image_stats"]["size"] == 1
+        assert stats.rendered_stats["size"] == 1
+        assert stats.raw_stats["size"] == 2
+        assert stats.image_stats["size"] == 1
 
         # Check memory is tracked
-        assert stats["total_memory_mb"] > 0
+        assert stats.total_memory_mb > 0
 
     def test_combined_stats_includes_all_cache_stats(self) -> None:
         """Should include stats from all cache layers."""
@@ -194,14 +194,14 @@ class TestCacheManagerStatistics:
         stats = manager.get_combined_stats()
 
         # Check that individual cache stats are included
-        assert "rendered_stats" in stats
-        assert "raw_stats" in stats
-        assert "image_stats" in stats
-        assert "memory_stats" in stats
+        assert isinstance(stats.rendered_stats, dict)
+        assert isinstance(stats.raw_stats, dict)
+        assert isinstance(stats.image_stats, dict)
+        assert isinstance(stats.memory_stats, dict)
 
         # Check that rendered cache stats are correct
-        assert stats["rendered_stats"]["hits"] == 1
-        assert stats["rendered_stats"]["size"] == 1
+        assert stats.rendered_stats["hits"] == 1
+        assert stats.rendered_stats["size"] == 1
 
     def test_combined_stats_memory_calculation(self) -> None:
         """Should calculate total memory correctly."""
@@ -216,12 +216,37 @@ class TestCacheManagerStatistics:
 
         # Total memory should be sum of all caches
         expected_total = (
-            stats["rendered_stats"]["estimated_memory_mb"]
-            + stats["raw_stats"]["estimated_memory_mb"]
-            + stats["image_stats"]["memory_mb"]
+            stats.rendered_stats["estimated_memory_mb"]
+            + stats.raw_stats["estimated_memory_mb"]
+            + stats.image_stats["memory_mb"]
         )
 
-        assert abs(stats["total_memory_mb"] - expected_total) < 0.001
+        assert abs(stats.total_memory_mb - expected_total) < 0.001
+
+    def test_combined_stats_hit_rate(self) -> None:
+        """Should derive overall hit rate from summed hit/miss counters."""
+        manager = CacheManager()
+
+        assert manager.get_combined_stats().hit_rate == 0.0
+
+        manager.rendered_chapters.set("book:0", "data")
+        _ = manager.rendered_chapters.get("book:0")  # Hit
+        _ = manager.raw_chapters.get("book:0")  # Miss
+        _ = manager.images.get("img1")  # Miss
+        manager.images.set("img1", "data")
+        _ = manager.images.get("img1")  # Hit
+
+        assert manager.get_combined_stats().hit_rate == 50.0
+
+    def test_combined_stats_covers_cached(self) -> None:
+        """Should report persistent cover cache hits."""
+        manager = CacheManager()
+
+        with patch(
+            "ereader.utils.cache_manager.CoverExtractor.cache_stats",
+            return_value={"hits": 3, "misses": 1},
+        ):
+            assert manager.get_combined_stats().covers_cached == 3
 
 
 class TestCacheManagerMemoryMonitoring:
@@ -255,6 +280,98 @@ class TestCacheManagerMemoryMonitoring:
         assert manager.check_memory_threshold() is True
 
 
+class TestCacheManagerMemoryPressure:
+    """Test memory-pressure-driven eviction."""
+
+    def test_pressure_levels(self) -> None:
+        """Should classify cache memory against the shared budget."""
+        manager = CacheManager(image_max_memory_mb=10, total_memory_threshold_mb=1)
+        assert manager.get_memory_pressure() is MemoryPressureLevel.NORMAL
+
+        manager.images.set("img1", "x" * int(0.75 * 1024 * 1024))
+        assert manager.get_memory_pressure() is MemoryPressureLevel.WARNING
+
+        manager.images.set("img2", "x" * int(0.2 * 1024 * 1024))
+        assert manager.get_memory_pressure() is MemoryPressureLevel.CRITICAL
+
+    def test_warning_halves_image_cache(self) -> None:
+        """WARNING should evict the oldest images down to half the usage."""
+        manager = CacheManager()
+        for i in range(4):
+            manager.images.set(f"img{i}", "x" * 1000)
+        manager.rendered_chapters.set("book:0", "rendered")
+
+        manager.on_memory_pressure(MemoryPressureLevel.WARNING)
+
+        assert len(manager.images) == 2
+        assert manager.images.get("img0") is None
+        assert manager.images.get("img3") is not None
+        assert len(manager.rendered_chapters) == 1
+
+    def test_critical_keeps_only_current_chapter(self) -> None:
+        """CRITICAL should drop everything except the displayed chapter."""
+        manager = CacheManager()
+        manager.rendered_chapters.set("book:0", "r0")
+        manager.rendered_chapters.set("book:1", "r1")
+        manager.raw_chapters.set("book:0", "raw")
+        manager.images.set("img", "data")
+
+        manager.on_memory_pressure(MemoryPressureLevel.CRITICAL, keep_key="book:1")
+
+        assert len(manager.images) == 0
+        assert len(manager.raw_chapters) == 0
+        assert len(manager.rendered_chapters) == 1
+        assert manager.rendered_chapters.get("book:1") == "r1"
+
+    def test_normal_does_nothing(self) -> None:
+        """NORMAL should leave caches untouched."""
+        manager = CacheManager()
+        manager.images.set("img", "data")
+
+        manager.on_memory_pressure(MemoryPressureLevel.NORMAL)
+
+        assert len(manager.images) == 1
+
+
+class TestCacheManagerDiskL2:
+    """Test the optional disk L2 behind the chapter caches."""
+
+    def test_disk_l2_disabled_by_default(self) -> None:
+        """Chapter caches should have no L2 unless enabled."""
+        manager = CacheManager()
+        assert manager.rendered_chapters._l2 is None
+        assert manager.raw_chapters._l2 is None
+
+    def test_disk_l2_restores_evicted_chapter(self, tmp_path) -> None:
+        """Evicted rendered chapters should be restored from disk."""
+        manager = CacheManager(rendered_maxsize=1, enable_disk_l2=True, disk_cache_dir=tmp_path)
+        manager.rendered_chapters.set("book:0", "rendered 0")
+        manager.rendered_chapters.set("book:1", "rendered 1")
+
+        assert manager.rendered_chapters.get("book:0") == "rendered 0"
+        assert manager.raw_chapters.get("book:0") is None
+
+    def test_clear_all_clears_disk_l2(self, tmp_path) -> None:
+        """clear_all should drop spilled chapters too."""
+        manager = CacheManager(rendered_maxsize=1, enable_disk_l2=True, disk_cache_dir=tmp_path)
+        manager.rendered_chapters.set("book:0", "rendered 0")
+        manager.rendered_chapters.set("book:1", "rendered 1")
+
+        manager.clear_all()
+
+        assert manager.rendered_chapters.get("book:0") is None
+
+    def test_default_disk_dir_is_under_data_dir(self, isolated_data_dir) -> None:
+        """Without disk_cache_dir, spilled chapters should go to the data directory."""
+        manager = CacheManager(rendered_maxsize=1, enable_disk_l2=True)
+        manager.rendered_chapters.set("book:0", "rendered 0")
+        manager.rendered_chapters.set("book:1", "rendered 1")
+        manager.rendered_chapters._l2.flush()
+
+        chapter_dir = isolated_data_dir / "cache" / "chapters"
+        assert len(list(chapter_dir.iterdir())) == 1
+
+
 class TestCacheManagerLogging:
     """Test logging functionality."""
 
@@ -281,6 +398,31 @@ class TestCacheManagerLogging:
         # The exact log format may vary, so we just check something was logged
         assert len(caplog.records) > 0
 
+    def test_log_stats_skipped_when_debug_disabled(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Should not collect stats when DEBUG logging is off."""
+        manager = CacheManager()
+
+        with caplog.at_level("INFO"), patch.object(manager, "get_combined_stats") as mock_stats:
+            manager.log_stats()
+
+        mock_stats.assert_not_called()
+
+    def test_log_stats_throttled(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Should log at most once per interval."""
+        manager = CacheManager()
+
+        with caplog.at_level("DEBUG"), patch.object(
+            manager, "get_combined_stats", wraps=manager.get_combined_stats
+        ) as mock_stats:
+            manager.log_stats()
+            manager.log_stats()
+            assert mock_stats.call_count == 1
+
+            # Once the interval has passed, stats are logged again
+            manager._last_log_time -= CacheManager.LOG_STATS_INTERVAL_S
+            manager.log_stats()
+            assert mock_stats.call_count == 2
+
 
 class TestCacheManagerIntegration:
     """Test integration between cache layers."""
@@ -325,7 +467,7 @@ class TestCacheManagerIntegration:
 
         # Check stats
         stats = manager.get_combined_stats()
-        assert stats["total_items"] == 3
+        assert stats.total_items == 3
 
     def test_clear_all_resets_all_layers(self) -> None:
         """Should reset all cache layers and statistics."""
@@ -346,8 +488,8 @@ class TestCacheManagerIntegration:
 
         # Verify everything is reset
         stats = manager.get_combined_stats()
-        assert stats["total_items"] == 0
-        assert stats["total_memory_mb"] == 0.0
+        assert stats.total_items == 0
+        assert stats.total_memory_mb == 0.0
 
         # Verify caches are usable after clear
         manager.rendered_chapters.set("book:1", "new data")
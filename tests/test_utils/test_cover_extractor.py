@@ -0,0 +1,426 @@
+"""Tests for CoverExtractor."""
+
+import os
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ereader.exceptions import InvalidEPUBError
+from ereader.utils.cover_extractor import CoverExtractor, _PooledZip, _ZipPool
+
+CONTAINER_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>"""
+
+JPEG_BYTES = b"\xff\xd8\xff\xe0fake-jpeg"
+PNG_BYTES = b"\x89PNG\r\n\x1a\nfake-png"
+
+
+def _create_epub(
+    tmp_path: Path,
+    manifest_items: str,
+    metadata: str = "",
+    files: dict[str, bytes] | None = None,
+    name: str = "book.epub",
+) -> Path:
+    """Create a minimal EPUB with the given manifest items and extra files.
+
+    Args:
+        tmp_path: Temporary directory from pytest fixture.
+        manifest_items: XML for the <item> elements inside <manifest>.
+        metadata: Extra XML placed inside <metadata>.
+        files: Mapping of archive path -> bytes to add to the EPUB.
+        name: Filename of the EPUB to create.
+
+    Returns:
+        Path to the created EPUB file.
+    """
+    opf_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0">
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+<dc:title>Cover Test</dc:title>
+{metadata}
+</metadata>
+<manifest>
+<item id="ch1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
+{manifest_items}
+</manifest>
+<spine>
+<itemref idref="ch1"/>
+</spine>
+</package>"""
+
+    epub_file = tmp_path / name
+    with zipfile.ZipFile(epub_file, "w") as zf:
+        zf.writestr("mimetype", "application/epub+zip")
+        zf.writestr("META-INF/container.xml", CONTAINER_XML)
+        zf.writestr("OEBPS/content.opf", opf_xml)
+        zf.writestr("OEBPS/chapter1.xhtml", "<html><body>Chapter</body></html>")
+        for path, data in (files or {}).items():
+            zf.writestr(path, data)
+    return epub_file
+
+
+class TestExtractCover:
+    """Tests for CoverExtractor.extract_cover strategies."""
+
+    def test_epub3_cover_image_property(self, tmp_path: Path) -> None:
+        """EPUB 3 properties='cover-image' item is extracted."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="c" href="images/front.jpg" media-type="image/jpeg" '
+            'properties="cover-image"/>',
+            files={"OEBPS/images/front.jpg": JPEG_BYTES},
+        )
+
+        assert CoverExtractor.extract_cover(epub) == (JPEG_BYTES, "jpg")
+
+    def test_epub2_meta_cover(self, tmp_path: Path) -> None:
+        """EPUB 2 <meta name='cover'> reference is extracted."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="cover-img" href="art.png" media-type="image/png"/>',
+            metadata='<meta name="cover" content="cover-img"/>',
+            files={"OEBPS/art.png": PNG_BYTES},
+        )
+
+        assert CoverExtractor.extract_cover(epub) == (PNG_BYTES, "png")
+
+    def test_filename_heuristic(self, tmp_path: Path) -> None:
+        """Image with 'cover' in its filename is used as fallback."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="img" href="images/Cover-Front.jpeg" media-type="image/jpeg"/>',
+            files={"OEBPS/images/Cover-Front.jpeg": JPEG_BYTES},
+        )
+
+        assert CoverExtractor.extract_cover(epub) == (JPEG_BYTES, "jpg")
+
+    def test_filename_heuristic_prefers_exact_name(self, tmp_path: Path) -> None:
+        """A conventional cover filename wins over earlier substring matches."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="b" href="back-cover.png" media-type="image/png"/>'
+            '<item id="f" href="images/cover.jpg" media-type="image/jpeg"/>',
+            files={"OEBPS/back-cover.png": PNG_BYTES, "OEBPS/images/cover.jpg": JPEG_BYTES},
+        )
+
+        assert CoverExtractor.extract_cover(epub) == (JPEG_BYTES, "jpg")
+
+    def test_epub3_takes_precedence_over_epub2(self, tmp_path: Path) -> None:
+        """EPUB 3 cover wins when both declarations are present."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="old" href="old.png" media-type="image/png"/>'
+            '<item id="new" href="new.jpg" media-type="image/jpeg" '
+            'properties="cover-image"/>',
+            metadata='<meta name="cover" content="old"/>',
+            files={"OEBPS/old.png": PNG_BYTES, "OEBPS/new.jpg": JPEG_BYTES},
+        )
+
+        assert CoverExtractor.extract_cover(epub) == (JPEG_BYTES, "jpg")
+
+    def test_no_cover_returns_none(self, tmp_path: Path) -> None:
+        """EPUB without any cover returns None."""
+        epub = _create_epub(tmp_path, "")
+
+        assert CoverExtractor.extract_cover(epub) is None
+
+    def test_missing_cover_file_returns_none(self, tmp_path: Path) -> None:
+        """Declared cover that is absent from the archive returns None."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="c" href="missing.jpg" media-type="image/jpeg" '
+            'properties="cover-image"/>',
+        )
+
+        assert CoverExtractor.extract_cover(epub) is None
+
+    def test_large_cover_is_streamed(self, tmp_path: Path) -> None:
+        """Covers above the streaming threshold are read into a bytearray."""
+        big_png = PNG_BYTES + os.urandom(600 * 1024)
+        epub = _create_epub(
+            tmp_path,
+            '<item id="c" href="cover.png" media-type="image/png" '
+            'properties="cover-image"/>',
+            files={"OEBPS/cover.png": big_png},
+        )
+
+        cover_bytes, extension = CoverExtractor.extract_cover(epub)
+
+        assert isinstance(cover_bytes, bytearray)
+        assert cover_bytes == big_png
+        assert extension == "png"
+
+    def test_nonexistent_file_raises(self, tmp_path: Path) -> None:
+        """Missing EPUB raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            CoverExtractor.extract_cover(tmp_path / "missing.epub")
+
+    def test_invalid_epub_raises(self, tmp_path: Path) -> None:
+        """Non-ZIP file raises InvalidEPUBError."""
+        bad = tmp_path / "bad.epub"
+        bad.write_text("not a zip")
+
+        with pytest.raises(InvalidEPUBError):
+            CoverExtractor.extract_cover(bad)
+
+
+class TestScanCache:
+    """Tests for memoization of OPF scans across extractions."""
+
+    def test_repeat_extraction_reuses_scan(self, tmp_path: Path) -> None:
+        """Second extraction of an unchanged file does not rescan the OPF."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="c" href="cover.jpg" media-type="image/jpeg" '
+            'properties="cover-image"/>',
+            files={"OEBPS/cover.jpg": JPEG_BYTES},
+        )
+
+        with patch.object(
+            CoverExtractor, "_scan_manifest", wraps=CoverExtractor._scan_manifest
+        ) as mock_scan:
+            first = CoverExtractor._extract_from_archive(epub, epub.stat().st_mtime_ns)
+            second = CoverExtractor._extract_from_archive(epub, epub.stat().st_mtime_ns)
+
+        assert first == second == (JPEG_BYTES, "jpg")
+        assert mock_scan.call_count == 1
+
+    def test_modified_file_is_rescanned(self, tmp_path: Path) -> None:
+        """A new modification time invalidates the memoized scan."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="c" href="cover.jpg" media-type="image/jpeg" '
+            'properties="cover-image"/>',
+            files={"OEBPS/cover.jpg": JPEG_BYTES},
+        )
+        assert CoverExtractor.extract_cover(epub) == (JPEG_BYTES, "jpg")
+
+        _create_epub(
+            tmp_path,
+            '<item id="c" href="cover.png" media-type="image/png" '
+            'properties="cover-image"/>',
+            files={"OEBPS/cover.png": PNG_BYTES},
+        )
+        stat = epub.stat()
+        os.utime(epub, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert CoverExtractor.extract_cover(epub) == (PNG_BYTES, "png")
+
+
+class TestCoverCache:
+    """Tests for the persistent cover cache."""
+
+    def test_cached_cover_skips_archive(self, tmp_path: Path) -> None:
+        """An unchanged EPUB is served from the cache without opening it."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="c" href="cover.png" media-type="image/png" '
+            'properties="cover-image"/>',
+            files={"OEBPS/cover.png": PNG_BYTES},
+        )
+        assert CoverExtractor.extract_cover(epub) == (PNG_BYTES, "png")
+        hits = CoverExtractor.cache_stats()["hits"]
+
+        with patch.object(CoverExtractor, "_extract_from_archive") as mock_extract:
+            assert CoverExtractor.extract_cover(epub) == (PNG_BYTES, "png")
+
+        mock_extract.assert_not_called()
+        assert CoverExtractor.cache_stats()["hits"] == hits + 1
+
+    def test_missing_cover_is_cached(self, tmp_path: Path) -> None:
+        """A book without a cover is remembered as such."""
+        epub = _create_epub(tmp_path, "")
+        assert CoverExtractor.extract_cover(epub) is None
+
+        with patch.object(CoverExtractor, "_extract_from_archive") as mock_extract:
+            assert CoverExtractor.extract_cover(epub) is None
+
+        mock_extract.assert_not_called()
+
+    def test_cache_file_under_data_dir(self, tmp_path: Path, isolated_data_dir: Path) -> None:
+        """Entries live in covers/ next to the library database, one per EPUB."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="c" href="cover.jpg" media-type="image/jpeg" '
+            'properties="cover-image"/>',
+            files={"OEBPS/cover.jpg": JPEG_BYTES},
+        )
+        CoverExtractor.extract_cover(epub)
+        stat = epub.stat()
+        os.utime(epub, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        CoverExtractor.extract_cover(epub)
+
+        entries = list((isolated_data_dir / "covers").iterdir())
+        assert len(entries) == 1
+        assert entries[0].name.endswith(f"-{epub.stat().st_mtime_ns}.cover")
+
+
+    def test_non_ascii_extension_still_returned(
+        self, tmp_path: Path, isolated_data_dir: Path
+    ) -> None:
+        """A cover whose extension cannot be cached is still extracted."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="c" href="cover.bildé" media-type="image/x-unknown" '
+            'properties="cover-image"/>',
+            files={"OEBPS/cover.bildé": PNG_BYTES},
+        )
+
+        assert CoverExtractor.extract_cover(epub) == (PNG_BYTES, "bildé")
+        assert not (isolated_data_dir / "covers").exists() or not any(
+            (isolated_data_dir / "covers").glob("*.cover")
+        )
+
+class TestZipPool:
+    """Tests for pooled archive handles."""
+
+    def test_repeat_extraction_reuses_handle(self, tmp_path: Path) -> None:
+        """Extracting the same unchanged file twice opens the archive once."""
+        epub = _create_epub(
+            tmp_path,
+            '<item id="c" href="cover.jpg" media-type="image/jpeg" '
+            'properties="cover-image"/>',
+            files={"OEBPS/cover.jpg": JPEG_BYTES},
+        )
+        CoverExtractor.release(epub)
+
+        with patch(
+            "ereader.utils.cover_extractor._PooledZip", wraps=_PooledZip
+        ) as mock_pooled:
+            CoverExtractor._extract_from_archive(epub, epub.stat().st_mtime_ns)
+            CoverExtractor._extract_from_archive(epub, epub.stat().st_mtime_ns)
+
+        assert mock_pooled.call_count == 1
+
+    def test_eviction_waits_for_borrower(self, tmp_path: Path) -> None:
+        """An evicted handle stays open until its borrower releases it."""
+        first = _create_epub(tmp_path, "", name="first.epub")
+        second = _create_epub(tmp_path, "", name="second.epub")
+        pool = _ZipPool(maxsize=1)
+
+        with pool.open(str(first), 1) as zf:
+            with pool.open(str(second), 1):
+                pass
+            assert zf.fp is not None
+            assert zf.namelist()
+        assert zf.fp is None
+
+        pool.clear()
+
+    def test_discard_closes_handle(self, tmp_path: Path) -> None:
+        """Discarding a path closes its idle pooled handle."""
+        epub = _create_epub(tmp_path, "")
+        pool = _ZipPool()
+
+        with pool.open(str(epub), 1) as zf:
+            pass
+        assert zf.fp is not None
+
+        pool.discard(str(epub))
+
+        assert zf.fp is None
+
+
+class TestExtractCovers:
+    """Tests for concurrent CoverExtractor.extract_covers."""
+
+    def test_extracts_all_books(self, tmp_path: Path) -> None:
+        """Every path is yielded once with its cover or None."""
+        with_cover = _create_epub(
+            tmp_path,
+            '<item id="c" href="cover.jpg" media-type="image/jpeg" '
+            'properties="cover-image"/>',
+            files={"OEBPS/cover.jpg": JPEG_BYTES},
+            name="with.epub",
+        )
+        without_cover = _create_epub(tmp_path, "", name="without.epub")
+
+        results = dict(CoverExtractor.extract_covers([with_cover, without_cover]))
+
+        assert results == {with_cover: (JPEG_BYTES, "jpg"), without_cover: None}
+
+    def test_failed_book_yields_none(self, tmp_path: Path) -> None:
+        """A missing or invalid file does not abort the batch."""
+        missing = tmp_path / "missing.epub"
+
+        assert list(CoverExtractor.extract_covers([missing])) == [(missing, None)]
+
+    def test_empty_input(self) -> None:
+        """No paths yields nothing."""
+        assert list(CoverExtractor.extract_covers([])) == []
+
+
+class TestGetImageExtension:
+    """Tests for CoverExtractor._get_image_extension."""
+
+    @pytest.mark.parametrize(
+        ("media_type", "href", "expected"),
+        [
+            ("image/jpeg", "a.bin", "jpg"),
+            ("image/png", "a.bin", "png"),
+            ("image/svg+xml", "a.bin", "svg"),
+            ("", "images/cover.JPEG", "jpg"),
+            ("", "images/cover.webp", "webp"),
+            ("application/octet-stream", "cover.gif", "gif"),
+            ("", "", "jpg"),
+            ("", "images.d/cover", "jpg"),
+            ("", "images/.hidden", "jpg"),
+        ],
+    )
+    def test_extension_resolution(self, media_type: str, href: str, expected: str) -> None:
+        """Extension is derived from media-type, then href, then defaults to jpg."""
+        assert CoverExtractor._get_image_extension(media_type, href) == expected
+
+
+class TestScanManifest:
+    """Tests for CoverExtractor._scan_manifest."""
+
+    def test_collects_all_strategies_in_one_pass(self) -> None:
+        """Scan records EPUB 3, EPUB 2 and filename candidates together."""
+        opf_data = (
+            b"""<package xmlns="http://www.idpf.org/2007/opf">
+<metadata><meta name="cover" content="m"/></metadata>
+<manifest>
+<item id="m" href="meta.png" media-type="image/png"/>
+<item id="p" href="img/cover.jpg" media-type="image/jpeg" properties="cover-image"/>
+<item id="t" href="text/cover.xhtml" media-type="application/xhtml+xml"/>
+</manifest>
+</package>"""
+        )
+
+        scan = CoverExtractor._scan_manifest(opf_data)
+
+        assert scan.epub3_cover == ("img/cover.jpg", "image/jpeg")
+        assert scan.meta_cover_id == "m"
+        assert scan.id_to_item["m"] == ("meta.png", "image/png")
+        assert scan.exact_cover_candidates == [("img/cover.jpg", "image/jpeg")]
+
+    def test_media_type_is_lowercased(self) -> None:
+        """Manifest media-types are canonicalized to lowercase."""
+        scan = CoverExtractor._scan_manifest(
+            b"""<package><manifest>
+<item id="c" href="cover.png" media-type="Image/PNG"/>
+</manifest><metadata/></package>"""
+        )
+
+        assert scan.id_to_item["c"] == ("cover.png", "image/png")
+        assert scan.exact_cover_candidates == [("cover.png", "image/png")]
+
+    def test_stops_after_manifest_and_metadata(self) -> None:
+        """Content after the manifest and metadata is never parsed."""
+        opf_data = b"""<package xmlns="http://www.idpf.org/2007/opf">
+<metadata><meta name="cover" content="c"/></metadata>
+<manifest><item id="c" href="c.png" media-type="image/png"/></manifest>
+<spine><itemref idref="c"/><broken"""
+
+        scan = CoverExtractor._scan_manifest(opf_data)
+
+        assert scan.meta_cover_id == "c"
+        assert scan.id_to_item == {"c": ("c.png", "image/png")}
@@ -0,0 +1,62 @@
+"""Tests for database utility functions."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from ereader.utils import database_utils
+
+# Bound at import, before the autouse fixture redirects the module attribute
+get_library_db_path = database_utils.get_library_db_path
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point the platform data directory at tmp_path with a cold cache."""
+    data_dir = tmp_path / "data" / "ereader"
+    monkeypatch.setattr(database_utils, "_PLATFORM_DATA_DIR", data_dir)
+    get_library_db_path.cache_clear()
+    yield data_dir
+    get_library_db_path.cache_clear()
+
+
+class TestGetLibraryDbPath:
+    """Tests for get_library_db_path."""
+
+    def test_creates_data_dir(self, data_dir: Path) -> None:
+        """The database lives in the data directory, which is created."""
+        assert get_library_db_path() == data_dir / "library.db"
+        assert data_dir.is_dir()
+
+    def test_result_is_cached(self, data_dir: Path) -> None:
+        """Later calls return the cached path without recreating the directory."""
+        first = get_library_db_path()
+        data_dir.rmdir()
+
+        assert get_library_db_path() is first
+        assert not data_dir.exists()
+
+
+class TestPlatformDataDir:
+    """Tests for _platform_data_dir."""
+
+    @pytest.mark.parametrize(
+        ("platform", "expected"),
+        [
+            ("darwin", ("Library", "Application Support", "EReader")),
+            ("linux", (".local", "share", "ereader")),
+        ],
+    )
+    def test_unix_like_platforms(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        platform: str,
+        expected: tuple[str, ...],
+    ) -> None:
+        """macOS and Linux directories are rooted at the home directory."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(database_utils.sys, "platform", platform)
+
+        assert database_utils._platform_data_dir() == tmp_path.joinpath(*expected)
@@ -1,13 +1,24 @@
 """Tests for HTML resource resolution utilities."""
 
+import base64
+import os
 import zipfile
 from io import BytesIO
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
-from PIL import Image
+import pytest
+from PIL import Image, ImageFile
 
+from ereader.exceptions import CorruptedEPUBError
 from ereader.models.epub import EPUBBook
-from ereader.utils.html_resources import downscale_image, resolve_images_in_html
+from ereader.utils import html_resources
+from ereader.utils.html_resources import (
+    downscale_image,
+    resolve_images_in_html,
+    resolve_images_in_html_bytes,
+)
+from ereader.utils.image_cache import ImageCache
 
 
 class TestResolveImagesInHTML:
@@ -488,6 +499,146 @@ class TestResolveImagesInHTML:
         assert resolved_html == html
 
 
+    def test_image_cache_reuses_image(self, tmp_path: Path) -> None:
+        """Test that a cached image is reused across chapters for the same file."""
+        epub_file = tmp_path / "test.epub"
+
+        container_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>"""
+
+        opf_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0">
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+<dc:title>Test Book</dc:title>
+</metadata>
+<manifest>
+<item id="ch1" href="chapter1.xhtml" media-type="application/xhtml+xml"/>
+<item id="ch2" href="text/chapter2.xhtml" media-type="application/xhtml+xml"/>
+<item id="img1" href="images/test.png" media-type="image/png"/>
+</manifest>
+<spine toc="ncx">
+<itemref idref="ch1"/>
+<itemref idref="ch2"/>
+</spine>
+</package>"""
+
+        with zipfile.ZipFile(epub_file, "w") as zf:
+            zf.writestr("mimetype", "application/epub+zip")
+            zf.writestr("META-INF/container.xml", container_xml)
+            zf.writestr("OEBPS/content.opf", opf_xml)
+            zf.writestr("OEBPS/chapter1.xhtml", "<html></html>")
+            zf.writestr("OEBPS/text/chapter2.xhtml", "<html></html>")
+            zf.writestr("OEBPS/images/test.png", b"\x89PNG\r\n\x1a\n")
+
+        book = EPUBBook(epub_file)
+        cache = ImageCache()
+
+        with patch.object(book, "get_resource", wraps=book.get_resource) as mock_get:
+            first = resolve_images_in_html(
+                '<img src="images/test.png" />', book, "chapter1.xhtml", image_cache=cache
+            )
+            second = resolve_images_in_html(
+                '<img src="../images/test.png" />', book, "text/chapter2.xhtml", image_cache=cache
+            )
+
+        assert mock_get.call_count == 1
+        assert "data:image/png;base64," in first
+        assert first == second
+        # Raw bytes are cached, not the larger base64 data URL
+        assert cache.get(f"{epub_file}:OEBPS/images/test.png") == (
+            b"\x89PNG\r\n\x1a\n",
+            "image/png",
+        )
+
+    def test_distinct_images_resolved_once_each(self) -> None:
+        """Test that each distinct src is loaded once and missing ones stay intact."""
+        book = MagicMock()
+
+        def get_resource(src: str, relative_to: str | None = None) -> bytes:
+            if src == "missing.svg":
+                raise CorruptedEPUBError("not found")
+            return f"<svg id='{src}'/>".encode()
+
+        book.get_resource.side_effect = get_resource
+        html = (
+            '<img src="a.svg"/><p>text</p><img src="b.svg"/>'
+            '<img src="a.svg"/><img src="missing.svg"/>'
+        )
+
+        resolved_html = resolve_images_in_html(html, book)
+
+        assert sorted(call.args[0] for call in book.get_resource.call_args_list) == [
+            "a.svg",
+            "b.svg",
+            "missing.svg",
+        ]
+        assert resolved_html.count("data:image/svg+xml;base64,") == 3
+        assert "<p>text</p>" in resolved_html
+        assert '<img src="missing.svg"/>' in resolved_html
+        assert resolved_html.index(html_resources._b64encode_str(b"<svg id='b.svg'/>")) > (
+            resolved_html.index("<p>text</p>")
+        )
+
+    def test_text_only_chapter_skips_tag_scan(self) -> None:
+        """Test that HTML without <img> is returned without running the tag pattern."""
+        book = MagicMock()
+        html = "<html><body><p>No images here.</p></body></html>"
+
+        with patch.object(html_resources, "_IMG_PATTERN") as mock_pattern:
+            assert resolve_images_in_html(html, book) is html
+
+        mock_pattern.sub.assert_not_called()
+
+    def test_data_src_attribute_is_not_src(self) -> None:
+        """Test that lazy-load attributes like data-src are not resolved."""
+        book = MagicMock()
+        html = '<img data-src="images/lazy.png" alt="Lazy" />'
+
+        assert resolve_images_in_html(html, book) == html
+        book.get_resource.assert_not_called()
+
+    def test_src_spliced_into_original_tag(self) -> None:
+        """Test that the data URL replaces only the src value in the tag."""
+        book = MagicMock()
+        book.get_resource.return_value = b"<svg/>"
+        html = "<IMG alt='Logo' SRC = 'logo.svg' width='10'>"
+
+        resolved_html = resolve_images_in_html(html, book)
+
+        assert resolved_html.startswith("<IMG alt='Logo' SRC = 'data:image/svg+xml;base64,")
+        assert resolved_html.endswith(" width='10'>")
+
+    def test_malformed_tag_does_not_backtrack(self) -> None:
+        """Test that an unterminated tag is rejected quickly."""
+        book = MagicMock()
+        html = "<img " + "a=b " * 20000 + 'src="x.png'
+
+        assert resolve_images_in_html(html, book) == html
+
+    def test_bytes_variant_matches_text_variant(self) -> None:
+        """Test that resolving bytes gives the encoded result of resolving text."""
+        book = MagicMock()
+        book.get_resource.return_value = b"<svg/>"
+        html = '<p>Caf\u00e9</p><img src="logo.svg" alt="Logo"/><img src="http://x/y.png"/>'
+
+        resolved_bytes = resolve_images_in_html_bytes(html.encode(), book)
+
+        assert resolved_bytes == resolve_images_in_html(html, book).encode()
+        assert b"data:image/svg+xml;base64," in resolved_bytes
+
+    def test_bytes_variant_text_only_returned_unchanged(self) -> None:
+        """Test that bytes without <img> are returned as the same object."""
+        book = MagicMock()
+        html = b"<html><body><p>No images here.</p></body></html>"
+
+        assert resolve_images_in_html_bytes(html, book) is html
+        book.get_resource.assert_not_called()
+
+
 class TestDownscaleImage:
     """Test downscale_image function."""
 
@@ -665,6 +816,60 @@ class TestDownscaleImage:
         # Should be unchanged
         assert result == original
 
+    def test_small_image_pixels_not_decoded(self) -> None:
+        """Test that images within limits are returned without decoding pixels."""
+        small = self._create_test_image(100, 100)
+
+        with patch.object(ImageFile.ImageFile, "load") as mock_load:
+            result = downscale_image(small)
+
+        assert result is small
+        mock_load.assert_not_called()
+
+    def test_animated_image_unchanged(self) -> None:
+        """Test that animated GIFs keep all frames instead of being downscaled."""
+        frames = [Image.new('RGB', (3000, 2000), color) for color in ('red', 'blue')]
+        output = BytesIO()
+        frames[0].save(output, format='GIF', save_all=True, append_images=frames[1:])
+        animated = output.getvalue()
+
+        assert downscale_image(animated) is animated
+
+    def test_downscaled_result_is_buffer_view(self) -> None:
+        """Test that downscaled output is a read-only view that encodes like bytes."""
+        result = downscale_image(self._create_test_image(3000, 2000))
+
+        assert isinstance(result, memoryview)
+        assert result.readonly
+        assert html_resources._b64encode_str(result) == base64.b64encode(bytes(result)).decode("ascii")
+
+    def test_pillow_backend_logged_once(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that the Pillow build is logged once, on the first resize."""
+        html_resources._log_pillow_backend.cache_clear()
+        large = self._create_test_image(3000, 2000)
+
+        with caplog.at_level("INFO", logger="ereader.utils.html_resources"):
+            downscale_image(large)
+            downscale_image(large)
+
+        messages = [r.getMessage() for r in caplog.records if "SIMD build" in r.getMessage()]
+        assert len(messages) == 1
+
+    def test_jpeg_uses_draft_decode(self) -> None:
+        """Test that large JPEGs are decoded at reduced scale before resizing."""
+        original = self._create_test_image(4000, 3000, format='JPEG')
+
+        with patch.object(
+            Image.Image, "resize", autospec=True, side_effect=Image.Image.resize
+        ) as mock_resize:
+            result = downscale_image(original, max_width=1920, max_height=1080)
+
+        source, size, resample = mock_resize.call_args.args
+        assert source.size == (2000, 1500)  # libjpeg 1/2 scale decode
+        assert size == (1440, 1080)
+        assert resample == Image.Resampling.BICUBIC
+        assert Image.open(BytesIO(result)).size == (1440, 1080)
+
     def test_format_preservation(self) -> None:
         """Test that original image format is preserved."""
         # Test JPEG preservation
@@ -678,3 +883,84 @@ class TestDownscaleImage:
         png_result = downscale_image(png_img)
         png_out = Image.open(BytesIO(png_result))
         assert png_out.format == 'PNG'
+
+    def test_presized_buffer_trimmed_to_encoded_data(self) -> None:
+        """Test that no unused tail of the presized output buffer is returned."""
+        jpeg_result = downscale_image(self._create_test_image(2400, 1800, format='JPEG'))
+        png_result = downscale_image(self._create_test_image(2400, 1800, format='PNG'))
+
+        assert bytes(jpeg_result).endswith(b"\xff\xd9")  # JPEG end-of-image marker
+        assert bytes(png_result).endswith(b"IEND\xaeB`\x82")  # PNG end chunk
+
+    @staticmethod
+    def _create_photo_png(width: int, height: int, mode: str = 'RGB') -> bytes:
+        """Create a PNG with photographic color variety (random noise)."""
+        img = Image.frombytes('RGB', (width, height), os.urandom(width * height * 3))
+        if mode == 'RGBA':
+            img.putalpha(128)
+        output = BytesIO()
+        img.save(output, format='PNG')
+        return output.getvalue()
+
+    def test_photographic_png_reencoded_as_jpeg(self) -> None:
+        """Test that an oversized opaque photographic PNG is saved as JPEG."""
+        original = self._create_photo_png(400, 300)
+
+        result, mime_type = html_resources._downscale_image(
+            original, max_width=200, max_height=150
+        )
+
+        assert mime_type == 'image/jpeg'
+        out = Image.open(BytesIO(result))
+        assert out.format == 'JPEG'
+        assert out.size == (200, 150)
+        assert len(result) < len(original)
+
+    def test_translucent_png_kept_as_png(self) -> None:
+        """Test that PNGs with transparency are not converted to JPEG."""
+        original = self._create_photo_png(400, 300, mode='RGBA')
+
+        result, mime_type = html_resources._downscale_image(
+            original, max_width=200, max_height=150
+        )
+
+        assert mime_type is None
+        assert Image.open(BytesIO(result)).format == 'PNG'
+
+
+class TestGetMimeType:
+    """Test _get_mime_type helper."""
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("images/photo.PNG", "image/png"),
+            ("../art/diagram.svg", "image/svg+xml"),
+            ("cover.jpeg", "image/jpeg"),
+            ("a.JPG", "image/jpeg"),
+            (".png", "image/png"),
+            ("anim.webp", "image/webp"),
+            ("images.d/picture", "image/jpeg"),
+            ("noextension", "image/jpeg"),
+            ("scan.tiff", "image/jpeg"),
+        ],
+    )
+    def test_mime_type_from_extension(self, filename: str, expected: str) -> None:
+        """Test MIME type is derived from the file extension, defaulting to JPEG."""
+        assert html_resources._get_mime_type(filename) == expected
+
+
+class TestB64Encode:
+    """Test _b64encode_str helper."""
+
+    def test_matches_stdlib(self) -> None:
+        """Test encoding matches stdlib base64 with the active backend."""
+        data = bytes(range(256)) * 4
+
+        assert html_resources._b64encode_str(data) == base64.b64encode(data).decode("ascii")
+
+    def test_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test stdlib encoder is used when pybase64 is unavailable."""
+        monkeypatch.setattr(html_resources, "pybase64", None)
+
+        assert html_resources._b64encode_str(b"\x89PNG") == "iVBORw=="
@@ -1,5 +1,9 @@
 """Tests for the ImageCache class."""
 
+import sys
+import threading
+from collections import OrderedDict
+
 import pytest
 
 from ereader.utils.image_cache import ImageCache
@@ -86,6 +90,20 @@ class TestImageCacheLRUEviction:
         # Newer items should remain
         assert cache.get("img2") is not None or cache.get("img3") is not None
 
+    def test_multiple_evictions_logged_once(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Should log a single INFO summary when one set() evicts several entries."""
+        cache = ImageCache(max_memory_mb=0.0001)  # ~100 bytes
+        cache.set("img1", (b"x" * 10, "image/png"))  # 19 bytes
+        cache.set("img2", (b"y" * 10, "image/png"))  # 19 bytes
+
+        with caplog.at_level("INFO", logger="ereader.utils.image_cache"):
+            cache.set("img3", (b"z" * 80, "image/png"))  # 89 bytes, needs both gone
+
+        evictions = [r for r in caplog.records if "EVICTION" in r.message]
+        assert len(evictions) == 1
+        assert "2 entries" in evictions[0].message
+        assert cache.stats()["evictions"] == 2
+
     def test_lru_order_preserved(self) -> None:
         """Should evict least recently used items first."""
         cache = ImageCache(max_memory_mb=0.0001)  # ~100 bytes
@@ -121,6 +139,22 @@ class TestImageCacheLRUEviction:
         # img1 should survive because it was accessed
         # img2 might be evicted as least recently used
 
+    def test_evict_to_target(self) -> None:
+        """evict_to should drop LRU images until within the target."""
+        cache = ImageCache()
+        for i in range(3):
+            cache.set(f"img{i}", "x" * 1000)
+        cache.get("img0")  # img1 is now least recently used
+
+        one_item_bytes = int(cache.stats()["memory_mb"] * 1024 * 1024) // 3
+        evicted = cache.evict_to(one_item_bytes * 2)
+
+        assert evicted == 1
+        assert cache.get("img1") is None
+        assert cache.get("img0") is not None
+        assert cache.get("img2") is not None
+        assert cache.stats()["evictions"] == 1
+
 
 class TestImageCacheStatistics:
     """Test cache statistics tracking."""
@@ -140,6 +174,27 @@ class TestImageCacheStatistics:
         assert stats["memory_utilization"] == 0.0
         assert stats["avg_item_size_kb"] == 0.0
 
+    def test_memory_accounts_ascii_string_size(self) -> None:
+        """Should account base64 strings at their full in-memory size."""
+        cache = ImageCache(max_memory_mb=50)
+        value = "data:image/png;base64," + "A" * 10_000
+
+        cache.set("img", value)
+
+        assert cache._current_memory_bytes == sys.getsizeof(value)
+
+        cache.set("img", value[:100])
+        assert cache._current_memory_bytes == sys.getsizeof(value[:100])
+
+    def test_memory_accounts_raw_image_bytes(self) -> None:
+        """Should account (bytes, mime_type) entries by their payload size."""
+        cache = ImageCache(max_memory_mb=50)
+
+        cache.set("img", (b"\x00" * 3000, "image/png"))
+
+        assert cache.get("img") == (b"\x00" * 3000, "image/png")
+        assert cache._current_memory_bytes == 3000 + len("image/png")
+
     def test_hits_and_misses_tracking(self) -> None:
         """Should track cache hits and misses."""
         cache = ImageCache()
@@ -163,6 +218,57 @@ class TestImageCacheStatistics:
         assert stats["hits"] == 2
         assert stats["misses"] == 1
 
+    def test_lookups_from_short_lived_threads_counted(self) -> None:
+        """Should count every lookup made by threads that have since exited."""
+        cache = ImageCache()
+        cache.set("img1", "data1")
+
+        def lookups() -> None:
+            for i in range(20):
+                cache.get("img1" if i % 2 else "missing")
+
+        workers = [threading.Thread(target=lookups) for _ in range(5)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        stats = cache.stats()
+        assert stats["hits"] == 50
+        assert stats["misses"] == 50
+        # Reading the stats does not change them
+        assert cache.stats()["hits"] == 50
+
+    def test_repeated_stats_calls_are_stable(self) -> None:
+        """Should report the same totals however often stats() is called."""
+        cache = ImageCache()
+        cache.set("img1", "data1")
+        cache.get("img1")
+        cache.get("img1")
+        cache.get("missing")
+
+        for _ in range(5):
+            stats = cache.stats()
+            assert stats["hits"] == 2
+            assert stats["misses"] == 1
+
+    def test_clear_resets_lookup_counts(self) -> None:
+        """Should not count lookups made before clear(), but count later ones."""
+        cache = ImageCache()
+        cache.get("img1")
+        cache.stats()
+
+        cache.clear()
+        assert cache.stats()["misses"] == 0
+
+        cache.set("img1", "data1")
+        cache.get("img1")
+        cache.get("missing")
+        for _ in range(3):
+            stats = cache.stats()
+            assert stats["hits"] == 1
+            assert stats["misses"] == 1
+
     def test_hit_rate_calculation(self) -> None:
         """Should calculate hit rate correctly."""
         cache = ImageCache()
@@ -300,3 +406,19 @@ class TestImageCacheEdgeCases:
         for key in keys:
             cache.set(key, f"data_for_{key}")
             assert cache.get(key) == f"data_for_{key}"
+
+    def test_get_survives_eviction_after_lookup(self) -> None:
+        """Should return the looked-up value even if it is evicted before the LRU update."""
+        cache = ImageCache()
+
+        class EvictingDict(OrderedDict):
+            """Cache dict that loses the entry between get() and move_to_end()."""
+
+            def move_to_end(self, key: str, last: bool = True) -> None:
+                self.pop(key, None)
+                super().move_to_end(key, last)
+
+        cache._cache = EvictingDict(img1="data1")
+
+        assert cache.get("img1") == "data1"
+        assert cache.stats()["hits"] == 1
@@ -1,11 +1,14 @@
 """Tests for memory monitoring functionality."""
 
+import sys
 import time
 from unittest.mock import MagicMock, patch
 
+import psutil
 import pytest
 
-from ereader.utils.memory_monitor import MemoryMonitor
+from ereader.utils import memory_monitor
+from ereader.utils.memory_monitor import MemoryMonitor, _open_statm
 
 
 class TestMemoryMonitorInit:
@@ -33,6 +36,11 @@ class TestMemoryMonitorInit:
         with pytest.raises(ValueError, match="threshold_mb must be positive"):
             MemoryMonitor(threshold_mb=-10)
 
+    def test_init_invalid_cache_ttl_negative(self) -> None:
+        """Test initialization fails with negative cache TTL."""
+        with pytest.raises(ValueError, match="cache_ttl_s must not be negative"):
+            MemoryMonitor(cache_ttl_s=-1)
+
 
 class TestMemoryMonitorGetCurrentUsage:
     """Test get_current_usage method."""
@@ -70,6 +78,124 @@ class TestMemoryMonitorGetCurrentUsage:
 
         assert usage == pytest.approx(50.5, rel=0.01)
 
+    @patch("psutil.Process")
+    def test_get_current_usage_cached_within_ttl(self, mock_process_class: MagicMock) -> None:
+        """Test repeated calls within the TTL reuse the last reading."""
+        mock_mem_info = MagicMock()
+        mock_mem_info.rss = 100 * 1024 * 1024
+
+        mock_process = MagicMock()
+        mock_process.memory_info.return_value = mock_mem_info
+        mock_process_class.return_value = mock_process
+
+        monitor = MemoryMonitor(cache_ttl_s=60)
+        monitor.get_current_usage()
+        mock_mem_info.rss = 200 * 1024 * 1024
+
+        assert monitor.get_current_usage() == pytest.approx(100.0, rel=0.01)
+        mock_process.memory_info.assert_called_once()
+
+    @patch("psutil.Process")
+    def test_refresh_bypasses_cache(self, mock_process_class: MagicMock) -> None:
+        """Test refresh() rereads memory and updates the cached reading."""
+        mock_mem_info = MagicMock()
+        mock_mem_info.rss = 100 * 1024 * 1024
+
+        mock_process = MagicMock()
+        mock_process.memory_info.return_value = mock_mem_info
+        mock_process_class.return_value = mock_process
+
+        monitor = MemoryMonitor(cache_ttl_s=60)
+        monitor.get_current_usage()
+        mock_mem_info.rss = 200 * 1024 * 1024
+
+        assert monitor.refresh() == pytest.approx(200.0, rel=0.01)
+        assert monitor.get_current_usage() == pytest.approx(200.0, rel=0.01)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+    def test_statm_reading_matches_psutil(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the /proc/self/statm reading agrees with psutil's RSS."""
+        monkeypatch.setattr(memory_monitor, "_open_statm", _open_statm)  # Undo conftest
+        monitor = MemoryMonitor(cache_ttl_s=0)
+        assert monitor._statm_fd is not None
+
+        usage = monitor.get_current_usage()
+
+        psutil_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+        assert usage == pytest.approx(psutil_mb, abs=5)
+
+    def test_statm_descriptor_closed_on_delete(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the statm descriptor is closed when the monitor is collected."""
+        monkeypatch.setattr(memory_monitor, "_open_statm", lambda: 12345)
+        monkeypatch.setattr(memory_monitor.os, "sysconf", lambda name: 4096, raising=False)
+        monitor = MemoryMonitor()
+
+        with patch.object(memory_monitor.os, "close") as mock_close:
+            del monitor
+
+        mock_close.assert_called_once_with(12345)
+
+
+class TestMemoryMonitorBackgroundSampling:
+    """Test start_background/stop_background."""
+
+    @patch("psutil.Process")
+    def test_background_sample_served_without_reading(
+        self, mock_process_class: MagicMock
+    ) -> None:
+        """Test get_current_usage returns the sampler's reading without reading memory."""
+        mock_mem_info = MagicMock()
+        mock_mem_info.rss = 100 * 1024 * 1024
+
+        mock_process = MagicMock()
+        mock_process.memory_info.return_value = mock_mem_info
+        mock_process_class.return_value = mock_process
+
+        monitor = MemoryMonitor(cache_ttl_s=0)
+        monitor.start_background(interval=60)
+        try:
+            for _ in range(10):
+                assert monitor.get_current_usage() == pytest.approx(100.0, rel=0.01)
+        finally:
+            monitor.stop_background()
+
+        mock_process.memory_info.assert_called_once()  # The initial sample
+
+    @patch("psutil.Process")
+    def test_background_sampler_updates_reading(self, mock_process_class: MagicMock) -> None:
+        """Test the sampler thread picks up new memory readings."""
+        mock_mem_info = MagicMock()
+        mock_mem_info.rss = 100 * 1024 * 1024
+
+        mock_process = MagicMock()
+        mock_process.memory_info.return_value = mock_mem_info
+        mock_process_class.return_value = mock_process
+
+        monitor = MemoryMonitor()
+        monitor.start_background(interval=0.01)
+        try:
+            mock_mem_info.rss = 200 * 1024 * 1024
+            deadline = time.monotonic() + 2
+            while monitor.get_current_usage() < 150 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert monitor.get_current_usage() == pytest.approx(200.0, rel=0.01)
+        finally:
+            monitor.stop_background()
+
+        assert monitor._sampler is None
+
+    def test_start_background_invalid_interval(self) -> None:
+        """Test start_background rejects a non-positive interval."""
+        monitor = MemoryMonitor()
+        with pytest.raises(ValueError, match="interval must be positive"):
+            monitor.start_background(interval=0)
+
+    def test_stop_background_without_start(self) -> None:
+        """Test stop_background is a no-op when no sampler is running."""
+        monitor = MemoryMonitor()
+        monitor.stop_background()
+        assert monitor._sampler is None
+
 
 class TestMemoryMonitorCheckThreshold:
     """Test check_threshold method."""
@@ -146,7 +272,7 @@ class TestMemoryMonitorCheckThreshold:
         mock_process.memory_info.return_value = mock_mem_info
         mock_process_class.return_value = mock_process
 
-        monitor = MemoryMonitor(threshold_mb=150)
+        monitor = MemoryMonitor(threshold_mb=150, cache_ttl_s=0)
 
         # First: exceed threshold
         mock_mem_info.rss = 200 * 1024 * 1024
@@ -220,7 +346,7 @@ class TestMemoryMonitorMilestones:
         mock_process.memory_info.return_value = mock_mem_info
         mock_process_class.return_value = mock_process
 
-        monitor = MemoryMonitor()
+        monitor = MemoryMonitor(cache_ttl_s=0)
 
         # Reach 100 MB
         mock_mem_info.rss = 100 * 1024 * 1024
@@ -242,6 +368,26 @@ class TestMemoryMonitorMilestones:
             monitor.check_threshold()
         assert "Memory milestone reached: 150 MB" in caplog.text
 
+    @pytest.mark.parametrize(
+        ("usage_mb", "expected"), [(99.9, None), (124.9, 100), (180, 175), (400, 300)]
+    )
+    @patch("psutil.Process")
+    def test_highest_milestone_passed(
+        self, mock_process_class: MagicMock, usage_mb: float, expected: int | None
+    ) -> None:
+        """Test the highest milestone at or below current usage is recorded."""
+        mock_mem_info = MagicMock()
+        mock_mem_info.rss = int(usage_mb * 1024 * 1024)
+
+        mock_process = MagicMock()
+        mock_process.memory_info.return_value = mock_mem_info
+        mock_process_class.return_value = mock_process
+
+        monitor = MemoryMonitor(threshold_mb=1000)
+        monitor.check_threshold()
+
+        assert monitor._last_milestone_logged == expected
+
     @patch("psutil.Process")
     def test_no_milestone_below_100mb(
         self, mock_process_class: MagicMock, caplog: pytest.LogCaptureFixture
@@ -360,3 +506,25 @@ class TestMemoryMonitorGetStats:
 
         assert stats["threshold_exceeded"] is True
         assert stats["current_usage_mb"] > stats["threshold_mb"]
+
+    @patch("psutil.Process")
+    def test_get_stats_reads_in_oneshot(self, mock_process_class: MagicMock) -> None:
+        """Test process fields are read inside a single psutil oneshot() scan."""
+        mock_mem_info = MagicMock()
+        mock_mem_info.rss = 100 * 1024 * 1024
+
+        mock_process = MagicMock()
+        mock_process_class.return_value = mock_process
+
+        def memory_info() -> MagicMock:
+            mock_process.oneshot.return_value.__enter__.assert_called_once()
+            mock_process.oneshot.return_value.__exit__.assert_not_called()
+            return mock_mem_info
+
+        mock_process.memory_info.side_effect = memory_info
+
+        monitor = MemoryMonitor(cache_ttl_s=0)
+        stats = monitor.get_stats()
+
+        assert stats["current_usage_mb"] == pytest.approx(100.0, rel=0.01)
+        mock_process.oneshot.return_value.__exit__.assert_called_once()
@@ -4,6 +4,8 @@ This module tests the PaginationEngine class which calculates page breaks
 and manages page navigation within chapters.
 """
 
+import dataclasses
+
 import pytest
 
 from ereader.utils.pagination_engine import PageBreaks, PaginationEngine
@@ -23,6 +25,13 @@ class TestPageBreaks:
         assert breaks.content_height == 2400
         assert breaks.page_breaks == [0, 800, 1600, 2400]
 
+    def test_page_breaks_immutable(self) -> None:
+        """Test that PageBreaks fields cannot be reassigned."""
+        breaks = PageBreaks(viewport_height=800, content_height=1000, page_breaks=[0, 800, 1000])
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            breaks.viewport_height = 600
+
     def test_page_count_property(self) -> None:
         """Test page_count property calculation."""
         breaks = PageBreaks(
@@ -80,6 +89,13 @@ class TestPaginationEngine:
         assert breaks.page_breaks == [0, 800, 1600, 2400, 2500]
         assert breaks.page_count == 5
 
+    def test_calculate_page_breaks_empty_content(self) -> None:
+        """Test that empty content still has a single break at 0."""
+        engine = PaginationEngine()
+        breaks = engine.calculate_page_breaks(content_height=0, viewport_height=800)
+
+        assert breaks.page_breaks == [0]
+
     def test_calculate_page_breaks_updates_internal_state(self) -> None:
         """Test that calculate_page_breaks updates internal state."""
         engine = PaginationEngine()
@@ -114,6 +130,13 @@ class TestPaginationEngine:
         assert engine.get_page_number(2400) == 3  # Start of fourth page
         assert engine.get_page_number(2500) == 3  # End of content
 
+    def test_get_page_number_negative_scroll(self) -> None:
+        """Test a negative scroll position (overscroll) maps to the first page."""
+        engine = PaginationEngine()
+        engine.calculate_page_breaks(content_height=2500, viewport_height=800)
+
+        assert engine.get_page_number(-50) == 0
+
     def test_get_page_number_beyond_content(self) -> None:
         """Test get_page_number with scroll position beyond content."""
         engine = PaginationEngine()
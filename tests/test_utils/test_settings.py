@@ -1,5 +1,7 @@
 """Tests for ReaderSettings class."""
 
+from unittest.mock import patch
+
 import pytest
 from PyQt6.QtCore import QSettings
 
@@ -63,6 +65,80 @@ class TestReaderSettings:
         assert loaded_position.scroll_offset == 450
         assert loaded_position.mode == NavigationMode.PAGE
 
+    def test_save_reading_position_sync_rate_limited(self, settings):
+        """Test that back-to-back saves sync the backing store only once."""
+        position = ReadingPosition(
+            chapter_index=1, page_number=0, scroll_offset=0, mode=NavigationMode.SCROLL
+        )
+
+        with patch.object(settings._settings, "sync") as mock_sync:
+            settings.save_reading_position("/path/to/a.epub", position)
+            settings.save_reading_position("/path/to/b.epub", position)
+
+        mock_sync.assert_called_once()
+        assert settings.load_reading_position("/path/to/b.epub") == position
+
+    def test_deferred_sync_flushed_by_timer(self, settings, qtbot):
+        """Test that a save inside the sync interval is synced once it elapses."""
+        position = ReadingPosition(
+            chapter_index=1, page_number=0, scroll_offset=0, mode=NavigationMode.SCROLL
+        )
+        settings.flush()
+
+        with (
+            patch.object(ReaderSettings, "_SYNC_INTERVAL_S", 0.05),
+            patch.object(settings._settings, "sync") as mock_sync,
+        ):
+            settings.save_reading_position("/path/to/a.epub", position)
+            settings.set_default_navigation_mode(NavigationMode.PAGE)
+            assert settings._sync_timer.isActive()
+            mock_sync.assert_not_called()
+
+            qtbot.waitUntil(lambda: mock_sync.call_count == 1, timeout=1000)
+
+        assert not settings._sync_timer.isActive()
+
+    def test_flush_syncs_immediately(self, settings):
+        """Test that flush() writes pending changes and cancels the timer."""
+        settings.flush()
+        settings.set_default_navigation_mode(NavigationMode.PAGE)
+        assert settings._sync_timer.isActive()
+
+        with patch.object(settings._settings, "sync") as mock_sync:
+            settings.flush()
+
+        mock_sync.assert_called_once()
+        assert not settings._sync_timer.isActive()
+
+    def test_position_stored_as_single_value(self, settings):
+        """Test that a reading position is stored under one settings key."""
+        position = ReadingPosition(
+            chapter_index=3, page_number=7, scroll_offset=120, mode=NavigationMode.PAGE
+        )
+
+        settings.save_reading_position("/path/to/book.epub", position)
+
+        book_keys = [key for key in settings._settings.allKeys() if key.startswith("books/")]
+        assert book_keys == ["books/path/to/book.epub"]
+
+    def test_legacy_position_migrated(self, settings):
+        """Test that a position saved as separate keys loads and is repacked."""
+        book_path = "/path/to/legacy.epub"
+        prefix = f"books/{book_path}"
+        settings._settings.setValue(f"{prefix}/chapter_index", 4)
+        settings._settings.setValue(f"{prefix}/page_number", 2)
+        settings._settings.setValue(f"{prefix}/scroll_offset", 300)
+        settings._settings.setValue(f"{prefix}/mode", NavigationMode.PAGE.value)
+
+        loaded_position = settings.load_reading_position(book_path)
+
+        assert loaded_position == ReadingPosition(
+            chapter_index=4, page_number=2, scroll_offset=300, mode=NavigationMode.PAGE
+        )
+        assert not settings._settings.contains(f"{prefix}/chapter_index")
+        assert settings._settings.contains(prefix)
+        assert settings.load_reading_position(book_path) == loaded_position
+
     def test_load_nonexistent_position(self, settings):
         """Test loading position for a book with no saved position."""
         book_path = "/path/to/nonexistent_book.epub"
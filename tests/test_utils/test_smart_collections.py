@@ -0,0 +1,135 @@
+"""Tests for the SmartCollections helper."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from ereader.models.book_metadata import BookMetadata
+from ereader.models.library_database import LibraryRepository
+from ereader.utils.smart_collections import SmartCollections
+
+
+def _book(
+    title: str, status: str, added_days_ago: int, opened_days_ago: int | None
+) -> BookMetadata:
+    """Build a book added/opened the given number of days ago."""
+    now = datetime.now()
+    return BookMetadata(
+        id=0,
+        title=title,
+        author="Author",
+        file_path=f"/path/{title}.epub",
+        cover_path=None,
+        added_date=now - timedelta(days=added_days_ago),
+        last_opened_date=(
+            now - timedelta(days=opened_days_ago) if opened_days_ago is not None else None
+        ),
+        reading_progress=0.0,
+        current_chapter_index=0,
+        scroll_position=0,
+        status=status,
+        file_size=None,
+    )
+
+
+class TestAllSmartCollections:
+    """Tests for SmartCollections.all_smart_collections."""
+
+    @pytest.fixture
+    def repo(self) -> LibraryRepository:
+        """Create an in-memory library with books in every collection."""
+        repo = LibraryRepository(":memory:")
+        for book in [
+            _book("reading-recent", "reading", 10, 1),
+            _book("reading-old", "reading", 300, 200),
+            _book("finished-recent", "finished", 50, 3),
+            _book("unread-new", "not_started", 1, None),
+            _book("unread-old", "not_started", 100, None),
+            _book("unread-opened", "not_started", 5, 2),
+        ]:
+            repo.add_book(book)
+        return repo
+
+    def test_matches_individual_queries(self, repo: LibraryRepository) -> None:
+        """Test each bucket equals the result of its own smart-collection method."""
+        collections = SmartCollections.all_smart_collections(repo)
+
+        def titles(books: list[BookMetadata]) -> list[str]:
+            return [book.title for book in books]
+
+        assert titles(collections["recent_reads"]) == titles(
+            SmartCollections.recent_reads(repo)
+        )
+        assert titles(collections["currently_reading"]) == titles(
+            SmartCollections.currently_reading(repo)
+        )
+        assert titles(collections["to_read"]) == titles(SmartCollections.to_read(repo))
+        assert titles(collections["all_books"]) == titles(SmartCollections.all_books(repo))
+        assert collections["favorites"] == []
+
+    def test_single_query(self, repo: LibraryRepository) -> None:
+        """Test all collections are built from one repository call."""
+        with (
+            patch.object(
+                repo, "get_books_with_recency", wraps=repo.get_books_with_recency
+            ) as mock_fetch,
+            patch.object(repo, "filter_books") as mock_filter,
+        ):
+            SmartCollections.all_smart_collections(repo)
+
+        mock_fetch.assert_called_once_with(30)
+        mock_filter.assert_not_called()
+
+
+class TestCaching:
+    """Tests for memoization of smart collection results."""
+
+    @pytest.fixture
+    def repo(self) -> LibraryRepository:
+        """Create an in-memory library with one unread book."""
+        repo = LibraryRepository(":memory:")
+        repo.add_book(_book("unread", "not_started", 1, None))
+        return repo
+
+    def test_repeat_call_skips_query(self, repo: LibraryRepository) -> None:
+        """Test a second call within the TTL is served from the cache."""
+        first = SmartCollections.to_read(repo)
+
+        with patch.object(repo, "filter_books") as mock_filter:
+            second = SmartCollections.to_read(repo)
+
+        mock_filter.assert_not_called()
+        assert [book.title for book in second] == [book.title for book in first]
+        assert second is not first
+
+    def test_write_invalidates(self, repo: LibraryRepository) -> None:
+        """Test adding a book makes the next call query again."""
+        SmartCollections.all_smart_collections(repo)
+
+        repo.add_book(_book("another", "not_started", 2, None))
+
+        collections = SmartCollections.all_smart_collections(repo)
+        assert len(collections["to_read"]) == 2
+
+    def test_expired_entry_is_recomputed(self, repo: LibraryRepository) -> None:
+        """Test results older than the TTL are not reused."""
+        SmartCollections.all_books(repo)
+
+        with (
+            patch("ereader.utils.smart_collections.time.monotonic", return_value=1e12),
+            patch.object(repo, "filter_books", return_value=[]) as mock_filter,
+        ):
+            assert SmartCollections.all_books(repo) == []
+
+        mock_filter.assert_called_once()
+
+    def test_invalidate_clears_cache(self, repo: LibraryRepository) -> None:
+        """Test invalidate() forces the next call to query again."""
+        SmartCollections.currently_reading(repo)
+        SmartCollections.invalidate()
+
+        with patch.object(repo, "filter_books", return_value=[]) as mock_filter:
+            SmartCollections.currently_reading(repo)
+
+        mock_filter.assert_called_once()
@@ -0,0 +1,209 @@
+"""Tests for the book card delegate."""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PyQt6.QtCore import QRect, QSize, Qt
+from PyQt6.QtGui import (
+    QColor,
+    QImage,
+    QPainter,
+    QPixmap,
+    QPixmapCache,
+    QStandardItem,
+    QStandardItemModel,
+    QTextOption,
+)
+from PyQt6.QtWidgets import QStyleOptionViewItem
+
+from ereader.models.book_metadata import BookMetadata
+from ereader.views.book_card_delegate import BookCardDelegate
+
+
+class TestPaint:
+    """Tests for BookCardDelegate.paint."""
+
+    def test_paint_reuses_fonts(self, qtbot) -> None:
+        """Test painting cards creates the shared fonts only once."""
+        book = BookMetadata(
+            id=1,
+            title="A Very Long Book Title That Needs Eliding On The Card",
+            author=None,
+            file_path="/books/a.epub",
+            cover_path=None,
+            added_date=datetime(2024, 1, 1),
+            last_opened_date=None,
+            reading_progress=42.0,
+            current_chapter_index=0,
+            scroll_position=0,
+            status="reading",
+            file_size=None,
+        )
+        model = QStandardItemModel()
+        item = QStandardItem()
+        item.setData(book, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
+
+        delegate = BookCardDelegate()
+        option = QStyleOptionViewItem()
+        option.rect = QRect(0, 0, BookCardDelegate.CARD_WIDTH, BookCardDelegate.CARD_HEIGHT)
+        canvas = QPixmap(BookCardDelegate.CARD_WIDTH, BookCardDelegate.CARD_HEIGHT)
+
+        painter = QPainter(canvas)
+        try:
+            delegate.paint(painter, option, model.index(0, 0))
+            title_font = BookCardDelegate._title_font
+            delegate.paint(painter, option, model.index(0, 0))
+        finally:
+            painter.end()
+
+        assert title_font is not None
+        assert BookCardDelegate._title_font is title_font
+
+
+    def test_layout_follows_card_position(self, qtbot) -> None:
+        """Test cards painted away from the origin are offset as a whole."""
+        book = BookMetadata(
+            id=1,
+            title="Dune",
+            author="Frank Herbert",
+            file_path="/books/dune.epub",
+            cover_path=None,
+            added_date=datetime(2024, 1, 1),
+            last_opened_date=None,
+            reading_progress=100.0,
+            current_chapter_index=0,
+            scroll_position=0,
+            status="finished",
+            file_size=None,
+        )
+        model = QStandardItemModel()
+        item = QStandardItem()
+        item.setData(book, Qt.ItemDataRole.UserRole)
+        model.appendRow(item)
+
+        option = QStyleOptionViewItem()
+        option.rect = QRect(
+            200, 300, BookCardDelegate.CARD_WIDTH, BookCardDelegate.CARD_HEIGHT
+        )
+        canvas = QImage(400, 600, QImage.Format.Format_RGB32)
+        canvas.fill(QColor(Qt.GlobalColor.white))
+
+        painter = QPainter(canvas)
+        try:
+            BookCardDelegate().paint(painter, option, model.index(0, 0))
+        finally:
+            painter.end()
+
+        # Middle of the (full) progress bar and of the cover placeholder
+        bar_y = 300 + BookCardDelegate.PROGRESS_Y_REL + BookCardDelegate.PROGRESS_BAR_HEIGHT // 2
+        assert canvas.pixelColor(290, bar_y) == BookCardDelegate._PROGRESS_COLOR
+        cover_x = 200 + BookCardDelegate.COVER_OFFSET_X + 2
+        assert canvas.pixelColor(cover_x, 300 + 20) == BookCardDelegate._TRACK_COLOR
+
+
+class TestElidedText:
+    """Tests for BookCardDelegate._elided_text."""
+
+    def test_long_text_elided_and_memoized(self, qtbot) -> None:
+        """Test long text is elided and repeated requests hit the cache."""
+        BookCardDelegate._ensure_fonts()
+        BookCardDelegate._elided_text.cache_clear()
+        text = "An Extremely Long Book Title " * 5
+
+        first = BookCardDelegate._elided_text(text, 100, title=True)
+        second = BookCardDelegate._elided_text(text, 100, title=True)
+
+        assert first == second
+        assert first.endswith("\u2026")
+        assert BookCardDelegate._elided_text.cache_info().hits == 1
+
+    def test_short_text_unchanged(self, qtbot) -> None:
+        """Test text that fits is returned as is."""
+        BookCardDelegate._ensure_fonts()
+
+        assert BookCardDelegate._elided_text("Dune", 300, title=False) == "Dune"
+
+
+class TestStaticText:
+    """Tests for BookCardDelegate._static_text."""
+
+    def test_layout_memoized(self, qtbot) -> None:
+        """Test repeated requests for the same text reuse one prepared layout."""
+        BookCardDelegate._ensure_fonts()
+        BookCardDelegate._static_text.cache_clear()
+
+        first = BookCardDelegate._static_text("Dune", 160, title=True)
+        second = BookCardDelegate._static_text("Dune", 160, title=True)
+
+        assert first is second
+        assert first.text() == "Dune"
+        assert first.textWidth() == 160
+        assert BookCardDelegate._static_text.cache_info().hits == 1
+
+    def test_title_wraps_author_does_not(self, qtbot) -> None:
+        """Test only title text is laid out with word wrapping."""
+        BookCardDelegate._ensure_fonts()
+
+        title = BookCardDelegate._static_text("Title", 160, title=True)
+        author = BookCardDelegate._static_text("Author", 160, title=False)
+
+        assert title.textOption().wrapMode() == QTextOption.WrapMode.WordWrap
+        assert author.textOption().wrapMode() == QTextOption.WrapMode.NoWrap
+
+
+class TestLoadScaledCover:
+    """Tests for BookCardDelegate._load_scaled_cover."""
+
+    @pytest.fixture
+    def cover_path(self, qtbot, tmp_path: Path) -> str:
+        """Write a 300x400 cover image and start from empty caches."""
+        QPixmapCache.clear()
+        BookCardDelegate._stat_cache.clear()
+        pixmap = QPixmap(300, 400)
+        pixmap.fill(QColor(Qt.GlobalColor.red))
+        path = tmp_path / "cover.png"
+        assert pixmap.save(str(path))
+        return str(path)
+
+    def test_cover_scaled_to_fit(self, cover_path: str) -> None:
+        """Test the cover is scaled into the size preserving aspect ratio."""
+        scaled = BookCardDelegate._load_scaled_cover(cover_path, QSize(150, 200))
+
+        assert scaled is not None
+        assert (scaled.width(), scaled.height()) == (150, 200)
+
+    def test_cover_decoded_once(self, cover_path: str) -> None:
+        """Test repeated loads reuse the cached pixmap instead of decoding again."""
+        with patch(
+            "ereader.views.book_card_delegate.QPixmap", wraps=QPixmap
+        ) as mock_pixmap:
+            first = BookCardDelegate._load_scaled_cover(cover_path, QSize(150, 200))
+            second = BookCardDelegate._load_scaled_cover(cover_path, QSize(150, 200))
+
+        assert mock_pixmap.call_count == 1
+        assert first.cacheKey() == second.cacheKey()
+
+    def test_cover_stat_cached(self, cover_path: str) -> None:
+        """Test the cover file is stat-ed once within the TTL."""
+        with patch("ereader.views.book_card_delegate.os.stat", wraps=os.stat) as mock_stat:
+            BookCardDelegate._load_scaled_cover(cover_path, QSize(150, 200))
+            BookCardDelegate._load_scaled_cover(cover_path, QSize(150, 200))
+
+        mock_stat.assert_called_once_with(cover_path)
+
+    def test_missing_cover(self, qtbot, tmp_path: Path) -> None:
+        """Test a missing cover file returns None."""
+        missing = str(tmp_path / "missing.png")
+
+        assert BookCardDelegate._load_scaled_cover(missing, QSize(150, 200)) is None
+
+    def test_unreadable_cover(self, qtbot, tmp_path: Path) -> None:
+        """Test a file that is not an image returns None."""
+        path = tmp_path / "cover.png"
+        path.write_bytes(b"not an image")
+
+        assert BookCardDelegate._load_scaled_cover(str(path), QSize(150, 200)) is None
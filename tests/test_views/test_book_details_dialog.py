@@ -0,0 +1,187 @@
+"""Tests for the book details dialog."""
+
+import dataclasses
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from PyQt6.QtCore import Qt, QThreadPool
+from PyQt6.QtWidgets import QLabel
+
+from ereader.models.book_metadata import BookMetadata
+from ereader.views.book_details_dialog import BookDetailsDialog
+
+
+class TestFormatDatetime:
+    """Tests for BookDetailsDialog._format_datetime."""
+
+    @pytest.mark.parametrize(
+        ("dt", "expected"),
+        [
+            (datetime(2025, 12, 14, 15, 42), "December 14, 2025 at 3:42 PM"),
+            (datetime(2024, 1, 5, 0, 7), "January 05, 2024 at 12:07 AM"),
+            (datetime(2024, 6, 30, 12, 0), "June 30, 2024 at 12:00 PM"),
+            (datetime(2024, 3, 9, 11, 59), "March 09, 2024 at 11:59 AM"),
+        ],
+    )
+    def test_format(self, dt: datetime, expected: str) -> None:
+        """Test dates use the full month name and a 12-hour clock."""
+        assert BookDetailsDialog._format_datetime(dt) == expected
+
+
+class TestFormatFileSize:
+    """Tests for BookDetailsDialog._format_file_size."""
+
+    @pytest.mark.parametrize(
+        ("size_bytes", "expected"),
+        [
+            (None, "Unknown"),
+            (512, "512 bytes"),
+            (156 * 1024, "156.0 KB"),
+            (int(2.4 * 1024 * 1024), "2.4 MB"),
+        ],
+    )
+    def test_format(self, size_bytes: int | None, expected: str) -> None:
+        """Test sizes are shown in bytes, KB or MB."""
+        assert BookDetailsDialog._format_file_size(size_bytes) == expected
+
+
+class TestFileCheck:
+    """Tests for the background file existence check."""
+
+    @staticmethod
+    def _book(file_path: str) -> BookMetadata:
+        return BookMetadata(
+            id=1,
+            title="Dune",
+            author="Frank Herbert",
+            file_path=file_path,
+            cover_path=None,
+            added_date=datetime(2024, 1, 1),
+            last_opened_date=None,
+            reading_progress=0.0,
+            current_chapter_index=0,
+            scroll_position=0,
+            status="not_started",
+            file_size=None,
+        )
+
+    def test_missing_file_warns(self, qtbot, tmp_path: Path) -> None:
+        """Test the warning appears once the check finds the file missing."""
+        dialog = BookDetailsDialog(self._book(str(tmp_path / "missing.epub")))
+        qtbot.addWidget(dialog)
+
+        qtbot.waitUntil(
+            lambda: dialog._sections_built and not dialog._missing_file_label.isHidden()
+        )
+
+    def test_directory_warns(self, qtbot, tmp_path: Path) -> None:
+        """Test a directory at the book's path counts as a missing file."""
+        dialog = BookDetailsDialog(self._book(str(tmp_path)))
+        qtbot.addWidget(dialog)
+
+        qtbot.waitUntil(
+            lambda: dialog._sections_built and not dialog._missing_file_label.isHidden()
+        )
+
+    def test_existing_file_no_warning(self, qtbot, tmp_path: Path) -> None:
+        """Test no warning is shown for a file that exists."""
+        book_file = tmp_path / "book.epub"
+        book_file.write_bytes(b"epub")
+        dialog = BookDetailsDialog(self._book(str(book_file)))
+        qtbot.addWidget(dialog)
+        qtbot.waitUntil(lambda: dialog._sections_built)
+
+        QThreadPool.globalInstance().waitForDone()
+        qtbot.wait(10)
+
+        assert dialog._missing_file_label.isHidden()
+
+
+    def test_late_result_for_previous_book_ignored(self, qtbot, tmp_path: Path) -> None:
+        """Test a missing-file result for a replaced book does not warn."""
+        book_file = tmp_path / "book.epub"
+        book_file.write_bytes(b"epub")
+        dialog = BookDetailsDialog(self._book(str(book_file)))
+        qtbot.addWidget(dialog)
+        qtbot.waitUntil(lambda: dialog._sections_built)
+
+        dialog._on_file_checked(str(tmp_path / "old.epub"), False)
+
+        assert dialog._missing_file_label.isHidden()
+
+
+class TestUpdateBook:
+    """Tests for reusing the dialog with BookDetailsDialog.update_book."""
+
+    def test_update_refills_widgets(self, qtbot, tmp_path: Path) -> None:
+        """Test a second book replaces every field shown for the first."""
+        first = TestFileCheck._book(str(tmp_path / "missing.epub"))
+        dialog = BookDetailsDialog(first)
+        qtbot.addWidget(dialog)
+        qtbot.waitUntil(
+            lambda: dialog._sections_built and not dialog._missing_file_label.isHidden()
+        )
+
+        book_file = tmp_path / "book.epub"
+        book_file.write_bytes(b"epub")
+        second = dataclasses.replace(
+            first,
+            title="Emma",
+            file_path=str(book_file),
+            file_size=2048,
+            reading_progress=50.0,
+            current_chapter_index=4,
+            status="reading",
+            last_opened_date=datetime(2025, 12, 14, 15, 42),
+        )
+        dialog.update_book(second)
+
+        assert "Emma" in dialog._header_label.text()
+        assert dialog._location_value.text() == str(book_file)
+        assert dialog._missing_file_label.isHidden()
+        assert dialog._size_value.text() == "2.0 KB"
+        assert dialog._progress_bar.value() == 50
+        assert dialog._chapter_value.text() == "Chapter 5"
+        assert dialog._status_value.text() == "Reading"
+        assert dialog._opened_value.text() == "December 14, 2025 at 3:42 PM"
+
+
+class TestDeferredSections:
+    """Tests for building the info sections after the header."""
+
+    def test_sections_built_from_event_loop(self, qtbot, tmp_path: Path) -> None:
+        """Test only the header exists until the event loop runs."""
+        book = TestFileCheck._book(str(tmp_path / "book.epub"))
+        dialog = BookDetailsDialog(book)
+        qtbot.addWidget(dialog)
+
+        assert not dialog._sections_built
+        assert "Dune" in dialog._header_label.text()
+
+        qtbot.waitUntil(lambda: dialog._sections_built)
+
+        assert dialog._location_value.text() == book.file_path
+        groups = [dialog._main_layout.itemAt(i).widget() for i in range(1, 4)]
+        assert [group.title() for group in groups] == [
+            "File Information",
+            "Reading Progress",
+            "Library Information",
+        ]
+
+
+class TestKvLabel:
+    """Tests for BookDetailsDialog._kv_label."""
+
+    def test_plain_text_pair(self, qtbot) -> None:
+        """Test key and value are plain-text labels with a bold key."""
+        row, value = BookDetailsDialog._kv_label("Location:", "/books/<b>odd</b>.epub")
+        qtbot.addWidget(row)
+        key_label, value_label = row.findChildren(QLabel)
+
+        assert value is value_label
+
+        assert key_label.text() == "Location:"
+        assert key_label.font().bold()
+        assert value_label.text() == "/books/<b>odd</b>.epub"
+        assert value_label.textFormat() == Qt.TextFormat.PlainText
@@ -0,0 +1,132 @@
+"""Tests for the book grid widget."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from PyQt6.QtCore import QPoint
+from PyQt6.QtGui import QContextMenuEvent
+
+from ereader.models.book_metadata import BookMetadata
+from ereader.views.book_grid_widget import BookGridWidget
+
+
+def _book(book_id: int, status: str) -> BookMetadata:
+    """Build a book with the given id and status."""
+    return BookMetadata(
+        id=book_id,
+        title=f"Book {book_id}",
+        author="Author",
+        file_path=f"/books/{book_id}.epub",
+        cover_path=None,
+        added_date=datetime(2024, 1, 1),
+        last_opened_date=None,
+        reading_progress=0.0,
+        current_chapter_index=0,
+        scroll_position=0,
+        status=status,
+        file_size=None,
+    )
+
+
+class TestContextMenu:
+    """Tests for the book context menu."""
+
+    @pytest.fixture
+    def grid(self, qtbot) -> BookGridWidget:
+        """Create a shown grid with one reading and one finished book."""
+        grid = BookGridWidget()
+        qtbot.addWidget(grid)
+        grid.resize(800, 600)
+        grid.set_books([_book(1, "reading"), _book(2, "finished")])
+        grid.show()
+        qtbot.waitExposed(grid)
+        return grid
+
+    @staticmethod
+    def _right_click(grid: BookGridWidget, row: int) -> None:
+        pos = grid.visualRect(grid.model().index(row, 0)).center()
+        grid.contextMenuEvent(
+            QContextMenuEvent(QContextMenuEvent.Reason.Mouse, pos, grid.mapToGlobal(pos))
+        )
+
+    def test_menu_reused_with_current_status_hidden(self, grid) -> None:
+        """Test one menu serves every book, hiding each book's own status."""
+        menu = grid._menu
+        visible = []
+
+        def record_visible(pos: QPoint):
+            visible.append(
+                {status for status, action in grid._status_actions.items() if action.isVisible()}
+            )
+            return None
+
+        with patch.object(menu, "exec", side_effect=record_visible):
+            self._right_click(grid, 0)
+            self._right_click(grid, 1)
+
+        assert grid._menu is menu
+        assert visible == [{"finished", "not_started"}, {"reading", "not_started"}]
+
+    def test_status_action_emits_update(self, grid, qtbot) -> None:
+        """Test choosing a status emits the update for the clicked book."""
+        with (
+            patch.object(
+                grid._menu, "exec", return_value=grid._status_actions["not_started"]
+            ),
+            qtbot.waitSignal(grid.book_status_update_requested) as blocker,
+        ):
+            self._right_click(grid, 1)
+
+        assert blocker.args == [2, "not_started"]
+
+    def test_dismissed_menu_emits_nothing(self, grid, qtbot) -> None:
+        """Test closing the menu without a choice emits no signal."""
+        with (
+            patch.object(grid._menu, "exec", return_value=None),
+            qtbot.assertNotEmitted(grid.book_activated),
+            qtbot.assertNotEmitted(grid.book_status_update_requested),
+        ):
+            self._right_click(grid, 0)
+
+
+class TestBulkUpdate:
+    """Tests for BookGridWidget.bulk_update."""
+
+    def test_applies_last_list_once(self, qtbot) -> None:
+        """Test only the final list reaches the model, when the block exits."""
+        grid = BookGridWidget()
+        qtbot.addWidget(grid)
+
+        with patch.object(grid._model, "set_books") as set_books:
+            with grid.bulk_update():
+                for count in range(1, 4):
+                    grid.set_books([_book(i, "reading") for i in range(count)])
+                set_books.assert_not_called()
+
+        set_books.assert_called_once()
+        assert [book.id for book in set_books.call_args.args[0]] == [0, 1, 2]
+
+    def test_nested_and_raising_blocks(self, qtbot) -> None:
+        """Test nested blocks apply once, on the outermost exit, even on error."""
+        grid = BookGridWidget()
+        qtbot.addWidget(grid)
+
+        with pytest.raises(RuntimeError), grid.bulk_update():
+            with grid.bulk_update():
+                grid.set_books([_book(1, "reading")])
+            assert grid.model().rowCount() == 0
+            raise RuntimeError("import failed")
+
+        assert grid.model().rowCount() == 1
+
+    def test_update_book_patches_pending_list(self, qtbot) -> None:
+        """Test a status change during a bulk update is not lost."""
+        grid = BookGridWidget()
+        qtbot.addWidget(grid)
+
+        with grid.bulk_update():
+            grid.set_books([_book(1, "reading")])
+            assert grid.update_book(_book(1, "finished")) is True
+
+        assert grid._model.get_book(grid.model().index(0, 0)).status == "finished"
@@ -0,0 +1,181 @@
+"""Tests for the book list model."""
+
+import dataclasses
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from PyQt6.QtCore import QModelIndex, Qt
+from PyQt6.QtTest import QAbstractItemModelTester
+
+from ereader.models.book_metadata import BookMetadata
+from ereader.views.book_list_model import BookListModel
+
+
+def _book(book_id: int, status: str = "not_started") -> BookMetadata:
+    """Build a book with the given id."""
+    return BookMetadata(
+        id=book_id,
+        title=f"Book {book_id}",
+        author="Author",
+        file_path=f"/books/{book_id}.epub",
+        cover_path=None,
+        added_date=datetime(2024, 1, 1),
+        last_opened_date=None,
+        reading_progress=0.0,
+        current_chapter_index=0,
+        scroll_position=0,
+        status=status,
+        file_size=None,
+    )
+
+
+class TestSetBooks:
+    """Tests for BookListModel.set_books."""
+
+    @pytest.fixture
+    def model(self, qtbot) -> BookListModel:
+        """Create a model with ten books, checked by Qt's model tester."""
+        model = BookListModel([_book(i) for i in range(10)])
+        model._tester = QAbstractItemModelTester(
+            model, QAbstractItemModelTester.FailureReportingMode.Fatal
+        )
+        return model
+
+    @staticmethod
+    def _ids(model: BookListModel) -> list[int]:
+        return [
+            model.data(model.index(row, 0), Qt.ItemDataRole.UserRole).id
+            for row in range(model.rowCount())
+        ]
+
+    def test_changed_book_emits_data_changed_only(self, model, qtbot) -> None:
+        """Test a status change updates one row without resetting the model."""
+        books = [_book(i) for i in range(10)]
+        books[4] = dataclasses.replace(books[4], status="reading")
+
+        with (
+            qtbot.assertNotEmitted(model.modelReset),
+            qtbot.assertNotEmitted(model.rowsInserted),
+            qtbot.assertNotEmitted(model.rowsRemoved),
+            qtbot.waitSignal(model.dataChanged) as blocker,
+        ):
+            model.set_books(books)
+
+        assert blocker.args[0].row() == blocker.args[1].row() == 4
+        assert model.get_book(model.index(4, 0)).status == "reading"
+
+    def test_filter_narrowing_removes_rows(self, model, qtbot) -> None:
+        """Test removing books emits row removals instead of a reset."""
+        with qtbot.assertNotEmitted(model.modelReset):
+            model.set_books([_book(i) for i in (1, 2, 3, 7, 8)])
+
+        assert self._ids(model) == [1, 2, 3, 7, 8]
+
+    def test_added_and_moved_books(self, model, qtbot) -> None:
+        """Test inserts and a moved book are applied incrementally."""
+        new_ids = [9, 0, 1, 2, 42, 3, 4, 5, 6, 7, 8, 43]
+
+        with qtbot.assertNotEmitted(model.modelReset):
+            model.set_books([_book(i) for i in new_ids])
+
+        assert self._ids(model) == new_ids
+
+    def test_resort_resets(self, model, qtbot) -> None:
+        """Test a wholesale reordering falls back to a model reset."""
+        with qtbot.waitSignal(model.modelReset):
+            model.set_books([_book(i) for i in reversed(range(10))])
+
+        assert self._ids(model) == list(reversed(range(10)))
+
+    def test_duplicate_ids_reset(self, model, qtbot) -> None:
+        """Test lists with repeated ids fall back to a model reset."""
+        with qtbot.waitSignal(model.modelReset):
+            model.set_books([_book(0), _book(0)])
+
+        assert model.rowCount() == 2
+
+
+    def test_fill_empty_model(self, qtbot) -> None:
+        """Test the first load into an empty model keeps it consistent."""
+        model = BookListModel()
+        model._tester = QAbstractItemModelTester(
+            model, QAbstractItemModelTester.FailureReportingMode.Fatal
+        )
+
+        model.set_books([_book(i) for i in range(3)])
+
+        assert model.rowCount() == 3
+        assert model.columnCount() == 1
+
+
+class TestUpdateBook:
+    """Tests for BookListModel.update_book."""
+
+    def test_updates_single_row(self, qtbot) -> None:
+        """Test updating a book refreshes only its row."""
+        model = BookListModel([_book(i) for i in range(5)])
+        updated = _book(3, status="finished")
+
+        with (
+            qtbot.assertNotEmitted(model.modelReset),
+            qtbot.waitSignal(model.dataChanged) as blocker,
+        ):
+            assert model.update_book(updated) is True
+
+        assert blocker.args[0].row() == blocker.args[1].row() == 3
+        assert model.get_book(model.index(3, 0)) is updated
+        assert model.data(model.index(3, 0), Qt.ItemDataRole.UserRole) is updated
+        assert model.flags(model.index(3, 0)) == (
+            Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemNeverHasChildren
+        )
+
+    def test_unknown_book(self, qtbot) -> None:
+        """Test updating a book that is not shown is a no-op."""
+        model = BookListModel([_book(1)])
+
+        with qtbot.assertNotEmitted(model.dataChanged):
+            assert model.update_book(_book(99)) is False
+
+    def test_rows_tracked_after_set_books(self, qtbot) -> None:
+        """Test the row lookup follows inserts and removals."""
+        model = BookListModel([_book(i) for i in range(10)])
+        model.set_books([_book(i) for i in (42, 0, 1, 2, 3, 5, 6, 7, 8, 9)])
+
+        model.update_book(_book(5, status="reading"))
+
+        assert model.get_book(model.index(5, 0)).status == "reading"
+
+
+class TestData:
+    """Tests for BookListModel.data."""
+
+    def test_roles(self, qtbot) -> None:
+        """Test each role returns the book, its title or its tooltip."""
+        book = _book(1)
+        model = BookListModel([book])
+        index = model.index(0, 0)
+
+        assert model.data(index, Qt.ItemDataRole.UserRole) is book
+        assert model.data(index, Qt.ItemDataRole.DisplayRole) == "Book 1"
+        assert model.data(index, Qt.ItemDataRole.ToolTipRole) == "Book 1 by Author"
+        assert model.data(index, Qt.ItemDataRole.DecorationRole) is None
+
+    def test_invalid_index(self, qtbot) -> None:
+        """Test invalid and out-of-range indexes return None."""
+        model = BookListModel([_book(1)])
+
+        assert model.data(QModelIndex(), Qt.ItemDataRole.UserRole) is None
+        assert model.data(model.index(5, 0), Qt.ItemDataRole.UserRole) is None
+
+    def test_tooltip_formatted_once(self, qtbot) -> None:
+        """Test repeated tooltip requests reuse the precomputed string."""
+        model = BookListModel([_book(1)])
+        index = model.index(0, 0)
+
+        with patch.object(BookMetadata, "__str__", return_value="changed"):
+            tooltips = {model.data(index, Qt.ItemDataRole.ToolTipRole) for _ in range(3)}
+
+        assert tooltips == {"Book 1 by Author"}
@@ -7,10 +7,13 @@ and the scroll_position_changed signal.
 Uses pytest-qt for Qt widget testing with qtbot fixture.
 """
 
+import dataclasses
+from unittest.mock import patch
+
 import pytest
 
 from ereader.models.theme import DARK_THEME, LIGHT_THEME, Theme
-from ereader.views.book_viewer import BookViewer
+from ereader.views.book_viewer import BookViewer, _welcome_html
 
 
 @pytest.fixture
@@ -362,6 +365,49 @@ class TestBookViewerScrollSignal:
             viewer.set_content(new_html)
 
 
+    def test_burst_of_scrolls_is_coalesced(self, qtbot, viewer_with_scrollable_content):
+        """Test rapid scroll ticks emit once at once and once at the end."""
+        viewer = viewer_with_scrollable_content
+        qtbot.wait(50)  # Let the fixture's throttle window lapse
+        emitted = []
+        viewer.scroll_position_changed.connect(emitted.append)
+
+        for position in range(10, 110, 10):
+            viewer.set_scroll_position(position)
+        qtbot.waitUntil(lambda: len(emitted) == 2, timeout=1000)
+        qtbot.wait(50)
+
+        assert len(emitted) == 2
+        assert emitted[-1] == viewer.get_scroll_percentage()
+
+    def test_small_change_still_emitted(self, qtbot, viewer_with_scrollable_content):
+        """Test a one-pixel scroll change still reports the final position."""
+        viewer = viewer_with_scrollable_content
+        qtbot.wait(50)
+        maximum = viewer._renderer.verticalScrollBar().maximum()
+        assert maximum > 1000  # One pixel is then under 0.1%
+
+        with qtbot.waitSignal(viewer.scroll_position_changed, timeout=1000):
+            viewer.set_scroll_position(500)
+        qtbot.wait(50)
+
+        with qtbot.waitSignal(viewer.scroll_position_changed, timeout=1000) as blocker:
+            viewer.set_scroll_position(501)
+        assert blocker.args == [viewer.get_scroll_percentage()]
+
+    def test_unchanged_position_not_emitted(self, qtbot, viewer_with_scrollable_content):
+        """Test re-emitting an unchanged position is suppressed."""
+        viewer = viewer_with_scrollable_content
+        qtbot.wait(50)
+
+        with qtbot.waitSignal(viewer.scroll_position_changed, timeout=1000):
+            viewer.set_scroll_position(500)
+        qtbot.wait(50)
+
+        with qtbot.assertNotEmitted(viewer.scroll_position_changed, wait=50):
+            viewer._emit_scroll_position()
+
+
 class TestBookViewerTheme:
     """Tests for BookViewer theme functionality."""
 
@@ -434,6 +480,60 @@ class TestBookViewerTheme:
         assert "padding: 40px 60px" in stylesheet
 
 
+    def test_reapplying_theme_is_noop(self, qtbot, viewer):
+        """Test applying an equal theme does not restyle the renderer."""
+        viewer.apply_theme(DARK_THEME)
+
+        with patch.object(viewer._renderer, "setStyleSheet") as set_style_sheet:
+            viewer.apply_theme(DARK_THEME)
+            viewer.apply_theme(dataclasses.replace(DARK_THEME))
+
+        set_style_sheet.assert_not_called()
+
+
+class TestBookViewerFontSize:
+    """Tests for BookViewer.set_base_font_size."""
+
+    def test_unchanged_size_skips_set_font(self, qtbot, viewer):
+        """Test setting the current size again does not reset the font."""
+        viewer.set_base_font_size(14)
+
+        with patch.object(viewer._renderer, "setFont") as set_font:
+            viewer.set_base_font_size(14)
+            set_font.assert_not_called()
+
+            viewer.set_base_font_size(16)
+            set_font.assert_called_once()
+
+
+class TestBookViewerWelcome:
+    """Tests for the welcome page shown before a book is opened."""
+
+    def test_theme_change_refreshes_welcome(self, qtbot, viewer):
+        """Test the welcome page picks up the new theme's colors."""
+        viewer.apply_theme(DARK_THEME)
+
+        assert viewer._showing_welcome
+        assert "Welcome to E-Reader" in viewer._renderer.toPlainText()
+        assert DARK_THEME.text_secondary.lower() in viewer._renderer.toHtml().lower()
+
+    def test_theme_change_keeps_book_content(self, qtbot, viewer):
+        """Test a theme change leaves book content alone."""
+        viewer.set_content("<html><body><p>Welcome to E-Reader, the novel</p></body></html>")
+
+        viewer.apply_theme(DARK_THEME)
+
+        assert not viewer._showing_welcome
+        assert viewer._renderer.toPlainText() == "Welcome to E-Reader, the novel"
+
+    def test_welcome_html_cached_per_colors(self):
+        """Test the welcome page is built once per color pair."""
+        first = _welcome_html(DARK_THEME.text, DARK_THEME.text_secondary)
+
+        assert _welcome_html(DARK_THEME.text, DARK_THEME.text_secondary) is first
+        assert DARK_THEME.text_secondary in first
+
+
 class TestBookViewerPaginationMethods:
     """Test pagination-related methods for Phase 2A."""
 